@@ -0,0 +1,56 @@
+"""
+bench_fast.py
+
+Measures the per-call cost of the checked scalar conversion functions against their unchecked
+counterparts in `rupantaran.fast`, and reports the overhead the checks add to every call.
+
+Usage:
+    python benchmarks/bench_fast.py [--number N] [--repeat R]
+"""
+
+import argparse
+import timeit
+
+from rupantaran import fast
+from rupantaran.land import cross_system, hilly, terai
+from rupantaran import weight
+
+# (name, checked call, unchecked call)
+CASES = [
+    ("terai_to_sq_meters", lambda: terai.terai_to_sq_meters(2.5, "bigha"), lambda: fast.terai_to_sq_meters(2.5, "bigha")),
+    ("sq_meters_to_terai", lambda: terai.sq_meters_to_terai(5000.0, "kattha"), lambda: fast.sq_meters_to_terai(5000.0, "kattha")),
+    ("terai_to_terai", lambda: terai.terai_to_terai(3.0, "bigha", "dhur"), lambda: fast.terai_to_terai(3.0, "bigha", "dhur")),
+    ("hilly_to_sq_meters", lambda: hilly.hilly_to_sq_meters(2.5, "ropani"), lambda: fast.hilly_to_sq_meters(2.5, "ropani")),
+    ("sq_meters_to_hilly", lambda: hilly.sq_meters_to_hilly(1000.0, "aana"), lambda: fast.sq_meters_to_hilly(1000.0, "aana")),
+    ("hilly_to_hilly", lambda: hilly.hilly_to_hilly(3.0, "ropani", "paisa"), lambda: fast.hilly_to_hilly(3.0, "ropani", "paisa")),
+    ("terai_to_hilly", lambda: cross_system.terai_to_hilly(1.5, "bigha", "ropani"), lambda: fast.terai_to_hilly(1.5, "bigha", "ropani")),
+    ("hilly_to_terai_fused", lambda: cross_system.hilly_to_terai_fused(4.0, "ropani", "kattha"), lambda: fast.hilly_to_terai_fused(4.0, "ropani", "kattha")),
+    ("weight.from_tola", lambda: weight.from_tola(5.0, "g"), lambda: fast.convert_weight(5.0, "tola", "g")),
+    ("weight.convert", lambda: weight.convert(2.0, "sher", "kg"), lambda: fast.convert_weight(2.0, "sher", "kg")),
+]
+
+
+def per_call(func, number: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--number", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = per_call(lambda: None, args.number, args.repeat)
+    print(f"{'function':34} {'checked (ns)':>13} {'fast (ns)':>10} {'removed (ns)':>13} {'speedup':>8}")
+    for name, checked, unchecked in CASES:
+        checked_ns = (per_call(checked, args.number, args.repeat) - baseline) * 1e9
+        fast_ns = (per_call(unchecked, args.number, args.repeat) - baseline) * 1e9
+        print(
+            f"{name:34} {checked_ns:13.0f} {fast_ns:10.0f} {checked_ns - fast_ns:13.0f} "
+            f"{checked_ns / fast_ns:7.2f}x"
+        )
+    print(f"\nTimes exclude the {baseline * 1e9:.0f} ns cost of calling an empty lambda.")
+
+
+if __name__ == "__main__":
+    main()
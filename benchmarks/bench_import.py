@@ -0,0 +1,95 @@
+"""
+bench_import.py
+
+Measures how long importing rupantaran takes in a fresh interpreter, using ``python -X importtime``,
+and checks it against a time budget. Each statement is run several times and the fastest run is
+kept. Every statement is also checked not to import heavy optional dependencies (NumPy, pandas):
+they must only load when an array or pandas feature is first used.
+
+Exits with status 1 if any statement exceeds the budget or imports a forbidden module, so it can
+run in CI.
+
+Usage:
+    python benchmarks/bench_import.py [--budget-ms 10] [--repeat 7]
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Statements timed in a fresh interpreter
+STATEMENTS = [
+    "import rupantaran",
+    "import rupantaran.land",
+    "import rupantaran.weight",
+    "from rupantaran.weight import from_tola",
+    "from rupantaran.land import terai, hilly, cross_system",
+    "from rupantaran.land import mixed_units",
+    "from rupantaran.land import LandArea",
+    "from rupantaran import fast",
+]
+
+FORBIDDEN = ("numpy", "pandas")
+
+
+def import_lines(code: str) -> tuple:
+    """
+    Runs `code` in a fresh interpreter with ``-X importtime``. Returns (module, cumulative
+    microseconds) for every top-level import, and the forbidden modules that were loaded.
+    """
+    check = f"import sys; print(','.join(m for m in {FORBIDDEN!r} if m in sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"{code}\n{check}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Nested imports are indented by two spaces per level
+        if not name.startswith("   "):
+            imports.append((name.strip(), int(cumulative)))
+    loaded = [m for m in completed.stdout.strip().split(",") if m]
+    return imports, loaded
+
+
+def import_time_us(statement: str, startup: set) -> tuple:
+    """
+    Returns the microseconds `statement` spends importing modules not already loaded at
+    interpreter startup, and the forbidden modules it loaded.
+    """
+    imports, loaded = import_lines(statement)
+    return sum(us for name, us in imports if name not in startup), loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--budget-ms", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    startup = {name for name, _ in import_lines("pass")[0]}
+    failures = []
+    print(f"{'statement':56} {'best (ms)':>10}  budget {args.budget_ms:.1f} ms")
+    for statement in STATEMENTS:
+        best = float("inf")
+        for _ in range(args.repeat):
+            us, loaded = import_time_us(statement, startup)
+            best = min(best, us)
+        status = "ok"
+        if loaded:
+            status = f"FAIL: imports {', '.join(loaded)}"
+            failures.append(statement)
+        elif best / 1000 > args.budget_ms:
+            status = "FAIL: over budget"
+            failures.append(statement)
+        print(f"{statement:56} {best / 1000:10.2f}  {status}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
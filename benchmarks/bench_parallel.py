@@ -0,0 +1,57 @@
+"""
+bench_parallel.py
+
+Measures how `rupantaran.parallel.bulk_convert` scales from 1 worker (converted in-process) up to
+N worker processes, for a parse-heavy land workload and an element-wise weight workload.
+
+Usage:
+    python benchmarks/bench_parallel.py [--rows N] [--max-workers W] [--chunk-size C]
+"""
+
+import argparse
+import os
+import random
+import time
+
+from rupantaran.land import batch
+from rupantaran.parallel import bulk_convert
+from rupantaran.weight import from_tola
+
+
+def make_workloads(rows: int) -> list:
+    rng = random.Random(0)
+    units = ["ropani", "aana", "paisa", "daam"]
+    expressions = [
+        " ".join(f"{rng.randint(0, 20)}.{rng.randint(0, 99)} {u}" for u in rng.sample(units, 3))
+        for _ in range(rows)
+    ]
+    tolas = [rng.uniform(0, 1000) for _ in range(rows)]
+    return [
+        ("parse hilly expressions", batch.parse_hilly_mixed_unit, expressions, (), False),
+        ("from_tola, element-wise", from_tola, tolas, ("g",), True),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    worker_counts = sorted({1, *[2**i for i in range(1, 8) if 2**i < args.max_workers], args.max_workers})
+    for name, func, values, func_args, elementwise in make_workloads(args.rows):
+        print(f"\n{name}: {args.rows:,} rows, chunk size {args.chunk_size:,}")
+        print(f"{'workers':>8}{'seconds':>10}{'rows/s':>14}{'speedup':>10}")
+        baseline = None
+        for workers in worker_counts:
+            started = time.perf_counter()
+            bulk_convert(func, values, *func_args, chunk_size=args.chunk_size, workers=workers,
+                         elementwise=elementwise)
+            seconds = time.perf_counter() - started
+            baseline = baseline or seconds
+            print(f"{workers:>8}{seconds:>10.2f}{args.rows / seconds:>14,.0f}{baseline / seconds:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
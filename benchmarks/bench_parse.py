@@ -0,0 +1,119 @@
+"""
+bench_parse.py
+
+Measures mixed-unit parse throughput (expressions/second) of the current tokenizer against the
+previous split-and-float implementation, which is kept here as the baseline. A second table shows
+the effect of the parse cache on a workload where a given share of the strings repeat.
+
+Usage:
+    python benchmarks/bench_parse.py [--count N] [--repeat R] [--repeat-share S]
+"""
+
+import argparse
+import math
+import random
+import time
+
+from rupantaran.land import mixed_units
+from rupantaran.land.hilly import hilly_to_sq_meters
+from rupantaran.land.terai import terai_to_sq_meters
+
+
+def legacy_parse(expression: str, to_sq_meters, system: str) -> float:
+    """The parser as it was before the single-pass tokenizer."""
+    parts = expression.lower().split()
+    if len(parts) % 2 != 0:
+        raise ValueError(f"{system} mixed-unit string must have pairs of (value, unit).")
+
+    total_m2 = 0.0
+    for i in range(0, len(parts), 2):
+        val_str = parts[i]
+        unit_str = parts[i + 1]
+        try:
+            val = float(val_str)
+            if val < 0:
+                raise ValueError("Input value must be non-negative.")
+        except ValueError as e:
+            if "non-negative" in str(e):
+                raise
+            raise ValueError(f"Invalid numeric value '{val_str}' in '{expression}'")
+
+        total_m2 += to_sq_meters(val, unit_str)
+    return total_m2
+
+
+def make_expressions(units: list, count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    expressions = []
+    for _ in range(count):
+        used = rng.sample(units, rng.randint(1, len(units)))
+        expressions.append(" ".join(f"{rng.randint(0, 20)} {unit}" for unit in used))
+    return expressions
+
+
+def with_repeats(expressions: list, share: float, seed: int = 0) -> list:
+    """Replaces `share` of the expressions with copies drawn from a small pool of common ones."""
+    rng = random.Random(seed)
+    common = expressions[:500]
+    return [rng.choice(common) if rng.random() < share else e for e in expressions]
+
+
+def throughput(func, expressions: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for expression in expressions:
+            func(expression)
+        best = min(best, time.perf_counter() - start)
+    return len(expressions) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--repeat-share", type=float, default=0.7)
+    args = parser.parse_args()
+
+    cases = [
+        (
+            "hilly",
+            make_expressions(["ropani", "aana", "paisa", "daam"], args.count),
+            lambda e: legacy_parse(e, hilly_to_sq_meters, "Hilly"),
+            mixed_units.parse_hilly_mixed_unit,
+        ),
+        (
+            "terai",
+            make_expressions(["bigha", "kattha", "dhur"], args.count),
+            lambda e: legacy_parse(e, terai_to_sq_meters, "Terai"),
+            mixed_units.parse_terai_mixed_unit,
+        ),
+    ]
+
+    cache_size = mixed_units.parse_cache_info().maxsize
+    mixed_units.set_parse_cache_size(0)
+
+    print(f"{'system':<8}{'before (expr/s)':>18}{'after (expr/s)':>18}{'speedup':>10}")
+    for name, expressions, before, after in cases:
+        for expression in expressions[:1000]:
+            # The old parser rounded every term to 4 decimals; allow for that.
+            assert math.isclose(before(expression), after(expression), abs_tol=1e-3), expression
+        before_rate = throughput(before, expressions, args.repeat)
+        after_rate = throughput(after, expressions, args.repeat)
+        print(f"{name:<8}{before_rate:>18,.0f}{after_rate:>18,.0f}{after_rate / before_rate:>9.2f}x")
+
+    print(f"\nparse cache, {args.repeat_share:.0%} repeated strings")
+    print(f"{'system':<8}{'no cache (expr/s)':>18}{'cache (expr/s)':>18}{'speedup':>10}")
+    for name, expressions, _, after in cases:
+        expressions = with_repeats(expressions, args.repeat_share)
+        mixed_units.set_parse_cache_size(0)
+        uncached_rate = throughput(after, expressions, args.repeat)
+        mixed_units.set_parse_cache_size(cache_size)
+        mixed_units.clear_parse_cache()
+        # One pass only, so the cache starts cold as it would in a real job
+        cached_rate = throughput(after, expressions, 1)
+        print(f"{name:<8}{uncached_rate:>18,.0f}{cached_rate:>18,.0f}{cached_rate / uncached_rate:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
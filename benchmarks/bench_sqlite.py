@@ -0,0 +1,119 @@
+"""
+bench_sqlite.py
+
+Measures conversions of a land register kept in SQLite. Each task is timed twice: inside the
+database with the SQL functions of `rupantaran.sqlite`, and the usual way, by fetching the rows
+into Python, converting them with the library and writing the results back.
+
+The tasks run on a table of --rows parcels (1,000,000 by default):
+- converting a numeric area to square meters;
+- parsing a Hilly expression into square meters;
+- totalling the expressions of each ward.
+
+Usage:
+    python benchmarks/bench_sqlite.py [--rows N] [--database PATH]
+"""
+
+import argparse
+import random
+import sqlite3
+import time
+
+from rupantaran import sqlite
+from rupantaran.land import mixed_units
+from rupantaran.land.aggregate import LandTotals
+from rupantaran.land.registry import get_factor
+
+UNITS = ("bigha", "kattha", "dhur", "ropani", "aana", "paisa", "daam")
+
+
+def build(connection, rows: int) -> None:
+    random.seed(0)
+    expressions = [
+        f"{random.randint(0, 9)} ropani {random.randint(0, 15)} aana {random.randint(0, 3)} paisa"
+        for _ in range(5_000)
+    ]
+    connection.execute("DROP TABLE IF EXISTS parcels")
+    connection.execute(
+        "CREATE TABLE parcels (id INTEGER PRIMARY KEY, ward TEXT, value REAL, unit TEXT, area TEXT, area_m2 REAL)"
+    )
+    connection.executemany(
+        "INSERT INTO parcels (ward, value, unit, area) VALUES (?, ?, ?, ?)",
+        (
+            (f"ward-{random.randint(1, 35)}", round(random.uniform(0, 20), 2), random.choice(UNITS), random.choice(expressions))
+            for _ in range(rows)
+        ),
+    )
+    connection.commit()
+
+
+def in_python_to_sqm(connection) -> None:
+    rows = connection.execute("SELECT id, value, unit FROM parcels").fetchall()
+    connection.executemany(
+        "UPDATE parcels SET area_m2 = ? WHERE id = ?",
+        ((round(value * get_factor(unit, "sq_m"), 4), row_id) for row_id, value, unit in rows),
+    )
+
+
+def in_sql_to_sqm(connection) -> None:
+    connection.execute("UPDATE parcels SET area_m2 = rp_to_sqm(value, unit)")
+
+
+def in_python_parse(connection) -> None:
+    rows = connection.execute("SELECT id, area FROM parcels").fetchall()
+    connection.executemany(
+        "UPDATE parcels SET area_m2 = ? WHERE id = ?",
+        ((mixed_units.parse_hilly_mixed_unit(area), row_id) for row_id, area in rows),
+    )
+
+
+def in_sql_parse(connection) -> None:
+    connection.execute("UPDATE parcels SET area_m2 = rp_parse_hilly(area)")
+
+
+def in_python_totals(connection) -> list:
+    totals = LandTotals()
+    totals.update(connection.execute("SELECT ward, area FROM parcels"))
+    return sorted((ward, total.sq_meters) for ward, total in totals.totals().items())
+
+
+def in_sql_totals(connection) -> list:
+    return connection.execute("SELECT ward, rp_sum_hilly(area) FROM parcels GROUP BY ward ORDER BY ward").fetchall()
+
+
+TASKS = [
+    ("value, unit -> m²", in_python_to_sqm, in_sql_to_sqm),
+    ("hilly expression -> m²", in_python_parse, in_sql_parse),
+    ("per-ward exact totals", in_python_totals, in_sql_totals),
+]
+
+
+def timed(func, connection) -> float:
+    started = time.perf_counter()
+    func(connection)
+    elapsed = time.perf_counter() - started
+    connection.rollback()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--database", default=":memory:")
+    args = parser.parse_args()
+
+    connection = sqlite3.connect(args.database)
+    sqlite.register(connection)
+    build(connection, args.rows)
+    assert in_python_totals(connection) == in_sql_totals(connection)
+
+    print(f"{args.rows:,} rows")
+    print(f"{'task':<26}{'fetch + Python':>16}{'in SQL':>12}{'speedup':>10}")
+    for name, in_python, in_sql in TASKS:
+        python_seconds = timed(in_python, connection)
+        sql_seconds = timed(in_sql, connection)
+        print(f"{name:<26}{python_seconds:>15.2f}s{sql_seconds:>11.2f}s{python_seconds / sql_seconds:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+compare.py
+
+Compares two result files written by benchmarks/suite.py and fails when any benchmark got slower
+than the allowed threshold.
+
+Usage:
+    python benchmarks/compare.py BASELINE.json CURRENT.json [--threshold 0.10]
+
+Exit status is 1 if a benchmark present in both files is slower by more than the threshold
+(0.10 = 10%), and 0 otherwise.
+"""
+
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """Returns (name, baseline seconds, current seconds, ratio, regressed) for every shared case."""
+    rows = []
+    for name in sorted(set(baseline) & set(current)):
+        before = baseline[name]["seconds"]
+        after = current[name]["seconds"]
+        ratio = after / before
+        rows.append((name, before, after, ratio, ratio > 1 + threshold))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed slowdown as a fraction (default 0.10).")
+    args = parser.parse_args()
+
+    baseline = load(args.baseline)
+    current = load(args.current)
+    rows = compare(baseline, current, args.threshold)
+
+    print(f"{'benchmark':<58}{'before (us)':>14}{'after (us)':>14}{'ratio':>8}")
+    for name, before, after, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<58}{before * 1e6:>14.2f}{after * 1e6:>14.2f}{ratio:>8.2f}{flag}")
+
+    only_before = sorted(set(baseline) - set(current))
+    only_after = sorted(set(current) - set(baseline))
+    if only_before:
+        print(f"\nMissing from current run: {', '.join(only_before)}")
+    if only_after:
+        print(f"\nNew in current run: {', '.join(only_after)}")
+
+    regressions = [row for row in rows if row[4]]
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than {args.threshold:.0%} threshold")
+        sys.exit(1)
+    print(f"\nNo regressions above {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+load_test.py
+
+Load-tests the conversion service in `rupantaran.service`: many keep-alive clients each send
+single-value requests as fast as they are answered, and the script reports the latency
+percentiles, the throughput and the mean micro-batch size the service reached.
+
+By default it starts the service in a subprocess on a free port; pass --url-port to test a
+service that is already running on 127.0.0.1.
+
+Usage:
+    python benchmarks/load_test.py [--connections C] [--requests N] [--endpoint PATH]
+                                   [--max-batch B] [--max-delay-ms MS] [--url-port P]
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+
+PAYLOADS = {
+    "/convert/land": lambda i: {"value": i % 100 + 0.5, "from": "bigha", "to": "ropani"},
+    "/convert/weight": lambda i: {"value": i % 100 + 0.5, "from": "tola", "to": "g"},
+    "/parse/hilly": lambda i: {"value": f"{i % 10} ropani {i % 16} aana"},
+    "/format/terai": lambda i: {"value": 1000.0 + i % 1000, "precision": 2},
+}
+
+
+async def request(reader, writer, method: str, path: str, body: bytes = b"") -> tuple:
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(port: int, endpoint: str, numbers, latencies: list, failures: list) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        for i in numbers:
+            body = json.dumps(PAYLOADS[endpoint](i)).encode()
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, "POST", endpoint, body)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                failures.append(status)
+    finally:
+        writer.close()
+
+
+async def run(port: int, endpoint: str, connections: int, total: int) -> dict:
+    latencies, failures = [], []
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    _, before = await request(reader, writer, "GET", "/stats")
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(client(port, endpoint, range(c, total, connections), latencies, failures) for c in range(connections))
+    )
+    elapsed = time.perf_counter() - start
+    _, after = await request(reader, writer, "GET", "/stats")
+    writer.close()
+    latencies.sort()
+    batches = after["batches"] - before["batches"]
+    return {
+        "requests": len(latencies),
+        "failures": len(failures),
+        "elapsed": elapsed,
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "mean_batch": (after["batched_values"] - before["batched_values"]) / batches if batches else 0.0,
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise SystemExit(f"The service did not start on port {port}.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--endpoint", choices=sorted(PAYLOADS), default="/convert/land")
+    parser.add_argument("--max-batch", type=int, default=1024)
+    parser.add_argument("--max-delay-ms", type=float, default=2.0)
+    parser.add_argument("--url-port", type=int, help="Port of a service already running on 127.0.0.1.")
+    args = parser.parse_args()
+
+    server = None
+    port = args.url_port
+    if port is None:
+        port = free_port()
+        server = subprocess.Popen(
+            [
+                sys.executable, "-m", "rupantaran.service", "--port", str(port),
+                "--max-batch", str(args.max_batch), "--max-delay-ms", str(args.max_delay_ms),
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+    try:
+        wait_for(port)
+        result = asyncio.run(run(port, args.endpoint, args.connections, args.requests))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(f"{args.endpoint}: {result['requests']} requests over {args.connections} connections")
+    print(f"  throughput       {result['requests'] / result['elapsed']:>10.0f} req/s")
+    print(f"  latency p50      {result['p50'] * 1e3:>10.2f} ms")
+    print(f"  latency p99      {result['p99'] * 1e3:>10.2f} ms")
+    print(f"  mean batch size  {result['mean_batch']:>10.1f}")
+    if result["failures"]:
+        print(f"  failures         {result['failures']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+suite.py
+
+Benchmark suite for the public conversion functions of rupantaran. Three groups are timed:
+
+- scalar: one call of every public function in land.terai, land.hilly, land.cross_system,
+  land.mixed_units, weight.weight, weight.registry and weight.mixed_units,
+- batch: the array functions of land.batch and weight.registry over inputs of increasing size,
+- parse: mixed-unit expression parsing, uncached, cached with repeated strings, and batched.
+
+Every public function of those modules must have a scalar case; the suite refuses to run if a new
+function is missing, so coverage cannot silently drop. Results are written as JSON and can be
+compared with benchmarks/compare.py.
+
+Usage:
+    python benchmarks/suite.py [--output results.json] [--sizes 1e3,1e4,...] [--filter TEXT]
+"""
+
+import argparse
+import inspect
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+
+from rupantaran.land import cross_system, hilly, mixed_units, terai
+from rupantaran.weight import mixed_units as weight_mixed_units
+from rupantaran.weight import registry as weight_registry
+from rupantaran.weight import weight
+
+SCALAR_MODULES = [terai, hilly, cross_system, mixed_units, weight, weight_registry, weight_mixed_units]
+
+# Arguments for one scalar call of each public function
+SCALAR_ARGS = {
+    "terai_to_sq_meters": (2.5, "bigha"),
+    "sq_meters_to_terai": (5000.0, "kattha"),
+    "terai_to_terai": (3.0, "bigha", "dhur"),
+    "hilly_to_sq_meters": (2.5, "ropani"),
+    "sq_meters_to_hilly": (5000.0, "aana"),
+    "hilly_to_hilly": (10.0, "aana", "ropani"),
+    "terai_to_hilly": (1.0, "bigha", "ropani"),
+    "hilly_to_terai": (1.0, "ropani", "kattha"),
+    "terai_to_hilly_fused": (1.0, "bigha", "ropani"),
+    "hilly_to_terai_fused": (1.0, "ropani", "kattha"),
+    "parse_terai_mixed_unit": ("1 bigha 5 kattha 10 dhur",),
+    "parse_hilly_mixed_unit": ("2 ropani 3 aana 2 paisa",),
+    "sq_meters_to_terai_mixed": (8632.08,),
+    "sq_meters_to_hilly_mixed": (1082.55,),
+    "hilly_mixed_to_terai_mixed": ("2 ropani 3 aana 2 paisa",),
+    "terai_mixed_to_hilly_mixed": ("1 bigha 5 kattha 10 dhur",),
+    "parse_terai_dash": ("1-5-10",),
+    "parse_hilly_dash": ("2-3-1-0",),
+    "sq_meters_to_terai_dash": (8632.08,),
+    "sq_meters_to_hilly_dash": (1082.55,),
+    "from_lal": (100.0, "tola"),
+    "from_tola": (5.0, "g"),
+    "from_chatak": (5.0, "kg"),
+    "from_pau": (5.0, "kg"),
+    "from_dharni": (5.0, "kg"),
+    "from_sher": (5.0, "kg"),
+    "from_kg": (5.0, "sher"),
+    "from_g": (500.0, "tola"),
+    "from_lb": (5.0, "kg"),
+    "from_oz": (5.0, "g"),
+    "get_factor": ("dharni", "kg"),
+    "convert": (5.0, "sher", "kg"),
+    "parse_weight_mixed_unit": ("2 sher 3 pau 1 chatak",),
+    "grams_to_weight_mixed": (2247.31,),
+    "weight_mixed_to_unit": ("2 sher 3 pau", "kg"),
+}
+
+# Public functions that are not conversions, or only have batch cases
+NOT_BENCHMARKED = {
+    "parse_cache_info",
+    "clear_parse_cache",
+    "set_parse_cache_size",
+    "check_consistency",
+    "convert_array",
+}
+
+DEFAULT_SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+DEFAULT_PARSE_SIZES = [10**3, 10**4, 10**5]
+
+
+def public_functions(module) -> dict:
+    return {
+        name: func
+        for name, func in inspect.getmembers(module, inspect.isfunction)
+        if not name.startswith("_") and func.__module__ == module.__name__
+    }
+
+
+def scalar_cases() -> list:
+    cases = []
+    missing = []
+    for module in SCALAR_MODULES:
+        for name, func in public_functions(module).items():
+            if name in NOT_BENCHMARKED:
+                continue
+            if name not in SCALAR_ARGS:
+                missing.append(f"{module.__name__}.{name}")
+                continue
+            args = SCALAR_ARGS[name]
+            cases.append((f"scalar/{module.__name__.split('.')[-1]}.{name}", 1, lambda f=func, a=args: f(*a)))
+    if missing:
+        sys.exit(f"No benchmark arguments for: {', '.join(missing)}. Add them to SCALAR_ARGS.")
+    return cases
+
+
+def batch_cases(sizes: list) -> list:
+    try:
+        import numpy as np
+        from rupantaran.land import batch
+    except ImportError:
+        print("NumPy not installed: skipping batch benchmarks", file=sys.stderr)
+        return []
+
+    rng = np.random.default_rng(0)
+    calls = [
+        ("terai_to_sq_meters", ("bigha",), {}),
+        ("sq_meters_to_terai", ("kattha",), {}),
+        ("terai_to_terai", ("bigha", "dhur"), {}),
+        ("hilly_to_sq_meters", ("ropani",), {}),
+        ("sq_meters_to_hilly", ("aana",), {}),
+        ("hilly_to_hilly", ("aana", "ropani"), {}),
+        ("terai_to_hilly", ("bigha", "ropani"), {}),
+        ("hilly_to_terai", ("ropani", "kattha"), {}),
+        ("sq_meters_to_terai_mixed", (), {}),
+        ("sq_meters_to_hilly_mixed", (), {}),
+        ("sq_meters_to_hilly_mixed[strings]", (), {"as_strings": True}),
+    ]
+    weight_calls = [
+        ("convert_array", ("tola", "g"), {}),
+    ]
+    from rupantaran.weight import batch as weight_batch
+    cases = []
+    for size in sizes:
+        values = rng.uniform(0, 10_000, size)
+        for name, args, kwargs in calls:
+            if kwargs.get("as_strings") and size > 10**6:
+                continue
+            func = getattr(batch, name.split("[")[0])
+            cases.append((f"batch/{name}/{size:.0e}", size, lambda f=func, a=args, k=kwargs, v=values: f(v, *a, **k)))
+        for name, args, kwargs in weight_calls:
+            func = getattr(weight_registry, name)
+            cases.append((f"batch/weight.{name}/{size:.0e}", size,
+                          lambda f=func, a=args, k=kwargs, v=values: f(v, *a, **k)))
+        out = np.empty_like(values)
+        cases.append((f"batch/weight.batch.from_tola[out]/{size:.0e}", size,
+                      lambda v=values, o=out: weight_batch.from_tola(v, "g", out=o)))
+        cases.append((f"batch/weight.batch.grams_to_weight_mixed/{size:.0e}", size,
+                      lambda v=values: weight_batch.grams_to_weight_mixed(v)))
+    return cases
+
+
+def expressions(count: int, repeat_share: float, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    units = ["ropani", "aana", "paisa", "daam"]
+    common = [
+        " ".join(f"{rng.randint(0, 20)} {u}" for u in rng.sample(units, rng.randint(1, 4)))
+        for _ in range(500)
+    ]
+    result = []
+    for _ in range(count):
+        if rng.random() < repeat_share:
+            result.append(rng.choice(common))
+        else:
+            result.append(" ".join(f"{rng.randint(0, 99)}.{rng.randint(0, 99)} {u}" for u in rng.sample(units, 3)))
+    return result
+
+
+def parse_cases(sizes: list) -> list:
+    parse = mixed_units.parse_hilly_mixed_unit
+
+    def uncached(items):
+        mixed_units.set_parse_cache_size(0)
+        try:
+            for item in items:
+                parse(item)
+        finally:
+            mixed_units.set_parse_cache_size(4096)
+
+    def cached(items):
+        mixed_units.clear_parse_cache()
+        for item in items:
+            parse(item)
+
+    rng = random.Random(0)
+    cases = []
+    for size in sizes:
+        unique = expressions(size, 0.0)
+        repeated = expressions(size, 0.7)
+        cases.append((f"parse/uncached/{size:.0e}", size, lambda e=unique: uncached(e)))
+        cases.append((f"parse/cached-70pct-repeats/{size:.0e}", size, lambda e=repeated: cached(e)))
+        try:
+            from rupantaran.land import batch
+        except ImportError:
+            continue
+        cases.append((f"parse/batch-70pct-repeats/{size:.0e}", size,
+                      lambda e=repeated: (mixed_units.clear_parse_cache(), batch.parse_hilly_mixed_unit(e))))
+        dashes = ["-".join(str(rng.randint(0, 15)) for _ in range(4)) for _ in range(size)]
+        cases.append((f"parse/dash-loop/{size:.0e}", size,
+                      lambda e=dashes: [mixed_units.parse_hilly_dash(x) for x in e]))
+        cases.append((f"parse/dash-batch/{size:.0e}", size, lambda e=dashes: batch.parse_hilly_dash(e)))
+    return cases
+
+
+def measure(func, repeat: int) -> float:
+    """Best time of one call, in seconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def metadata() -> dict:
+    try:
+        from importlib.metadata import version
+
+        rupantaran_version = version("rupantaran")
+    except Exception:
+        rupantaran_version = "unknown"
+    try:
+        import numpy
+
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        "rupantaran": rupantaran_version,
+        "python": platform.python_version(),
+        "numpy": numpy_version,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def parse_sizes(text: str) -> list:
+    return [int(float(size)) for size in text.split(",") if size]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--sizes", type=parse_sizes, default=DEFAULT_SIZES,
+                        help="Comma-separated batch sizes (default 1e3,...,1e7).")
+    parser.add_argument("--parse-sizes", type=parse_sizes, default=DEFAULT_PARSE_SIZES,
+                        help="Comma-separated parse workload sizes (default 1e3,1e4,1e5).")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this text.")
+    args = parser.parse_args()
+
+    cases = scalar_cases() + batch_cases(args.sizes) + parse_cases(args.parse_sizes)
+    cases = [case for case in cases if args.filter in case[0]]
+
+    results = {}
+    started = time.perf_counter()
+    for name, items, func in cases:
+        seconds = measure(func, args.repeat)
+        results[name] = {"seconds": seconds, "items": items, "items_per_second": items / seconds}
+        print(f"{name:<58}{seconds * 1e6:>14.2f} us{items / seconds:>16,.0f} items/s")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"meta": metadata(), "results": results}, f, indent=2)
+    print(f"\n{len(results)} benchmarks in {time.perf_counter() - started:.0f}s, written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
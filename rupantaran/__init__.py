@@ -0,0 +1,16 @@
+"""
+Rupantaran converts Nepali-specific measurements into SI or metric units.
+
+Submodules are loaded on first access, so ``import rupantaran`` imports nothing else; NumPy and
+pandas are only imported by the modules that need them, when they are used.
+"""
+
+from ._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=("cli", "fast", "land", "masked", "pandas_accessor", "parallel", "service", "sqlite", "weight"),
+)
+
+# Star imports stay free of optional dependencies
+__all__ = ["fast", "land", "weight"]
@@ -0,0 +1,7 @@
+"""Runs the ``rupantaran`` command: ``python -m rupantaran --from bigha --to ropani``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
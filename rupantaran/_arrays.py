@@ -0,0 +1,180 @@
+"""
+_arrays.py
+
+Shared helpers for the array (batch) conversion functions. NumPy is an optional dependency
+of rupantaran, so every module that works on whole columns imports it through this module
+to get a consistent error message when it is missing.
+
+Functions:
+- `as_value_array`: Validates an array-like of numbers in one pass and returns a float64 array.
+- `check_precision`: Validates a rounding precision.
+- `round_like_python`: Rounds an array element-wise exactly like the built-in `round`.
+- `decompose_units`: Splits an array of amounts into whole counts of a chain of units.
+- `max_decomposable`: The smallest amount too large for `decompose_units`.
+- `format_mixed_units`: Formats decomposed components as mixed-unit strings.
+"""
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - exercised only without NumPy
+    raise ImportError(
+        "The batch conversion functions require NumPy. "
+        "Install it with `pip install rupantaran[numpy]`."
+    ) from exc
+
+# Kinds accepted as numbers: booleans, signed and unsigned integers, floats.
+_NUMERIC_KINDS = "biuf"
+
+# 2**52: from here on every float64 is an integer, so rounding to any number of
+# decimal places returns the value unchanged.
+_INTEGRAL_LIMIT = float(2**52)
+
+# 10**n is exactly representable as a float64 only up to n = 22.
+_MAX_EXACT_POWER = 22
+
+
+def as_value_array(values, name: str = "value"):
+    """
+    Converts an array-like of numbers to a float64 NumPy array, validating all elements at once.
+
+    :param values: A NumPy array, list, tuple, ``array.array`` or any buffer-protocol object.
+    :param name: Name used in error messages ('value' or 'area').
+    :type name: str
+    :return: A float64 array (a view when no conversion is needed).
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If the input does not hold numbers.
+        - If any element is negative.
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind not in _NUMERIC_KINDS:
+        raise ValueError(f"Input {name} must be a number.")
+    arr = arr.astype(np.float64, copy=False)
+    if arr.size and arr.min() < 0:
+        raise ValueError(f"Input {name} must be non-negative.")
+    return arr
+
+
+def check_precision(precision: int) -> None:
+    """
+    Raises ``ValueError`` if `precision` is negative.
+    """
+    if precision < 0:
+        raise ValueError("Precision must be non-negative.")
+
+
+def round_like_python(arr, precision: int, out=None):
+    """
+    Rounds every element of `arr` to `precision` decimal places, returning bit-for-bit the
+    same numbers as calling the built-in ``round(x, precision)`` on each element.
+
+    ``numpy.round`` scales by ``10**precision``, rounds and scales back. The scaled product
+    is itself rounded, so values that sit within an ulp of a rounding boundary can round the
+    other way. Those few elements, and values too large to scale, are re-rounded with the
+    built-in ``round``; everything else stays vectorized.
+
+    :param arr: A float64 array.
+    :param precision: Number of decimal places (non-negative).
+    :type precision: int
+    :param out: Optional float64 array to write the result into; it may be `arr` itself.
+    :return: The rounded array.
+    :rtype: numpy.ndarray
+    """
+    if precision > _MAX_EXACT_POWER:
+        result = np.array([round(x, precision) for x in arr.ravel().tolist()], dtype=np.float64)
+        result = result.reshape(arr.shape)
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
+    # inf, NaN and values near the float limit overflow or turn invalid when scaled. They are
+    # re-rounded below as suspects, and callers mask such rows, so the warnings are only noise.
+    with np.errstate(over="ignore", invalid="ignore"):
+        scale = 10.0**precision
+        scaled = np.multiply(arr, scale)
+        # Distance of the scaled value from the nearest .5 boundary, compared with the
+        # error the multiplication may have introduced. Temporaries are reused in place.
+        frac = np.floor(scaled)
+        np.subtract(scaled, frac, out=frac)
+        frac -= 0.5
+        np.abs(frac, out=frac)
+        bound = np.spacing(scaled)
+        bound *= 2
+        suspect = frac <= bound
+        np.abs(scaled, out=frac)
+        suspect |= ~(frac < _INTEGRAL_LIMIT)
+
+        # Read the suspect inputs before `out` (which may be `arr` itself) is written.
+        idx = np.flatnonzero(suspect) if suspect.any() else None
+        if idx is not None:
+            originals = arr.ravel()[idx].tolist()
+
+        np.rint(scaled, out=scaled)
+        result = np.divide(scaled, scale, out=out)
+    if idx is not None:
+        result.put(idx, [round(x, precision) for x in originals])
+    return result
+
+
+def decompose_units(arr, unit_sizes: list, precision: int, tolerance: float = 0.0, name: str = "area") -> dict:
+    """
+    Splits `arr` into whole counts of every unit but the last, using vectorized floor-division
+    that mirrors the chained ``//`` and ``%`` of the scalar mixed-unit functions. The remainder
+    is expressed in the last unit and rounded to `precision`.
+
+    With a positive `tolerance`, a remainder within `tolerance` of a unit of the next whole count
+    is counted as that unit (``floor(r / size + tolerance)``, remainder clamped at zero) instead.
+
+    :param arr: A float64 array of amounts in the base unit (e.g., square meters, grams).
+    :param unit_sizes: List of (unit name, size in the base unit) pairs, largest unit first.
+    :type unit_sizes: list
+    :param precision: Number of decimal places for the last unit.
+    :type precision: int
+    :param tolerance: Fraction of a unit treated as a whole unit. Default is 0.
+    :type tolerance: float
+    :param name: Name used in error messages ('area' or 'value'). Default is 'area'.
+    :type name: str
+    :return: A dict of int64 arrays for every unit but the last, and a float64 array for it.
+    :rtype: dict
+
+    :raises ValueError:
+        - If any amount is infinite or NaN, which has no whole count of units.
+        - If a count of the largest unit does not fit in an int64.
+    """
+    if not np.isfinite(arr).all():
+        raise ValueError(f"Input {name} must be finite.")
+    if len(arr) and arr.max() >= max_decomposable(unit_sizes):
+        raise ValueError(f"Input {name} is too large for an int64 count.")
+    components = {}
+    remainder = arr
+    for unit, size in unit_sizes[:-1]:
+        if tolerance:
+            whole = np.floor(remainder / size + tolerance)
+            remainder = np.maximum(remainder - whole * size, 0.0)
+        else:
+            whole, remainder = np.divmod(remainder, size)
+        components[unit] = whole.astype(np.int64)
+    last_unit, last_size = unit_sizes[-1]
+    components[last_unit] = round_like_python(remainder / last_size, precision)
+    return components
+
+
+def max_decomposable(unit_sizes: list) -> float:
+    """
+    Returns the smallest amount that `decompose_units` rejects: 2**63 of the largest unit.
+    """
+    return 2.0**63 * unit_sizes[0][1]
+
+
+def format_mixed_units(components: dict, precision: int) -> list:
+    """
+    Formats the components returned by `decompose_units` as '<n> <unit> ...' strings, the last
+    unit with `precision` decimal places.
+    """
+    units = list(components)
+    template = " ".join(f"{{}} {unit}" for unit in units[:-1])
+    template += f" {{:.{precision}f}} {units[-1]}"
+    columns = [components[unit].tolist() for unit in units]
+    return [template.format(*row) for row in zip(*columns)]
@@ -0,0 +1,84 @@
+"""
+_cache.py
+
+Size-bounded least-recently-used memoization with hit, miss and eviction counters. Built on
+``functools.lru_cache`` so that a hit costs a single C-level dictionary lookup.
+
+Classes:
+- `CacheInfo`: Snapshot of a cache's counters.
+- `LRUCache`: Memoizes a pure function of hashable arguments.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from threading import Lock
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class LRUCache:
+    """
+    Memoizes `func` in a cache holding at most `maxsize` results. Call it through the `call`
+    attribute. A `maxsize` of 0 disables caching and `call` is then `func` itself.
+
+    Calls that raise are not cached. ``functools.lru_cache`` does not count evictions, so they are
+    derived as the number of results stored minus the number still held. The count is kept under
+    a lock. When several threads compute the same arguments at once, ``lru_cache`` keeps one
+    result, so it is counted once; only a miss in the instant after another thread computed the
+    same result, before ``lru_cache`` stored it, can still be counted twice.
+    """
+
+    def __init__(self, func, maxsize: int):
+        self._func = func
+        self.resize(maxsize)
+
+    def resize(self, maxsize: int) -> None:
+        """Sets the size bound. The cache is emptied and its counters are reset."""
+        if isinstance(maxsize, bool) or not isinstance(maxsize, int) or maxsize < 0:
+            raise ValueError("Cache size must be a non-negative integer.")
+        self.maxsize = maxsize
+        self._stored = 0
+        if not maxsize:
+            self._cached = None
+            self.call = self._func
+            return
+
+        func = self._func
+        lock = Lock()
+        # Arguments being computed -> [number of threads computing them, result counted yet]
+        computing = {}
+
+        def done(args, succeeded: bool) -> None:
+            with lock:
+                entry = computing[args]
+                if succeeded and not entry[1]:
+                    entry[1] = True
+                    self._stored += 1
+                entry[0] -= 1
+                if not entry[0]:
+                    del computing[args]
+
+        def store(*args):
+            with lock:
+                computing.setdefault(args, [0, False])[0] += 1
+            try:
+                result = func(*args)
+            except BaseException:
+                done(args, False)
+                raise
+            done(args, True)
+            return result
+
+        self._cached = lru_cache(maxsize=maxsize)(store)
+        self.call = self._cached
+
+    def clear(self) -> None:
+        """Removes every entry and resets the counters."""
+        self.resize(self.maxsize)
+
+    def info(self) -> CacheInfo:
+        """Returns the current counters."""
+        if self._cached is None:
+            return CacheInfo(0, 0, 0, 0, 0)
+        hits, misses, maxsize, currsize = self._cached.cache_info()
+        return CacheInfo(hits, misses, self._stored - currsize, maxsize, currsize)
@@ -0,0 +1,52 @@
+"""
+_lazy.py
+
+Module-level lazy loading (PEP 562) for the rupantaran packages. A package lists its submodules
+and the names it re-exports from them; nothing is imported until one of those names is first
+accessed, after which it is stored on the package and served without any further overhead. This
+keeps ``import rupantaran`` cheap and means optional dependencies such as NumPy and pandas are
+only imported by the submodules that need them, when they are used.
+
+Functions:
+- `attach`: Returns the ``__getattr__`` and ``__dir__`` functions of a lazily loaded package.
+"""
+
+import sys
+
+
+def attach(package: str, submodules: tuple = (), attributes: dict = None) -> tuple:
+    """
+    Builds lazy ``__getattr__`` and ``__dir__`` functions for `package`.
+
+    :param package: The package's ``__name__``.
+    :type package: str
+    :param submodules: Names of submodules to load on first access (e.g., 'batch').
+    :type submodules: tuple
+    :param attributes: Mapping of submodule name to the names it provides to the package.
+    :type attributes: dict
+    :return: The ``__getattr__`` and ``__dir__`` functions.
+    :rtype: tuple
+    """
+    attributes = attributes or {}
+    origins = {name: module for module, names in attributes.items() for name in names}
+    public = sorted(set(submodules) | set(origins))
+
+    def load(module: str):
+        # The ``import`` statement machinery, without importing ``importlib`` itself
+        __import__(module)
+        return sys.modules[module]
+
+    def __getattr__(name: str):
+        if name in origins:
+            value = getattr(load(f"{package}.{origins[name]}"), name)
+        elif name in submodules:
+            value = load(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return public
+
+    return __getattr__, __dir__
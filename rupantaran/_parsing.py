@@ -0,0 +1,207 @@
+"""
+_parsing.py
+
+Single-pass tokenizer shared by the mixed-unit expression parsers. An expression is a sequence
+of (value, unit) pairs such as '2 ropani 3 aana', '2ropani 3aana' or '1 bigha, 5 kattha'.
+Well-formed spaced expressions are tokenized with ``str.split``; everything else is matched pair
+by pair with a precompiled regular expression, and the first problem is reported once with its
+position in the string. Exceptions are never used for control flow.
+
+Positional dash notation ('2-3-1-0' for ropani-aana-paisa-daam) has no unit names: the n-th value
+is in the n-th unit of the system.
+
+Values may be written with Nepali digits ('२ रोपनी'); ``float`` reads them directly, so they cost
+nothing extra on the fast path.
+
+Classes:
+- `MixedUnitParseError`: ``ValueError`` subclass carrying the expression and error position.
+
+Functions:
+- `sum_pairs`: Tokenizes an expression and sums ``value * factor`` over its pairs.
+- `sum_positional`: Splits a dash-notation expression and sums ``value * factor`` by position.
+"""
+
+import re
+
+# One (value, unit) pair: a signed decimal number (ASCII or Nepali digits), optional whitespace,
+# a unit name (letters, or Devanagari letters and vowel signs), then optional whitespace and an
+# optional comma separator. Used to locate errors.
+_PAIR_RE = re.compile(
+    r"\s*"
+    r"(?P<value>[+-]?(?:[0-9०-९]+(?:\.[0-9०-९]*)?|\.[0-9०-९]+)(?:[eE][+-]?[0-9]+)?)"
+    r"\s*"
+    r"(?P<unit>(?:[^\W\d_]|[\u0900-\u0963\u0970-\u097f])+)"
+    r"\s*(?:,\s*)?"
+)
+
+_VALUE_START_RE = re.compile(r"\s*[+\-.0-9०-९]")
+
+
+class MixedUnitParseError(ValueError):
+    """
+    Raised when a mixed-unit expression cannot be parsed.
+
+    :ivar expression: The expression that failed to parse.
+    :ivar position: Index in `expression` where the problem starts.
+    """
+
+    def __init__(self, message: str, expression: str, position: int):
+        super().__init__(f"{message} (at position {position} in '{expression}')")
+        self.expression = expression
+        self.position = position
+
+
+def _syntax_error(expression: str, position: int, system: str) -> MixedUnitParseError:
+    message = f"{system} mixed-unit string must have pairs of (value, unit)"
+    is_value = _VALUE_START_RE.match(expression, position) is not None
+    rest = expression[position:]
+    position += len(rest) - len(rest.lstrip())
+    if is_value:
+        message += ": expected a unit after the value"
+    else:
+        message += ": expected a number"
+    return MixedUnitParseError(message, expression, position)
+
+
+def sum_pairs(expression: str, factors: dict, system: str) -> float:
+    """
+    Parses a mixed-unit expression and returns ``sum(value * factors[unit])`` over its pairs.
+
+    :param expression: The expression to parse (e.g., '2 ropani 3 aana', '2ropani, 3aana').
+    :type expression: str
+    :param factors: Mapping of lowercase unit names to the factor each value is multiplied by.
+    :type factors: dict
+    :param system: Name of the unit system, used in error messages (e.g., 'Hilly').
+    :type system: str
+    :return: The sum of all terms. An empty expression sums to 0.0.
+    :rtype: float
+
+    :raises MixedUnitParseError:
+        - If the expression is not a sequence of (value, unit) pairs.
+        - If any value is negative.
+        - If an unsupported unit is encountered.
+    """
+    # Fast path for the common, well-formed spaced form ('2 ropani 3 aana'): split into
+    # tokens and check each value token is a plain decimal number before calling float(), so
+    # no exception is ever raised or caught. Anything else (glued pairs, signs, unknown units,
+    # malformed input) goes to the regex scanner, which also reports the error position.
+    # Commas are accepted only where the scanner accepts them, so both paths agree.
+    lowered = expression.lower()
+    parts = _split_at_commas(lowered) if "," in lowered else lowered.split()
+    if parts is not None and len(parts) % 2 == 0:
+        total = 0.0
+        get = factors.get
+        tokens = iter(parts)
+        for value, unit in zip(tokens, tokens):
+            factor = get(unit)
+            if factor is None or not value.replace(".", "", 1).isdecimal():
+                break
+            total += float(value) * factor
+        else:
+            return total
+    return _scan(expression, factors, system)
+
+
+def _split_at_commas(expression: str):
+    """
+    Splits an expression on whitespace and on its commas, or returns None when a comma is
+    anywhere `_scan` would reject it. A comma may only follow a unit, once: every segment before
+    a comma must hold whole (value, unit) pairs.
+    """
+    segments = expression.split(",")
+    parts = []
+    for segment in segments[:-1]:
+        tokens = segment.split()
+        if not tokens or len(tokens) % 2:
+            return None
+        parts += tokens
+    parts += segments[-1].split()
+    return parts
+
+
+def _scan(expression: str, factors: dict, system: str) -> float:
+    """
+    Pair-by-pair version of `sum_pairs` that records where each pair starts, so the first
+    problem can be reported with its position. Also handles explicitly signed values.
+    """
+    end = len(expression.rstrip())
+    pos = 0
+    total = 0.0
+    match = _PAIR_RE.match
+    while pos < end:
+        pair = match(expression, pos)
+        if pair is None:
+            raise _syntax_error(expression, pos, system)
+        value = float(pair.group("value"))
+        if value < 0:
+            raise MixedUnitParseError(
+                "Input value must be non-negative.", expression, pair.start("value")
+            )
+        unit = pair.group("unit")
+        factor = factors.get(unit.lower())
+        if factor is None:
+            raise MixedUnitParseError(
+                f"Unsupported {system} unit: {unit}", expression, pair.start("unit")
+            )
+        total += value * factor
+        pos = pair.end()
+    return total
+
+
+def _is_plain_number(text: str) -> bool:
+    return text.replace(".", "", 1).isdecimal()
+
+
+def sum_positional(expression: str, factors: tuple, units: tuple, system: str) -> float:
+    """
+    Parses a dash-notation expression such as '2-3-1-0' and returns the sum of each value times
+    the factor of its position.
+
+    :param expression: The expression to parse. Whitespace around each value is ignored.
+    :type expression: str
+    :param factors: The factor of each position, largest unit first.
+    :type factors: tuple
+    :param units: The unit name of each position, used in error messages.
+    :type units: tuple
+    :param system: Name of the unit system, used in error messages (e.g., 'Hilly').
+    :type system: str
+    :return: The sum of all terms.
+    :rtype: float
+
+    :raises MixedUnitParseError:
+        - If the expression does not have exactly one value per unit.
+        - If any value is not a plain non-negative decimal number.
+    """
+    parts = expression.split("-")
+    if len(parts) == len(factors):
+        total = 0.0
+        for part, factor in zip(parts, factors):
+            value = part.strip()
+            if not _is_plain_number(value):
+                break
+            total += float(value) * factor
+        else:
+            return total
+    raise _positional_error(expression, parts, units, system)
+
+
+def _positional_error(expression: str, parts: list, units: tuple, system: str) -> MixedUnitParseError:
+    notation = "-".join(units)
+    stripped = expression.lstrip()
+    if stripped.startswith("-"):
+        # A leading dash can only be a minus sign.
+        position = len(expression) - len(stripped)
+        return MixedUnitParseError("Input value must be non-negative.", expression, position)
+    position = 0
+    for part in parts[: len(units)]:
+        if not _is_plain_number(part.strip()):
+            position += len(part) - len(part.lstrip())
+            return MixedUnitParseError(
+                f"{system} dash notation ({notation}) expected a number", expression, position
+            )
+        position += len(part) + 1
+    return MixedUnitParseError(
+        f"{system} dash notation must have {len(units)} values ({notation}), got {len(parts)}",
+        expression,
+        0,
+    )
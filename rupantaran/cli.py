@@ -0,0 +1,303 @@
+"""
+cli.py
+
+The ``rupantaran`` command. It reads values or mixed-unit expressions from standard input or from
+files and writes one converted result per input record to standard output, so it can sit in a
+Unix pipeline.
+
+Input is read in chunks of `--chunk-size` records. Each chunk is converted with one call of the
+vectorized kernels in `masked`, `land.batch` and `weight.batch`, and written with one write, so
+memory use does not grow with the input. With `--workers` above 1 the chunks are converted in
+worker processes by `parallel.iter_bulk_convert`, and the results are written in input order.
+
+``--from`` and ``--to`` take any land or weight unit ('bigha', 'ropani', 'sq_m', 'tola', 'kg',
+...). They also take a mixed-unit system: 'hilly', 'terai' or 'weight', for expressions such as
+'2 ropani 3 aana'. Both must measure the same quantity.
+
+Input formats (``--format``):
+- ``lines``: one value per line. One result is written per line.
+- ``csv``: the value is in `--column`, a header name or a 0-based index. The result is appended
+  to each row as a new column. Records must not contain line breaks.
+- ``jsonl``: one JSON object per line, with the value in the field `--column`. The result is added
+  to each object as the field `--output-column`.
+
+``--errors raise`` (the default) stops at the first bad record and reports its file and line.
+``--errors coerce`` writes an empty result for each bad record (null in JSONL), and copies lines
+that are not JSON objects unchanged.
+
+Requires NumPy.
+
+Examples::
+
+    seq 1 1000000 | rupantaran --from bigha --to ropani
+    rupantaran --from hilly --to sq_m --format csv --column area parcels.csv > parcels_m2.csv
+    rupantaran --from g --to weight --format jsonl --column grams --workers 4 items.jsonl
+
+Functions:
+- `main`: Command-line entry point.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from itertools import count
+
+from . import masked
+from ._arrays import np, max_decomposable
+from .land import batch as land_batch
+from .land.constants import HILLY_TO_SQ_M, TERAI_TO_SQ_M
+from .land import registry as land_registry
+from .land.aliases import canonical_unit
+from .parallel import iter_bulk_convert
+from .weight import batch as weight_batch
+from .weight import mixed_units as weight_mixed_units
+from .weight import registry as weight_registry
+
+FORMATS = ("lines", "csv", "jsonl")
+
+ERRORS = ("raise", "coerce")
+
+# Mixed-unit system -> (quantity, column parser to the base unit, formatter from the base unit,
+# the formatter's units and their sizes in the base unit)
+_MIXED = {
+    "hilly": ("land", masked.parse_hilly, land_batch.sq_meters_to_hilly_mixed, list(HILLY_TO_SQ_M.items())),
+    "terai": ("land", masked.parse_terai, land_batch.sq_meters_to_terai_mixed, list(TERAI_TO_SQ_M.items())),
+    "weight": ("weight", masked.parse_weight, weight_batch.grams_to_weight_mixed, weight_mixed_units._UNIT_GRAMS),
+}
+
+# Quantity -> (column converter, base unit)
+_QUANTITIES = {
+    "land": (masked.convert_land, "sq_m"),
+    "weight": (masked.convert_weight, "g"),
+}
+
+_NOT_A_JSON_OBJECT = "line is not a JSON object"
+
+
+def _quantity(spec: str) -> str:
+    if spec in _MIXED:
+        return _MIXED[spec][0]
+    if canonical_unit(spec) in land_registry.UNIT_INDEX:
+        return "land"
+    if spec.lower() in weight_registry.UNIT_INDEX:
+        return "weight"
+    raise ValueError(f"Unsupported unit: {spec}")
+
+
+def _parse_numbers(strings: list) -> tuple:
+    """Reads numbers from text fields; returns them as float64 with their error codes."""
+    try:
+        numbers = np.array(strings, dtype=np.float64)
+        errors = np.zeros(len(strings), dtype=np.uint8)
+    except ValueError:
+        numbers = np.empty(len(strings))
+        errors = np.zeros(len(strings), dtype=np.uint8)
+        for i, text in enumerate(strings):
+            try:
+                numbers[i] = float(text)
+            except ValueError:
+                numbers[i] = np.nan
+                errors[i] = masked.NOT_A_NUMBER if text.strip() else masked.MISSING
+    checked = masked.check_values(numbers)
+    return checked.values, np.where(errors == masked.OK, checked.errors, errors)
+
+
+def _convert_values(values: list, from_spec: str, to_spec: str, precision: int, text: bool) -> tuple:
+    """Converts a chunk of values; returns the results (None for bad rows) and the error codes."""
+    convert, base = _QUANTITIES[_quantity(from_spec)]
+    if from_spec in _MIXED:
+        numbers, errors = _MIXED[from_spec][1]([value.strip() for value in values] if text else values)
+        unit = base
+    else:
+        numbers, errors = _parse_numbers(values) if text else masked.check_values(values)
+        unit = from_spec
+
+    if to_spec in _MIXED:
+        if unit != base:
+            converted = convert(numbers, unit, base, None)
+            numbers, errors = converted.values, _first_errors(errors, converted.errors)
+        _, _, formatter, unit_sizes = _MIXED[to_spec]
+        errors = np.where((errors == masked.OK) & (numbers >= max_decomposable(unit_sizes)), masked.OVERFLOW, errors)
+        valid = errors == masked.OK
+        strings = iter(formatter(numbers[valid], precision, as_strings=True))
+        results = [next(strings) if ok else None for ok in valid.tolist()]
+    else:
+        converted = convert(numbers, unit, to_spec, precision)
+        errors = _first_errors(errors, converted.errors)
+        results = [value if ok else None for value, ok in zip(converted.values.tolist(), (errors == masked.OK).tolist())]
+    return results, errors
+
+
+def _first_errors(errors, later_errors):
+    """Keeps the error code of each row that already has one, and takes `later_errors` elsewhere."""
+    return np.where(errors == masked.OK, later_errors, errors)
+
+
+def _bad_rows(errors) -> list:
+    rows = np.flatnonzero(errors)
+    return [(row, masked.ERROR_REASONS[code]) for row, code in zip(rows.tolist(), errors[rows].tolist())]
+
+
+def _convert_chunk(lines: list, from_spec: str, to_spec: str, precision: int, layout: tuple) -> tuple:
+    """
+    Converts a chunk of input lines. Returns the output text and the (line offset in the chunk,
+    reason) of every bad record.
+    """
+    fmt, column, output_column = layout
+    if fmt == "lines":
+        results, errors = _convert_values(lines, from_spec, to_spec, precision, text=True)
+        texts = list(map(str, results))
+        bad = _bad_rows(errors)
+        for row, _ in bad:
+            texts[row] = ""
+        return "\n".join(texts) + "\n", bad
+
+    if fmt == "csv":
+        rows = list(csv.reader(lines))
+        values = [row[column] if column < len(row) else "" for row in rows]
+        results, errors = _convert_values(values, from_spec, to_spec, precision, text=True)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerows(row + ["" if result is None else result] for row, result in zip(rows, results))
+        return buffer.getvalue(), _bad_rows(errors)
+
+    records = []
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        records.append(record if isinstance(record, dict) else None)
+    values = [None if record is None else record.get(column) for record in records]
+    results, errors = _convert_values(values, from_spec, to_spec, precision, text=False)
+    out = []
+    bad = []
+    for offset, (line, record, result) in enumerate(zip(lines, records, results)):
+        if record is None:
+            bad.append((offset, _NOT_A_JSON_OBJECT))
+            out.append(line if line.endswith("\n") else line + "\n")
+            continue
+        if errors[offset] != masked.OK:
+            bad.append((offset, masked.ERROR_REASONS[int(errors[offset])]))
+        record[output_column] = result
+        out.append(json.dumps(record, ensure_ascii=False) + "\n")
+    return "".join(out), bad
+
+
+def _open_inputs(paths: list):
+    """Yields (name, text file) for each input, standard input for '-'."""
+    for path in paths or ["-"]:
+        if path == "-":
+            stdin = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+            try:
+                yield "<stdin>", stdin
+            finally:
+                # Leave sys.stdin usable: closing the wrapper would close its buffer too
+                stdin.detach()
+        else:
+            with open(path, encoding="utf-8", newline="") as file:
+                yield path, file
+
+
+def _csv_column(header: list, column: str) -> int:
+    if column is None:
+        return 0
+    if column in header:
+        return header.index(column)
+    if column.isdigit():
+        return int(column)
+    raise ValueError(f"Column not found: {column}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="rupantaran",
+        description="Convert Nepali land and weight measurements read from files or standard input.",
+    )
+    parser.add_argument("files", nargs="*", help="Input files; '-' or none reads standard input.")
+    parser.add_argument("--from", dest="from_spec", required=True, help="Input unit, or hilly, terai or weight.")
+    parser.add_argument("--to", dest="to_spec", required=True, help="Output unit, or hilly, terai or weight.")
+    parser.add_argument("--precision", type=int, default=4, help="Decimal places of the results (default 4).")
+    parser.add_argument("--format", choices=FORMATS, default="lines", help="Input format (default lines).")
+    parser.add_argument("--column", help="CSV column (name or 0-based index) or JSONL field holding the value.")
+    parser.add_argument("--output-column", help="Name of the result column or field (default: the --to value).")
+    parser.add_argument("--no-header", action="store_true", help="The CSV input has no header row.")
+    parser.add_argument("--errors", choices=ERRORS, default="raise", help="What to do with bad records.")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (default 1).")
+    parser.add_argument("--chunk-size", type=int, default=65_536, help="Records per chunk (default 65536).")
+    return parser
+
+
+def _run(args, out) -> int:
+    written_header = False
+    for name, file in _open_inputs(args.files):
+        first_line = 1
+        column = args.column if args.format == "jsonl" else 0
+        if args.format == "jsonl" and column is None:
+            column = "value"
+        if args.format == "csv":
+            header = None if args.no_header else next(csv.reader([file.readline()]), [])
+            column = int(args.column or 0) if header is None else _csv_column(header, args.column)
+            if header is not None:
+                first_line = 2
+                if not written_header:
+                    csv.writer(out, lineterminator="\n").writerow(header + [args.output_column])
+                    written_header = True
+        layout = (args.format, column, args.output_column)
+        chunks = iter_bulk_convert(
+            _convert_chunk, file, args.from_spec, args.to_spec, args.precision, layout,
+            chunk_size=args.chunk_size, workers=args.workers,
+        )
+        for start, (text, bad) in zip(count(first_line, args.chunk_size), chunks):
+            if bad and args.errors == "raise":
+                offset, reason = bad[0]
+                print(f"rupantaran: {name}:{start + offset}: {reason}", file=sys.stderr)
+                return 1
+            out.write(text)
+    out.flush()
+    return 0
+
+
+def main(argv=None) -> int:
+    """
+    Runs the ``rupantaran`` command with the arguments `argv` (default: ``sys.argv[1:]``).
+
+    :return: The exit status: 0 on success, 1 if a record or an input file could not be read.
+    :rtype: int
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    try:
+        quantities = {_quantity(args.from_spec), _quantity(args.to_spec)}
+    except ValueError as exc:
+        parser.error(str(exc))
+    if len(quantities) > 1:
+        parser.error(f"Cannot convert {args.from_spec} to {args.to_spec}: they measure different quantities.")
+    if args.precision < 0:
+        parser.error("Precision must be non-negative.")
+    if args.workers < 1:
+        parser.error("Number of workers must be positive.")
+    if args.chunk_size < 1:
+        parser.error("Chunk size must be positive.")
+    if args.output_column is None:
+        args.output_column = args.to_spec
+    if args.format == "csv" and args.no_header and args.column is not None and not args.column.isdigit():
+        parser.error("--column must be an index when the CSV input has no header.")
+
+    try:
+        return _run(args, sys.stdout)
+    except (OSError, ValueError) as exc:
+        if isinstance(exc, BrokenPipeError):
+            # The reader went away (e.g. `| head`); stop quietly like other Unix tools
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+            return 1
+        print(f"rupantaran: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
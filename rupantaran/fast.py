@@ -0,0 +1,118 @@
+"""
+fast.py
+
+Unchecked versions of the scalar conversion functions, for callers that have already validated
+their data. Each function does only the arithmetic of the function of the same name in
+`land.terai`, `land.hilly`, `land.cross_system` or `weight`, and returns exactly the same result
+for valid input.
+
+Nothing is checked: values are not tested for type or sign, precision is not tested, and units
+must already be canonical names ('bigha', 'ropani', 'daam', 'tola', 'kg', ...), lowercase, with no
+aliases. Use `land.aliases.canonical_unit` once per distinct unit to normalize names read from
+data. An unknown unit raises ``KeyError``; other bad input gives an undefined result.
+
+Functions:
+- `terai_to_sq_meters`, `sq_meters_to_terai`, `terai_to_terai`: As in `land.terai`.
+- `hilly_to_sq_meters`, `sq_meters_to_hilly`, `hilly_to_hilly`: As in `land.hilly`.
+- `terai_to_hilly`, `hilly_to_terai`, `terai_to_hilly_fused`, `hilly_to_terai_fused`: As in
+  `land.cross_system`.
+- `convert_land`: Converts between any two land units with one factor from `land.registry`.
+- `convert_weight`: As `weight.convert`, and the `weight.from_*` functions.
+"""
+
+from .land import registry as _land_registry
+from .land.constants import (
+    TERAI_TO_SQ_M,
+    HILLY_TO_SQ_M,
+    TERAI_CONVERSION_FACTORS,
+    HILLY_CONVERSION_FACTORS,
+)
+from .weight import registry as _weight_registry
+
+
+def _pair_factors(units: tuple, matrix: tuple) -> dict:
+    return {
+        (from_unit, to_unit): matrix[i][j]
+        for i, from_unit in enumerate(units)
+        for j, to_unit in enumerate(units)
+    }
+
+
+# (from unit, to unit) -> factor, so a conversion costs one dictionary lookup
+_LAND_FACTORS = _pair_factors(_land_registry.LAND_UNITS, _land_registry.FACTOR_MATRIX)
+_WEIGHT_FACTORS = _pair_factors(_weight_registry.WEIGHT_UNITS, _weight_registry.FACTOR_MATRIX)
+
+
+def terai_to_sq_meters(value: float, from_unit: str, precision: int = 4) -> float:
+    """Unchecked `land.terai.terai_to_sq_meters`."""
+    return round(value * TERAI_TO_SQ_M[from_unit], precision)
+
+
+def sq_meters_to_terai(area_m2: float, to_unit: str, precision: int = 4) -> float:
+    """Unchecked `land.terai.sq_meters_to_terai`."""
+    return round(area_m2 / TERAI_TO_SQ_M[to_unit], precision)
+
+
+def terai_to_terai(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
+    """Unchecked `land.terai.terai_to_terai`."""
+    return round(value * TERAI_CONVERSION_FACTORS[from_unit][to_unit], precision)
+
+
+def hilly_to_sq_meters(value: float, from_unit: str, precision: int = 4) -> float:
+    """Unchecked `land.hilly.hilly_to_sq_meters`."""
+    return round(value * HILLY_TO_SQ_M[from_unit], precision)
+
+
+def sq_meters_to_hilly(area_m2: float, to_unit: str, precision: int = 4) -> float:
+    """Unchecked `land.hilly.sq_meters_to_hilly`."""
+    return round(area_m2 / HILLY_TO_SQ_M[to_unit], precision)
+
+
+def hilly_to_hilly(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
+    """Unchecked `land.hilly.hilly_to_hilly`."""
+    return round(value * HILLY_CONVERSION_FACTORS[from_unit][to_unit], precision)
+
+
+def terai_to_hilly(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
+    """Unchecked `land.cross_system.terai_to_hilly`, including its intermediate roundings."""
+    area_m2 = round(value * TERAI_TO_SQ_M[from_unit], 4)
+    return round(round(area_m2 / HILLY_TO_SQ_M[to_unit], 4), precision)
+
+
+def hilly_to_terai(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
+    """Unchecked `land.cross_system.hilly_to_terai`, including its intermediate roundings."""
+    area_m2 = round(value * HILLY_TO_SQ_M[from_unit], 4)
+    return round(round(area_m2 / TERAI_TO_SQ_M[to_unit], 4), precision)
+
+
+def terai_to_hilly_fused(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
+    """Unchecked `land.cross_system.terai_to_hilly_fused`."""
+    return round(value * _LAND_FACTORS[from_unit, to_unit], precision)
+
+
+def hilly_to_terai_fused(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
+    """Unchecked `land.cross_system.hilly_to_terai_fused`."""
+    return round(value * _LAND_FACTORS[from_unit, to_unit], precision)
+
+
+def convert_land(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
+    """
+    Converts a value between any two land units ('bigha', 'ropani', 'sq_m', ...) with the factor
+    of `land.registry.get_factor`, unchecked.
+    """
+    return round(value * _LAND_FACTORS[from_unit, to_unit], precision)
+
+
+def convert_weight(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
+    """
+    Unchecked `weight.convert`. For any two different units it also equals the corresponding
+    ``weight.from_<from_unit>(value, to_unit, precision)``.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran import fast
+        print(fast.convert_weight(5, "tola", "g", 2))
+    """
+    return round(value * _WEIGHT_FACTORS[from_unit, to_unit], precision)
@@ -0,0 +1,34 @@
+# Submodules and the value types are loaded on first access, e.g.
+# from rupantaran.land import LandArea
+# only imports rupantaran.land.area. Array modules (batch, area_array, ...) import NumPy when
+# they are first used, never when rupantaran.land is imported.
+
+from .._lazy import attach
+
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=(
+        "aggregate",
+        "aliases",
+        "area",
+        "area_array",
+        "batch",
+        "constants",
+        "cross_system",
+        "fixed_point",
+        "hilly",
+        "mixed_units",
+        "registry",
+        "stream",
+        "terai",
+    ),
+    attributes={
+        "aggregate": ("LandTotals",),
+        "area": ("LandArea",),
+        "area_array": ("LandAreaArray",),
+        "mixed_units": ("MixedUnitParseError",),
+    },
+)
+
+# LandAreaArray needs NumPy, so it is not part of star imports
+__all__ = ["LandArea", "LandTotals", "MixedUnitParseError"]
@@ -0,0 +1,370 @@
+"""
+aggregate.py
+
+This module totals land areas by group, for example the holdings of each family or ward. Each row
+is a (key, expression) pair such as ('ward-4', '2 ropani 3 aana'). Every expression is parsed with
+`mixed_units` and counted as a whole number of ten-thousandths of a square meter. Every unit area
+in `constants` is a whole number of these, so rows of whole or decimal units are counted exactly,
+and a group total is a sum of Python integers. Totals therefore do not depend on the number of
+rows or on their order, no float rounding accumulates however many rows are added, and the total
+of a single row is the area `mixed_units.parse_hilly_mixed_unit` (or its Terai counterpart) gives,
+to four decimal places.
+
+Hilly and Terai rows can be mixed in one accumulator, since both are counted in the same unit.
+Totals are formatted in both systems with `mixed_units`.
+
+Rows can be added one at a time, from an iterable of pairs in a single pass (a file or a generator
+of any size), or from two arrays, which are grouped with NumPy. Partial totals computed separately,
+e.g. in several processes, are combined with `LandTotals.merge`.
+
+Classes:
+- `GroupTotal`: The total of one group, in square meters and in both mixed-unit systems.
+- `LandTotals`: Accumulates exact per-key totals of mixed-unit expressions.
+
+Functions:
+- `aggregate`: Totals an iterable of (key, expression) pairs.
+- `aggregate_arrays`: Totals parallel arrays of keys and expressions.
+
+Constants:
+- `SYSTEMS`: The land systems accepted for expressions ('hilly', 'terai').
+"""
+
+import math
+from collections import namedtuple
+
+from . import mixed_units
+
+SYSTEMS = ("hilly", "terai")
+
+GroupTotal = namedtuple("GroupTotal", ["rows", "sq_meters", "hilly", "terai"])
+GroupTotal.__doc__ = """
+Total of one group: the number of `rows` added, the area in `sq_meters` rounded to the requested
+precision, and the area as a `hilly` and a `terai` mixed-unit expression (the smallest unit to
+three decimal places).
+"""
+
+_PARSERS = {"hilly": mixed_units.parse_hilly_mixed_unit, "terai": mixed_units.parse_terai_mixed_unit}
+
+# Counts per square meter: every unit area in `constants` has at most four decimal places
+_COUNTS_PER_SQ_M = 10_000
+
+# Largest count total the NumPy grouping adds up in int64; larger inputs are summed in Python
+_INT64_LIMIT = 2**63 - 1
+
+# The one key that every NaN key is grouped under, as NaN is not equal to itself
+_NAN = float("nan")
+
+
+def _parse(expression: str, system: str) -> int:
+    count = _PARSERS[system](expression) * _COUNTS_PER_SQ_M
+    if not math.isfinite(count):
+        raise ValueError("Input expression is too large.")
+    return round(count)
+
+
+def _check_system(system: str) -> str:
+    system_lower = system.lower() if isinstance(system, str) else system
+    if system_lower not in SYSTEMS:
+        raise ValueError(f"Unsupported land system: {system}")
+    return system_lower
+
+
+def _check_precision(precision: int) -> None:
+    if not isinstance(precision, int):
+        raise ValueError("Precision must be an integer.")
+    if precision < 0:
+        raise ValueError("Precision must be non-negative.")
+
+
+def _count(expression, system: str) -> int:
+    if not isinstance(expression, str):
+        raise ValueError("Input expression must be a string.")
+    return _parse(expression, system)
+
+
+def _key(key):
+    return _NAN if isinstance(key, float) and key != key else key
+
+
+def _as_list(values) -> list:
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def _factorize(values: list, np) -> tuple:
+    """Returns the code of each value and the distinct values, in order of first appearance."""
+    index = {}
+    codes = np.array([index.setdefault(_key(value), len(index)) for value in values], dtype=np.intp)
+    return codes, list(index)
+
+
+class LandTotals:
+    """
+    Accumulates exact totals of land areas per key.
+
+    Keys can be any hashable values; NaN keys are all one group. Totals are reported in the order
+    in which their keys were first added.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land.aggregate import LandTotals
+        totals = LandTotals()
+        totals.update([("ram", "2 ropani 3 aana"), ("sita", "1 ropani"), ("ram", "8 aana")])
+        totals.add("sita", "1 bigha", system = "terai")
+        for key, total in totals.totals(precision = 2).items():
+            print(key, total.sq_meters, total.hilly, total.terai)
+    """
+
+    def __init__(self):
+        self._counts = {}
+        self._rows = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key) -> bool:
+        return _key(key) in self._rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def add(self, key, expression: str, system: str = "hilly") -> None:
+        """
+        Adds one row.
+
+        :param key: The group of the row (e.g., an owner or a ward).
+        :param expression: A mixed-unit expression (e.g., '2 ropani 3 aana').
+        :type expression: str
+        :param system: The land system of `expression`, 'hilly' or 'terai'. Default is 'hilly'.
+        :type system: str, optional
+
+        :raises ValueError:
+            - If `system` is not 'hilly' or 'terai'.
+            - If `expression` is not a string or cannot be parsed.
+        """
+        count = _count(expression, _check_system(system))
+        key = _key(key)
+        self._counts[key] = self._counts.get(key, 0) + count
+        self._rows[key] = self._rows.get(key, 0) + 1
+
+    def update(self, pairs, system: str = "hilly") -> None:
+        """
+        Adds every (key, expression) pair of an iterable, in a single pass.
+
+        :param pairs: An iterable of (key, expression) pairs, e.g. a generator over a file.
+        :param system: The land system of the expressions, 'hilly' or 'terai'. Default is 'hilly'.
+        :type system: str, optional
+
+        :raises ValueError:
+            - If `system` is not 'hilly' or 'terai'.
+            - If an expression is not a string or cannot be parsed. The message gives the row's
+              position in `pairs`; the rows before it have already been added.
+        """
+        system = _check_system(system)
+        counts = self._counts
+        rows = self._rows
+        for row, (key, expression) in enumerate(pairs):
+            try:
+                count = _count(expression, system)
+            except ValueError as exc:
+                raise ValueError(f"Row {row}: {exc}") from exc
+            key = _key(key)
+            counts[key] = counts.get(key, 0) + count
+            rows[key] = rows.get(key, 0) + 1
+
+    def update_arrays(self, keys, expressions, system: str = "hilly") -> None:
+        """
+        Adds rows given as two arrays of the same length. Keys and expressions are factorized with
+        one dictionary pass each, every distinct expression is parsed once, and the counts are
+        summed per key with NumPy in int64. Nothing is added if any expression is invalid.
+
+        :param keys: The group of each row; a NumPy array, list or tuple.
+        :param expressions: The mixed-unit expression of each row; a NumPy array, list or tuple.
+        :param system: The land system of the expressions, 'hilly' or 'terai'. Default is 'hilly'.
+        :type system: str, optional
+
+        :raises ValueError:
+            - If `system` is not 'hilly' or 'terai'.
+            - If `keys` and `expressions` differ in length.
+            - If an expression is not a string or cannot be parsed; the message gives the
+              position of its first row.
+        """
+        from .._arrays import np
+
+        system = _check_system(system)
+        keys = _as_list(keys)
+        expressions = _as_list(expressions)
+        if len(expressions) != len(keys):
+            raise ValueError(f"Expected {len(keys)} expressions, got {len(expressions)}.")
+        expression_codes, distinct = _factorize(expressions, np)
+        key_codes, key_list = _factorize(keys, np)
+
+        # Distinct expressions come in order of first appearance: an error names the earliest bad row
+        parsed = []
+        for code, expression in enumerate(distinct):
+            try:
+                parsed.append(_count(expression, system))
+            except ValueError as exc:
+                row = int(np.flatnonzero(expression_codes == code)[0])
+                raise ValueError(f"Row {row}: {exc}") from exc
+
+        if max(parsed, default=0) * len(expressions) <= _INT64_LIMIT:
+            sums = np.zeros(len(key_list), dtype=np.int64)
+            np.add.at(sums, key_codes, np.array(parsed, dtype=np.int64)[expression_codes])
+            sums = sums.tolist()
+        else:
+            sums = [0] * len(key_list)
+            for key_code, expression_code in zip(key_codes.tolist(), expression_codes.tolist()):
+                sums[key_code] += parsed[expression_code]
+        group_rows = np.bincount(key_codes, minlength=len(key_list)).tolist()
+
+        counts = self._counts
+        rows = self._rows
+        for key, count, row_count in zip(key_list, sums, group_rows):
+            counts[key] = counts.get(key, 0) + count
+            rows[key] = rows.get(key, 0) + row_count
+
+    def merge(self, other: "LandTotals") -> None:
+        """
+        Adds the totals of another accumulator to this one, e.g. partial totals computed in other
+        processes.
+
+        :param other: The totals to add.
+        :type other: LandTotals
+        """
+        counts = self._counts
+        for key, count in other._counts.items():
+            counts[key] = counts.get(key, 0) + count
+        rows = self._rows
+        for key, row_count in other._rows.items():
+            rows[key] = rows.get(key, 0) + row_count
+
+    def counts(self, key) -> int:
+        """
+        Returns the exact total of a group as a count of ten-thousandths of a square meter.
+
+        :param key: The group.
+        :return: The total of the Hilly and Terai rows of the group, in units of 0.0001 m².
+        :rtype: int
+
+        :raises KeyError:
+            - If no row with `key` was added.
+        """
+        key = _key(key)
+        if key not in self._rows:
+            raise KeyError(key)
+        return self._counts[key]
+
+    def total(self, key, precision: int = 4) -> GroupTotal:
+        """
+        Returns the total of one group in square meters and in both mixed-unit systems.
+
+        :param key: The group.
+        :param precision: Number of decimal places of the square meter total (must be
+            non-negative). Default is 4.
+        :type precision: int, optional
+        :return: The total of the group.
+        :rtype: GroupTotal
+
+        :raises KeyError:
+            - If no row with `key` was added.
+        :raises ValueError:
+            - If `precision` is not a non-negative integer.
+        """
+        _check_precision(precision)
+        return self._total(_key(key), precision)
+
+    def _total(self, key, precision: int) -> GroupTotal:
+        area_m2 = self.counts(key) / _COUNTS_PER_SQ_M
+        return GroupTotal(
+            self._rows[key],
+            round(area_m2, precision),
+            mixed_units.sq_meters_to_hilly_mixed(area_m2, 3),
+            mixed_units.sq_meters_to_terai_mixed(area_m2, 3),
+        )
+
+    def totals(self, precision: int = 4) -> dict:
+        """
+        Returns the total of every group.
+
+        :param precision: Number of decimal places of the square meter totals (must be
+            non-negative). Default is 4.
+        :type precision: int, optional
+        :return: Dictionary mapping each key to its `GroupTotal`, in the order keys were first added.
+        :rtype: dict
+
+        :raises ValueError:
+            - If `precision` is not a non-negative integer.
+        """
+        _check_precision(precision)
+        return {key: self._total(key, precision) for key in self._rows}
+
+
+def aggregate(pairs, system: str = "hilly", precision: int = 4) -> dict:
+    """
+    Totals an iterable of (key, expression) pairs per key, exactly and in a single pass.
+
+    :param pairs: An iterable of (key, expression) pairs, e.g. a generator over a file.
+    :param system: The land system of the expressions, 'hilly' or 'terai'. Default is 'hilly'.
+    :type system: str, optional
+    :param precision: Number of decimal places of the square meter totals (must be non-negative).
+        Default is 4.
+    :type precision: int, optional
+    :return: Dictionary mapping each key to its `GroupTotal`, in the order keys first appear.
+    :rtype: dict
+
+    :raises ValueError:
+        - If `system` is not 'hilly' or 'terai', or `precision` is not a non-negative integer.
+        - If an expression is not a string or cannot be parsed; the message gives its row.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        import csv
+        from rupantaran.land import aggregate
+
+        with open("holdings.csv", newline = "") as file:
+            rows = ((row["ward"], row["area"]) for row in csv.DictReader(file))
+            for ward, total in aggregate.aggregate(rows, precision = 2).items():
+                print(ward, total.rows, total.sq_meters, total.hilly)
+    """
+    _check_precision(precision)
+    totals = LandTotals()
+    totals.update(pairs, system)
+    return totals.totals(precision)
+
+
+def aggregate_arrays(keys, expressions, system: str = "hilly", precision: int = 4) -> dict:
+    """
+    Totals parallel arrays of keys and expressions per key, exactly. Each distinct expression is
+    parsed once and the grouping is done with NumPy.
+
+    :param keys: The group of each row; a NumPy array, list or tuple.
+    :param expressions: The mixed-unit expression of each row; a NumPy array, list or tuple.
+    :param system: The land system of the expressions, 'hilly' or 'terai'. Default is 'hilly'.
+    :type system: str, optional
+    :param precision: Number of decimal places of the square meter totals (must be non-negative).
+        Default is 4.
+    :type precision: int, optional
+    :return: Dictionary mapping each key to its `GroupTotal`, in the order keys first appear.
+    :rtype: dict
+
+    :raises ValueError:
+        - If `system` is not 'hilly' or 'terai', or `precision` is not a non-negative integer.
+        - If `keys` and `expressions` differ in length.
+        - If an expression is not a string or cannot be parsed; the message gives its first row.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import aggregate
+        totals = aggregate.aggregate_arrays(df["ward"].to_numpy(), df["area"].to_numpy(), system = "terai")
+        print(totals)
+    """
+    _check_precision(precision)
+    totals = LandTotals()
+    totals.update_arrays(keys, expressions, system)
+    return totals.totals(precision)
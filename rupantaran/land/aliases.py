@@ -0,0 +1,111 @@
+"""
+aliases.py
+
+This module resolves the many ways land units are written in records (Devanagari names, plurals,
+alternate spellings such as 'dam' for 'daam') to the canonical unit names used as keys of
+`TERAI_TO_SQ_M` and `HILLY_TO_SQ_M`, and translates Nepali digits (०-९) to ASCII digits.
+
+All variants are compiled into one dictionary at import, so resolving a unit name costs a single
+dictionary lookup. The unit-aware functions of `terai`, `hilly`, `cross_system`, `batch`,
+`registry`, `fixed_point` and `stream` accept any alias, and the mixed-unit parsers look tokens up
+in factor tables keyed on every alias.
+
+Functions:
+- `canonical_unit`: Returns the canonical name of a land unit alias.
+- `translate_digits`: Replaces Nepali digits in a string with ASCII digits.
+- `alias_factors`: Expands a unit -> factor table to every alias of its units.
+
+Constants:
+- `LAND_UNIT_ALIASES`: Dictionary mapping each canonical land unit name to its other spellings.
+- `ALIAS_INDEX`: Dictionary mapping every lowercase alias (canonical names included) to its canonical name.
+- `NEPALI_DIGITS`: ``str.translate`` table mapping Nepali digits to ASCII digits.
+"""
+
+LAND_UNIT_ALIASES = {
+    # Terai
+    "bigha": ("बिघा", "बिगाहा"),
+    "kattha": ("katha", "कट्ठा", "कठ्ठा", "कट्टा"),
+    "dhur": ("dhoor", "धुर"),
+    # Hilly
+    "ropani": ("ropni", "रोपनी", "रोपानी"),
+    "aana": ("ana", "anna", "आना"),
+    "paisa": ("paisaa", "पैसा"),
+    "daam": ("dam", "दाम"),
+    # Square meters
+    "sq_m": ("m2", "sqm", "sq_meter", "sq_meters", "square_meter", "square_meters", "वर्गमिटर"),
+}
+
+NEPALI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+
+
+def _build_alias_index() -> dict:
+    index = {}
+    for canonical, variants in LAND_UNIT_ALIASES.items():
+        for name in (canonical, *variants):
+            names = [name]
+            if name.isascii() and not name.endswith("s"):
+                names.append(name + "s")  # English plural: 'ropanis', 'dhurs'
+            for alias in names:
+                if index.get(alias, canonical) != canonical:
+                    raise ValueError(f"Land unit alias '{alias}' is ambiguous.")
+                index[alias] = canonical
+    return index
+
+
+ALIAS_INDEX = _build_alias_index()
+
+
+def canonical_unit(name: str) -> str:
+    """
+    Returns the canonical name of a land unit alias.
+
+    Names are matched case-insensitively. A name that is not a known alias is returned lowercased
+    and unchanged, so callers can keep reporting it as an unsupported unit.
+
+    :param name: A land unit name (e.g., 'Ropanis', 'रोपनी', 'dam').
+    :type name: str
+    :return: The canonical unit name (e.g., 'ropani', 'daam'), or the lowercased input.
+    :rtype: str
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import aliases
+        print(aliases.canonical_unit("रोपनी"), aliases.canonical_unit("dams"))
+    """
+    lower = name.lower()
+    return ALIAS_INDEX.get(lower, lower)
+
+
+def translate_digits(text: str) -> str:
+    """
+    Replaces Nepali digits (०-९) in `text` with ASCII digits (0-9).
+
+    :param text: Any string.
+    :type text: str
+    :return: The string with Nepali digits translated. ASCII input is returned unchanged.
+    :rtype: str
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import aliases
+        print(aliases.translate_digits("२ रोपनी ३ आना"))
+    """
+    if text.isascii():
+        return text
+    return text.translate(NEPALI_DIGITS)
+
+
+def alias_factors(table: dict) -> dict:
+    """
+    Expands a table keyed on canonical unit names to every alias of those units.
+
+    :param table: Mapping of canonical unit names to values (e.g., `HILLY_TO_SQ_M`).
+    :type table: dict
+    :return: Mapping of every lowercase alias of the table's units to the same values.
+    :rtype: dict
+    """
+    return {alias: table[canonical] for alias, canonical in ALIAS_INDEX.items() if canonical in table}
@@ -0,0 +1,305 @@
+"""
+area.py
+
+This module provides `LandArea`, an immutable land area value. An area is validated once when it
+is created and stored as square meters; after that, adding, subtracting, scaling and comparing
+areas is plain float arithmetic with no string parsing or re-validation. Mixed-unit renderings
+are computed on first use and kept on the instance.
+
+Classes:
+- `LandArea`: An immutable, non-negative land area stored in square meters.
+"""
+
+import math
+
+from . import mixed_units
+from .registry import SQ_M, get_factor
+
+# Rendering style -> formatter of square meters
+_RENDERERS = {
+    "hilly": mixed_units.sq_meters_to_hilly_mixed,
+    "terai": mixed_units.sq_meters_to_terai_mixed,
+    "hilly_dash": mixed_units.sq_meters_to_hilly_dash,
+    "terai_dash": mixed_units.sq_meters_to_terai_dash,
+}
+
+
+def _check_area(area_m2) -> float:
+    if not isinstance(area_m2, (int, float)) or isinstance(area_m2, bool):
+        raise ValueError("Input area must be a number.")
+    if area_m2 < 0:
+        raise ValueError("Input area must be non-negative.")
+    if not math.isfinite(area_m2):
+        raise ValueError("Input area must be finite.")
+    return float(area_m2)
+
+
+class LandArea:
+    """
+    An immutable, non-negative land area, stored in square meters.
+
+    Create areas with the constructor (square meters) or with `from_unit`, `parse_hilly` and
+    `parse_terai`. Areas support ``+``, ``-``, multiplication and division by a number,
+    comparisons, hashing and ``sum()``. Results of arithmetic are never negative or infinite; a
+    subtraction that would go below zero, or a result too large for a float, raises ``ValueError``.
+    Arithmetic on a subclass returns that subclass.
+
+    :param area_m2: The area in square meters (must be non-negative and finite).
+    :type area_m2: float
+
+    :raises ValueError:
+        - If `area_m2` is negative, infinite, NaN or not a number.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land.area import LandArea
+        parcels = [LandArea.parse_hilly("2 ropani 3 aana"), LandArea.from_unit(5, "kattha")]
+        total = sum(parcels)
+        print(total.to_hilly_mixed(precision = 2), total.to("aana"))
+    """
+
+    __slots__ = ("_sq_m", "_renderings")
+
+    def __init__(self, area_m2: float):
+        _set_sq_m(self, _check_area(area_m2))
+        _set_renderings(self, None)
+
+    @classmethod
+    def from_unit(cls, value: float, unit: str) -> "LandArea":
+        """
+        Creates an area from a value in any land unit.
+
+        :param value: The numeric amount (must be non-negative).
+        :type value: float
+        :param unit: The land unit of `value` (e.g., 'bigha', 'ropani', 'रोपनी', 'sq_m').
+        :type unit: str
+        :return: The area.
+        :rtype: LandArea
+
+        :raises ValueError:
+            - If `value` is negative or not a number.
+            - If `unit` is not a recognized land unit.
+        """
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            raise ValueError("Input value must be a number.")
+        if value < 0:
+            raise ValueError("Input value must be non-negative.")
+        return cls(value * get_factor(unit, SQ_M))
+
+    @classmethod
+    def parse_hilly(cls, expression: str) -> "LandArea":
+        """
+        Creates an area from a Hilly mixed-unit expression (e.g., '2 ropani 3 aana').
+
+        :param expression: The expression, as accepted by `mixed_units.parse_hilly_mixed_unit`.
+        :type expression: str
+        :return: The area.
+        :rtype: LandArea
+
+        :raises ValueError:
+            - If the expression cannot be parsed.
+        """
+        return cls(mixed_units.parse_hilly_mixed_unit(expression))
+
+    @classmethod
+    def parse_terai(cls, expression: str) -> "LandArea":
+        """
+        Creates an area from a Terai mixed-unit expression (e.g., '1 bigha 5 kattha').
+
+        :param expression: The expression, as accepted by `mixed_units.parse_terai_mixed_unit`.
+        :type expression: str
+        :return: The area.
+        :rtype: LandArea
+
+        :raises ValueError:
+            - If the expression cannot be parsed.
+        """
+        return cls(mixed_units.parse_terai_mixed_unit(expression))
+
+    @property
+    def sq_meters(self) -> float:
+        """The area in square meters."""
+        return self._sq_m
+
+    def to(self, unit: str, precision: int = None) -> float:
+        """
+        Returns the area in a single land unit.
+
+        :param unit: The target land unit (e.g., 'bigha', 'aana', 'sq_m').
+        :type unit: str
+        :param precision: Number of decimal places to round to. Default is no rounding.
+        :type precision: int, optional
+        :return: The area in `unit`.
+        :rtype: float
+
+        :raises ValueError:
+            - If `unit` is not a recognized land unit.
+            - If `precision` is negative.
+        """
+        value = self._sq_m * get_factor(SQ_M, unit)
+        if precision is None:
+            return value
+        if precision < 0:
+            raise ValueError("Precision must be non-negative.")
+        return round(value, precision)
+
+    def _render(self, style: str, precision: int) -> str:
+        renderings = self._renderings
+        if renderings is None:
+            renderings = {}
+            _set_renderings(self, renderings)
+        key = (style, precision)
+        text = renderings.get(key)
+        if text is None:
+            text = renderings[key] = _RENDERERS[style](self._sq_m, precision)
+        return text
+
+    def to_hilly_mixed(self, precision: int = 4) -> str:
+        """
+        Returns the area as a Hilly mixed-unit expression, as `mixed_units.sq_meters_to_hilly_mixed`
+        formats it. The string is computed once per precision and then reused.
+
+        :param precision: Number of decimal places for daam rounding (must be non-negative). Default is 4.
+        :type precision: int, optional
+        :return: The Hilly mixed-unit expression.
+        :rtype: str
+
+        :raises ValueError:
+            - If `precision` is negative.
+        """
+        return self._render("hilly", precision)
+
+    def to_terai_mixed(self, precision: int = 4) -> str:
+        """
+        Returns the area as a Terai mixed-unit expression, as `mixed_units.sq_meters_to_terai_mixed`
+        formats it. The string is computed once per precision and then reused.
+
+        :param precision: Number of decimal places for dhur rounding (must be non-negative). Default is 4.
+        :type precision: int, optional
+        :return: The Terai mixed-unit expression.
+        :rtype: str
+
+        :raises ValueError:
+            - If `precision` is negative.
+        """
+        return self._render("terai", precision)
+
+    def to_hilly_dash(self, precision: int = 4) -> str:
+        """
+        Returns the area in Hilly dash notation ('R-A-P-D'), computed once per precision.
+
+        :param precision: Maximum number of decimal places of the daam (must be non-negative). Default is 4.
+        :type precision: int, optional
+        :return: The Hilly dash notation.
+        :rtype: str
+        """
+        return self._render("hilly_dash", precision)
+
+    def to_terai_dash(self, precision: int = 4) -> str:
+        """
+        Returns the area in Terai dash notation ('B-K-D'), computed once per precision.
+
+        :param precision: Maximum number of decimal places of the dhur (must be non-negative). Default is 4.
+        :type precision: int, optional
+        :return: The Terai dash notation.
+        :rtype: str
+        """
+        return self._render("terai_dash", precision)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LandArea is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("LandArea is immutable.")
+
+    def __reduce__(self):
+        return (type(self), (self._sq_m,))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._sq_m!r})"
+
+    def __float__(self) -> float:
+        return self._sq_m
+
+    def __bool__(self) -> bool:
+        return self._sq_m != 0.0
+
+    def __hash__(self) -> int:
+        return hash(self._sq_m)
+
+    def __eq__(self, other):
+        if isinstance(other, LandArea):
+            return self._sq_m == other._sq_m
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, LandArea):
+            return self._sq_m < other._sq_m
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, LandArea):
+            return self._sq_m <= other._sq_m
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, LandArea):
+            return self._sq_m > other._sq_m
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, LandArea):
+            return self._sq_m >= other._sq_m
+        return NotImplemented
+
+    def __add__(self, other):
+        if isinstance(other, LandArea):
+            total = self._sq_m + other._sq_m
+            if not math.isfinite(total):
+                raise ValueError("Resulting area must be finite.")
+            return _trusted(type(self), total)
+        return NotImplemented
+
+    def __radd__(self, other):
+        # sum() starts from the integer 0
+        if other == 0 and isinstance(other, int):
+            return self
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, LandArea):
+            difference = self._sq_m - other._sq_m
+            if difference < 0:
+                raise ValueError("Resulting area must be non-negative.")
+            return _trusted(type(self), difference)
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)) and not isinstance(other, bool):
+            return type(self)(self._sq_m * other)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, LandArea):
+            return self._sq_m / other._sq_m
+        if isinstance(other, (int, float)) and not isinstance(other, bool):
+            return type(self)(self._sq_m / other)
+        return NotImplemented
+
+
+# Slot descriptors, used to fill new instances without going through __setattr__
+_set_sq_m = LandArea._sq_m.__set__
+_set_renderings = LandArea._renderings.__set__
+_new = object.__new__
+
+
+def _trusted(cls, area_m2: float) -> LandArea:
+    """Creates an area from square meters that are already known to be valid."""
+    area = _new(cls)
+    _set_sq_m(area, area_m2)
+    _set_renderings(area, None)
+    return area
@@ -0,0 +1,447 @@
+"""
+area_array.py
+
+This module provides `LandAreaArray`, the collection counterpart of `LandArea`: a whole register
+of land areas held in one contiguous float64 buffer of square meters. The buffer is validated
+once when the array is created. Conversions, mixed-unit decompositions, arithmetic and reductions
+then run as single vectorized NumPy operations, and each area takes 8 bytes instead of a Python
+float object or string.
+
+NumPy is required for this module (``pip install rupantaran[numpy]``).
+
+Classes:
+- `LandAreaArray`: An immutable one-dimensional array of non-negative land areas in square meters.
+
+Constants:
+- `SYSTEMS`: The land systems accepted by the `system` arguments ('hilly', 'terai').
+"""
+
+from .._arrays import (
+    np,
+    as_value_array,
+    check_precision,
+    round_like_python,
+    decompose_units,
+    format_mixed_units,
+)
+from . import batch, fixed_point
+from .area import LandArea, _trusted as _trusted_area
+from .constants import TERAI_TO_SQ_M, HILLY_TO_SQ_M
+from .registry import SQ_M, get_factor
+
+SYSTEMS = ("hilly", "terai")
+
+# System -> (unit -> square meters table, name used in error messages)
+_TABLES = {"hilly": (HILLY_TO_SQ_M, "Hilly"), "terai": (TERAI_TO_SQ_M, "Terai")}
+
+_FROM_FIXED = {"hilly": fixed_point.hilly_fixed_to_sq_meters, "terai": fixed_point.terai_fixed_to_sq_meters}
+_TO_FIXED = {"hilly": fixed_point.sq_meters_to_hilly_fixed, "terai": fixed_point.sq_meters_to_terai_fixed}
+
+
+def _check_system(system: str) -> str:
+    system_lower = system.lower() if isinstance(system, str) else system
+    if system_lower not in _TABLES:
+        raise ValueError(f"Unsupported land system: {system}")
+    return system_lower
+
+
+def _check_areas(values):
+    arr = as_value_array(values, "area")
+    if arr.ndim != 1:
+        raise ValueError("Input area must be one-dimensional.")
+    if not np.isfinite(arr).all():
+        raise ValueError("Input area must be finite.")
+    return arr
+
+
+def _trusted(arr) -> "LandAreaArray":
+    """Wraps a float64 array of square meters that is already known to be valid."""
+    areas = object.__new__(LandAreaArray)
+    arr = arr.view()
+    arr.flags.writeable = False
+    _set_sq_m(areas, arr)
+    return areas
+
+
+def _finite_total(total):
+    """Returns `total`, an area or array of areas from a sum, if it did not overflow to infinity."""
+    if not np.isfinite(total).all():
+        raise ValueError("Resulting area must be finite.")
+    return total
+
+
+def _operand(other):
+    """Returns the square meters of an area operand, or None if `other` is not an area."""
+    if isinstance(other, LandAreaArray):
+        return other._sq_m
+    if isinstance(other, LandArea):
+        return other.sq_meters
+    return None
+
+
+class LandAreaArray:
+    """
+    An immutable one-dimensional array of non-negative land areas, stored as float64 square meters.
+
+    Create arrays with the constructor (square meters) or with `from_unit`, `parse_hilly`,
+    `parse_terai` and `from_fixed`. Indexing with an integer returns a `LandArea`; slicing, boolean
+    masks and index arrays return a `LandAreaArray`. ``+`` and ``-`` combine arrays with arrays or
+    single `LandArea` values, ``*`` and ``/`` scale by numbers, and comparisons return boolean
+    arrays. ``numpy.asarray`` returns the square meters without copying, and NumPy ufuncs applied
+    to the array operate on its square meters and return plain arrays.
+
+    The constructor wraps `sq_meters` without copying when it already is a float64 array; the
+    wrapper is read-only, but the caller's own array is not.
+
+    :param sq_meters: The areas in square meters (all must be non-negative and finite).
+    :type sq_meters: array-like
+
+    :raises ValueError:
+        - If `sq_meters` does not hold numbers, or is not one-dimensional.
+        - If any area is negative, infinite or NaN.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land.area_array import LandAreaArray
+        register = LandAreaArray.parse_hilly(["2 ropani 3 aana", "0 ropani 8 aana 2 paisa"])
+        print(register.sum().to_hilly_mixed(2), register.to_hilly("aana", precision = 2))
+    """
+
+    __slots__ = ("_sq_m",)
+
+    def __init__(self, sq_meters):
+        arr = _check_areas(sq_meters).view()
+        arr.flags.writeable = False
+        _set_sq_m(self, arr)
+
+    @classmethod
+    def from_unit(cls, values, unit: str) -> "LandAreaArray":
+        """
+        Creates an array of areas from values in any land unit.
+
+        :param values: The values (all must be non-negative).
+        :type values: array-like
+        :param unit: The land unit of `values` (e.g., 'bigha', 'ropani', 'sq_m').
+        :type unit: str
+        :return: The areas.
+        :rtype: LandAreaArray
+
+        :raises ValueError:
+            - If `values` does not hold numbers or any value is negative.
+            - If `unit` is not a recognized land unit.
+        """
+        arr = as_value_array(values) * get_factor(unit, SQ_M)
+        return cls(arr)
+
+    @classmethod
+    def parse_hilly(cls, expressions) -> "LandAreaArray":
+        """
+        Creates an array of areas from Hilly mixed-unit expressions, parsed with
+        `batch.parse_hilly_mixed_unit`.
+
+        :param expressions: An iterable of expressions (e.g., '2 ropani 3 aana').
+        :return: The areas.
+        :rtype: LandAreaArray
+
+        :raises ValueError:
+            - If any expression cannot be parsed.
+        """
+        return cls(batch.parse_hilly_mixed_unit(expressions))
+
+    @classmethod
+    def parse_terai(cls, expressions) -> "LandAreaArray":
+        """
+        Creates an array of areas from Terai mixed-unit expressions, parsed with
+        `batch.parse_terai_mixed_unit`.
+
+        :param expressions: An iterable of expressions (e.g., '1 bigha 5 kattha').
+        :return: The areas.
+        :rtype: LandAreaArray
+
+        :raises ValueError:
+            - If any expression cannot be parsed.
+        """
+        return cls(batch.parse_terai_mixed_unit(expressions))
+
+    @classmethod
+    def from_fixed(cls, counts, system: str) -> "LandAreaArray":
+        """
+        Creates an array of areas from fixed-point counts (see `fixed_point`): thousandths of a daam
+        for 'hilly', thousandths of a dhur for 'terai'.
+
+        :param counts: Non-negative integer counts.
+        :type counts: array-like
+        :param system: 'hilly' or 'terai'.
+        :type system: str
+        :return: The areas.
+        :rtype: LandAreaArray
+
+        :raises ValueError:
+            - If any count is negative or not an integer.
+            - If `system` is not 'hilly' or 'terai'.
+        """
+        return cls(_FROM_FIXED[_check_system(system)](np.asarray(counts)))
+
+    @property
+    def sq_meters(self):
+        """The areas in square meters, as a read-only float64 array."""
+        return self._sq_m
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the area buffer in bytes."""
+        return self._sq_m.nbytes
+
+    def to(self, unit: str, precision: int = None):
+        """
+        Returns the areas in a single land unit of either system.
+
+        :param unit: The target land unit (e.g., 'bigha', 'aana', 'sq_m').
+        :type unit: str
+        :param precision: Number of decimal places to round to. Default is no rounding.
+        :type precision: int, optional
+        :return: A float64 array of the areas in `unit`.
+        :rtype: numpy.ndarray
+
+        :raises ValueError:
+            - If `unit` is not a recognized land unit.
+            - If `precision` is negative.
+        """
+        result = self._sq_m * get_factor(SQ_M, unit)
+        if precision is None:
+            return result
+        check_precision(precision)
+        return round_like_python(result, precision, out=result)
+
+    def _to_system(self, system: str, unit: str, precision: int):
+        table, name = _TABLES[system]
+        result = self._sq_m / batch._unit_factor(table, unit, name)
+        if precision is None:
+            return result
+        check_precision(precision)
+        return round_like_python(result, precision, out=result)
+
+    def to_hilly(self, unit: str = "ropani", precision: int = None):
+        """
+        Returns the areas in a Hilly land unit. With a `precision`, the result equals
+        `batch.sq_meters_to_hilly` of the square meters.
+
+        :param unit: The Hilly land unit (e.g., 'ropani', 'aana'). Default is 'ropani'.
+        :type unit: str, optional
+        :param precision: Number of decimal places to round to. Default is no rounding.
+        :type precision: int, optional
+        :return: A float64 array of the areas in `unit`.
+        :rtype: numpy.ndarray
+
+        :raises ValueError:
+            - If `unit` is not a recognized Hilly land unit.
+            - If `precision` is negative.
+        """
+        return self._to_system("hilly", unit, precision)
+
+    def to_terai(self, unit: str = "bigha", precision: int = None):
+        """
+        Returns the areas in a Terai land unit. With a `precision`, the result equals
+        `batch.sq_meters_to_terai` of the square meters.
+
+        :param unit: The Terai land unit (e.g., 'bigha', 'kattha'). Default is 'bigha'.
+        :type unit: str, optional
+        :param precision: Number of decimal places to round to. Default is no rounding.
+        :type precision: int, optional
+        :return: A float64 array of the areas in `unit`.
+        :rtype: numpy.ndarray
+
+        :raises ValueError:
+            - If `unit` is not a recognized Terai land unit.
+            - If `precision` is negative.
+        """
+        return self._to_system("terai", unit, precision)
+
+    def to_mixed_components(self, system: str = "hilly", precision: int = 4) -> dict:
+        """
+        Splits the areas into the mixed units of a system, as `batch.sq_meters_to_hilly_mixed` and
+        `batch.sq_meters_to_terai_mixed` do.
+
+        :param system: 'hilly' (ropani/aana/paisa/daam) or 'terai' (bigha/kattha/dhur). Default is 'hilly'.
+        :type system: str, optional
+        :param precision: Number of decimal places for the smallest unit (must be non-negative). Default is 4.
+        :type precision: int, optional
+        :return: A dict of int64 arrays for every unit but the smallest, and a float64 array for it.
+        :rtype: dict
+
+        :raises ValueError:
+            - If `system` is not 'hilly' or 'terai'.
+            - If `precision` is negative.
+        """
+        table, _ = _TABLES[_check_system(system)]
+        check_precision(precision)
+        return decompose_units(self._sq_m, list(table.items()), precision)
+
+    def to_mixed_strings(self, system: str = "hilly", precision: int = 4) -> list:
+        """
+        Formats the areas as mixed-unit expressions identical to those of
+        `mixed_units.sq_meters_to_hilly_mixed` and `mixed_units.sq_meters_to_terai_mixed`.
+
+        :param system: 'hilly' or 'terai'. Default is 'hilly'.
+        :type system: str, optional
+        :param precision: Number of decimal places for the smallest unit (must be non-negative). Default is 4.
+        :type precision: int, optional
+        :return: One expression per area.
+        :rtype: list[str]
+
+        :raises ValueError:
+            - If `system` is not 'hilly' or 'terai'.
+            - If `precision` is negative.
+        """
+        return format_mixed_units(self.to_mixed_components(system, precision), precision)
+
+    def to_fixed(self, system: str):
+        """
+        Returns the areas as fixed-point counts (see `fixed_point`): thousandths of a daam for
+        'hilly', thousandths of a dhur for 'terai'.
+
+        :param system: 'hilly' or 'terai'.
+        :type system: str
+        :return: An int64 array of counts.
+        :rtype: numpy.ndarray
+
+        :raises ValueError:
+            - If `system` is not 'hilly' or 'terai'.
+        """
+        return _TO_FIXED[_check_system(system)](self._sq_m)
+
+    def sum(self, axis=None, out=None) -> LandArea:
+        """Returns the total area. `axis` and `out` exist for ``numpy.sum`` and must be left unset."""
+        with np.errstate(over="ignore"):
+            total = float(self._sq_m.sum(axis=axis, out=out))
+        return _trusted_area(LandArea, _finite_total(total))
+
+    def min(self, axis=None, out=None) -> LandArea:
+        """Returns the smallest area. Raises ``ValueError`` if the array is empty."""
+        return _trusted_area(LandArea, float(self._sq_m.min(axis=axis, out=out)))
+
+    def max(self, axis=None, out=None) -> LandArea:
+        """Returns the largest area. Raises ``ValueError`` if the array is empty."""
+        return _trusted_area(LandArea, float(self._sq_m.max(axis=axis, out=out)))
+
+    def mean(self, axis=None, out=None) -> LandArea:
+        """Returns the mean area. Raises ``ValueError`` if the array is empty."""
+        if not len(self._sq_m):
+            raise ValueError("Mean of an empty LandAreaArray.")
+        with np.errstate(over="ignore"):
+            mean = float(self._sq_m.mean(axis=axis, out=out))
+        return _trusted_area(LandArea, _finite_total(mean))
+
+    def __len__(self) -> int:
+        return len(self._sq_m)
+
+    def __iter__(self):
+        for area_m2 in self._sq_m.tolist():
+            yield _trusted_area(LandArea, area_m2)
+
+    def __getitem__(self, index):
+        selected = self._sq_m[index]
+        if isinstance(selected, np.ndarray):
+            return _trusted(selected)
+        return _trusted_area(LandArea, float(selected))
+
+    def __repr__(self) -> str:
+        return f"LandAreaArray({np.array2string(self._sq_m, separator=', ')})"
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return np.array(self._sq_m, dtype=dtype)
+        if dtype is None:
+            return self._sq_m
+        return self._sq_m.astype(dtype, copy=False)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = tuple(x._sq_m if isinstance(x, LandAreaArray) else x for x in inputs)
+        if "out" in kwargs:
+            kwargs["out"] = tuple(x._sq_m if isinstance(x, LandAreaArray) else x for x in kwargs["out"])
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    # Equality compares element-wise, so arrays are not hashable
+    __hash__ = None
+
+    def _compare(self, other, ufunc):
+        operand = _operand(other)
+        if operand is None:
+            return NotImplemented
+        return ufunc(self._sq_m, operand)
+
+    def __eq__(self, other):
+        return self._compare(other, np.equal)
+
+    def __ne__(self, other):
+        return self._compare(other, np.not_equal)
+
+    def __lt__(self, other):
+        return self._compare(other, np.less)
+
+    def __le__(self, other):
+        return self._compare(other, np.less_equal)
+
+    def __gt__(self, other):
+        return self._compare(other, np.greater)
+
+    def __ge__(self, other):
+        return self._compare(other, np.greater_equal)
+
+    def __add__(self, other):
+        operand = _operand(other)
+        if operand is None:
+            return NotImplemented
+        with np.errstate(over="ignore"):
+            total = self._sq_m + operand
+        return _trusted(_finite_total(total))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        operand = _operand(other)
+        if operand is None:
+            return NotImplemented
+        difference = self._sq_m - operand
+        if difference.size and difference.min() < 0:
+            raise ValueError("Resulting area must be non-negative.")
+        return _trusted(difference)
+
+    def __rsub__(self, other):
+        operand = _operand(other)
+        if operand is None:
+            return NotImplemented
+        difference = operand - self._sq_m
+        if difference.size and difference.min() < 0:
+            raise ValueError("Resulting area must be non-negative.")
+        return _trusted(difference)
+
+    def __mul__(self, other):
+        if _operand(other) is not None or isinstance(other, str):
+            return NotImplemented
+        return LandAreaArray(self._sq_m * as_value_array(other))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        operand = _operand(other)
+        if operand is not None:
+            return self._sq_m / operand
+        if isinstance(other, str):
+            return NotImplemented
+        return LandAreaArray(self._sq_m / as_value_array(other))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LandAreaArray is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("LandAreaArray is immutable.")
+
+    def __reduce__(self):
+        return (LandAreaArray, (self._sq_m,))
+
+
+# Slot descriptor, used to fill instances without going through __setattr__
+_set_sq_m = LandAreaArray._sq_m.__set__
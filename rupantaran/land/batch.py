@@ -0,0 +1,631 @@
+"""
+batch.py
+
+This module provides array versions of the Terai and Hilly conversion functions. Each function
+accepts a whole column of values (a NumPy array, list, tuple or ``array.array``), validates it in
+one pass and converts it with a single vectorized multiply or divide. The results are identical,
+element for element, to calling the scalar function of the same name on each value.
+
+NumPy is required for this module (``pip install rupantaran[numpy]``).
+
+Functions:
+- `terai_to_sq_meters`: Converts an array of values from a Terai land unit to square meters.
+- `sq_meters_to_terai`: Converts an array of square meter values to a Terai land unit.
+- `terai_to_terai`: Converts an array of values between two Terai land units.
+- `hilly_to_sq_meters`: Converts an array of values from a Hilly land unit to square meters.
+- `sq_meters_to_hilly`: Converts an array of square meter values to a Hilly land unit.
+- `hilly_to_hilly`: Converts an array of values between two Hilly land units.
+- `terai_to_hilly`: Converts an array of Terai values to a Hilly unit with a single rounding.
+- `hilly_to_terai`: Converts an array of Hilly values to a Terai unit with a single rounding.
+- `parse_terai_mixed_unit`: Parses an array of Terai mixed-unit expressions into square meters.
+- `parse_hilly_mixed_unit`: Parses an array of Hilly mixed-unit expressions into square meters.
+- `sq_meters_to_terai_mixed`: Splits an array of square meter values into bigha/kattha/dhur.
+- `sq_meters_to_hilly_mixed`: Splits an array of square meter values into ropani/aana/paisa/daam.
+- `parse_terai_dash`: Parses a column of Terai dash-notation strings ('B-K-D') into square meters.
+- `parse_hilly_dash`: Parses a column of Hilly dash-notation strings ('R-A-P-D') into square meters.
+- `sq_meters_to_terai_dash`: Formats an array of square meter values as Terai dash notation.
+- `sq_meters_to_hilly_dash`: Formats an array of square meter values as Hilly dash notation.
+"""
+
+from .._arrays import (
+    np,
+    as_value_array,
+    check_precision,
+    round_like_python,
+    decompose_units,
+    format_mixed_units,
+)
+from .aliases import NEPALI_DIGITS, canonical_unit
+from .cross_system import _fused_factor
+from .mixed_units import parse_terai_mixed_unit as _parse_terai, parse_hilly_mixed_unit as _parse_hilly
+from .mixed_units import (
+    parse_terai_dash as _parse_terai_dash,
+    parse_hilly_dash as _parse_hilly_dash,
+    _format_dash_value,
+)
+from .constants import (
+    TERAI_TO_SQ_M,
+    HILLY_TO_SQ_M,
+    TERAI_CONVERSION_FACTORS,
+    HILLY_CONVERSION_FACTORS,
+)
+
+# Removes every character that may appear in a well-formed dash-notation column
+_DASH_CHARACTERS = str.maketrans("", "", "0123456789. \t-\n")
+
+
+def _unit_factor(table: dict, unit: str, system: str) -> float:
+    unit_lower = canonical_unit(unit)
+    if unit_lower not in table:
+        raise ValueError(f"Unsupported {system} unit: {unit}")
+    return table[unit_lower]
+
+
+def _pair_factor(table: dict, from_unit: str, to_unit: str, system: str) -> float:
+    from_unit = canonical_unit(from_unit)
+    to_unit = canonical_unit(to_unit)
+    if from_unit not in table or to_unit not in table[from_unit]:
+        raise ValueError(f"Invalid {system} land unit provided.")
+    return table[from_unit][to_unit]
+
+
+def terai_to_sq_meters(values, from_unit: str, precision: int = 4):
+    """
+    Converts an array of values from a Terai land unit (bigha, kattha, dhur) to square meters.
+
+    :param values: The numeric amounts to convert (all must be non-negative).
+    :type values: array-like
+    :param from_unit: The Terai land unit ('bigha', 'kattha', or 'dhur').
+    :type from_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: Equivalent areas in square meters, rounded to the specified precision.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any value is negative.
+        - If `precision` is negative.
+        - If `from_unit` is not a recognized Terai land unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.terai_to_sq_meters(values = [1, 2.5, 0], from_unit = "bigha", precision = 2)
+        print(result)
+    """
+    arr = as_value_array(values, "value")
+    check_precision(precision)
+    factor = _unit_factor(TERAI_TO_SQ_M, from_unit, "Terai")
+    return round_like_python(arr * factor, precision)
+
+
+def sq_meters_to_terai(values, to_unit: str, precision: int = 4):
+    """
+    Converts an array of areas in square meters to a specified Terai land unit.
+
+    :param values: The areas in square meters (all must be non-negative).
+    :type values: array-like
+    :param to_unit: The Terai land unit to convert to ('bigha', 'kattha', or 'dhur').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: Equivalent areas in the specified Terai land unit, rounded to the specified precision.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any area is negative.
+        - If `precision` is negative.
+        - If `to_unit` is not a recognized Terai land unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.sq_meters_to_terai(values = [500, 6772.63], to_unit = "kattha", precision = 2)
+        print(result)
+    """
+    arr = as_value_array(values, "area")
+    check_precision(precision)
+    factor = _unit_factor(TERAI_TO_SQ_M, to_unit, "Terai")
+    return round_like_python(arr / factor, precision)
+
+
+def terai_to_terai(values, from_unit: str, to_unit: str, precision: int = 4):
+    """
+    Converts an array of values directly between two Terai land units.
+
+    :param values: The numeric amounts in the `from_unit` (all must be non-negative).
+    :type values: array-like
+    :param from_unit: The source Terai land unit ('bigha', 'kattha', or 'dhur').
+    :type from_unit: str
+    :param to_unit: The target Terai land unit ('bigha', 'kattha', or 'dhur').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: Equivalent values in the target Terai land unit, rounded to the specified precision.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any value is negative.
+        - If `precision` is negative.
+        - If either `from_unit` or `to_unit` is not recognized.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.terai_to_terai(values = [3, 1.5], from_unit = "bigha", to_unit = "kattha")
+        print(result)
+    """
+    arr = as_value_array(values, "value")
+    check_precision(precision)
+    factor = _pair_factor(TERAI_CONVERSION_FACTORS, from_unit, to_unit, "Terai")
+    return round_like_python(arr * factor, precision)
+
+
+def hilly_to_sq_meters(values, from_unit: str, precision: int = 4):
+    """
+    Converts an array of values from a Hilly land unit to square meters.
+
+    :param values: The numeric amounts to convert (all must be non-negative).
+    :type values: array-like
+    :param from_unit: The Hilly land unit (e.g., 'ropani', 'aana', 'paisa', 'daam').
+    :type from_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: Equivalent areas in square meters, rounded to the specified precision.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any value is negative.
+        - If `precision` is negative.
+        - If `from_unit` is not a recognized Hilly land unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.hilly_to_sq_meters(values = [5, 0.25], from_unit = "ropani", precision = 2)
+        print(result)
+    """
+    arr = as_value_array(values, "value")
+    check_precision(precision)
+    factor = _unit_factor(HILLY_TO_SQ_M, from_unit, "Hilly")
+    return round_like_python(arr * factor, precision)
+
+
+def sq_meters_to_hilly(values, to_unit: str, precision: int = 4):
+    """
+    Converts an array of areas in square meters to a specified Hilly land unit.
+
+    :param values: The areas in square meters (all must be non-negative).
+    :type values: array-like
+    :param to_unit: The Hilly land unit to convert to (e.g., 'ropani', 'aana', 'paisa', 'daam').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: Equivalent areas in the specified Hilly land unit, rounded to the specified precision.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any area is negative.
+        - If `precision` is negative.
+        - If `to_unit` is not a recognized Hilly land unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.sq_meters_to_hilly(values = [500, 1017.48], to_unit = "aana", precision = 2)
+        print(result)
+    """
+    arr = as_value_array(values, "area")
+    check_precision(precision)
+    factor = _unit_factor(HILLY_TO_SQ_M, to_unit, "Hilly")
+    return round_like_python(arr / factor, precision)
+
+
+def hilly_to_hilly(values, from_unit: str, to_unit: str, precision: int = 4):
+    """
+    Converts an array of values directly between two Hilly land units.
+
+    :param values: The numeric amounts in the `from_unit` (all must be non-negative).
+    :type values: array-like
+    :param from_unit: The source Hilly land unit (e.g., 'ropani', 'aana', 'paisa', 'daam').
+    :type from_unit: str
+    :param to_unit: The target Hilly land unit (e.g., 'ropani', 'aana', 'paisa', 'daam').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: Equivalent values in the target Hilly land unit, rounded to the specified precision.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any value is negative.
+        - If `precision` is negative.
+        - If either `from_unit` or `to_unit` is not recognized.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.hilly_to_hilly(values = [10, 32], from_unit = "aana", to_unit = "ropani")
+        print(result)
+    """
+    arr = as_value_array(values, "value")
+    check_precision(precision)
+    factor = _pair_factor(HILLY_CONVERSION_FACTORS, from_unit, to_unit, "Hilly")
+    return round_like_python(arr * factor, precision)
+
+
+def terai_to_hilly(values, from_unit: str, to_unit: str, precision: int = 4):
+    """
+    Converts an array of values from a Terai land unit to a Hilly land unit in a single step.
+
+    Each value is multiplied by one precomputed ratio and rounded once, exactly like
+    :func:`rupantaran.land.cross_system.terai_to_hilly_fused`.
+
+    :param values: The numeric amounts in the `from_unit` (all must be non-negative).
+    :type values: array-like
+    :param from_unit: The source Terai land unit (e.g., 'bigha', 'kattha', 'dhur').
+    :type from_unit: str
+    :param to_unit: The target Hilly land unit (e.g., 'ropani', 'aana', 'paisa', 'daam').
+    :type to_unit: str
+    :param precision: Number of decimal places for rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: Equivalent values in the target Hilly land unit, rounded to the specified precision.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any value is negative.
+        - If `precision` is negative.
+        - If `from_unit` is not a recognized Terai land unit.
+        - If `to_unit` is not a recognized Hilly land unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.terai_to_hilly(values = [1, 2.5], from_unit = "bigha", to_unit = "aana")
+        print(result)
+    """
+    arr = as_value_array(values, "value")
+    check_precision(precision)
+    factor = _fused_factor(from_unit, to_unit, TERAI_TO_SQ_M, HILLY_TO_SQ_M, "Terai", "Hilly")
+    return round_like_python(arr * factor, precision)
+
+
+def hilly_to_terai(values, from_unit: str, to_unit: str, precision: int = 4):
+    """
+    Converts an array of values from a Hilly land unit to a Terai land unit in a single step.
+
+    Each value is multiplied by one precomputed ratio and rounded once, exactly like
+    :func:`rupantaran.land.cross_system.hilly_to_terai_fused`.
+
+    :param values: The numeric amounts in the `from_unit` (all must be non-negative).
+    :type values: array-like
+    :param from_unit: The source Hilly land unit (e.g., 'ropani', 'aana', 'paisa', 'daam').
+    :type from_unit: str
+    :param to_unit: The target Terai land unit (e.g., 'bigha', 'kattha', 'dhur').
+    :type to_unit: str
+    :param precision: Number of decimal places for rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: Equivalent values in the target Terai land unit, rounded to the specified precision.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any value is negative.
+        - If `precision` is negative.
+        - If `from_unit` is not a recognized Hilly land unit.
+        - If `to_unit` is not a recognized Terai land unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.hilly_to_terai(values = [1, 16], from_unit = "ropani", to_unit = "kattha")
+        print(result)
+    """
+    arr = as_value_array(values, "value")
+    check_precision(precision)
+    factor = _fused_factor(from_unit, to_unit, HILLY_TO_SQ_M, TERAI_TO_SQ_M, "Hilly", "Terai")
+    return round_like_python(arr * factor, precision)
+
+
+def parse_terai_mixed_unit(expressions):
+    """
+    Parses a sequence of Terai mixed-unit expressions into an array of square meter values.
+
+    Each expression goes through the cached parser of
+    :func:`rupantaran.land.mixed_units.parse_terai_mixed_unit`, so repeated strings are parsed once.
+
+    :param expressions: The expressions to parse (e.g., ['1 bigha 5 kattha', '10 dhur']).
+    :type expressions: iterable of str
+    :return: The equivalent areas in square meters.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If any expression cannot be parsed (see `MixedUnitParseError`).
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.parse_terai_mixed_unit(expressions = ["1 bigha 5 kattha", "10 dhur"])
+        print(result)
+    """
+    return np.fromiter(map(_parse_terai, expressions), dtype=np.float64)
+
+
+def parse_hilly_mixed_unit(expressions):
+    """
+    Parses a sequence of Hilly mixed-unit expressions into an array of square meter values.
+
+    Each expression goes through the cached parser of
+    :func:`rupantaran.land.mixed_units.parse_hilly_mixed_unit`, so repeated strings are parsed once.
+
+    :param expressions: The expressions to parse (e.g., ['2 ropani 3 aana', '8 aana']).
+    :type expressions: iterable of str
+    :return: The equivalent areas in square meters.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If any expression cannot be parsed (see `MixedUnitParseError`).
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.parse_hilly_mixed_unit(expressions = ["2 ropani 3 aana", "8 aana"])
+        print(result)
+    """
+    return np.fromiter(map(_parse_hilly, expressions), dtype=np.float64)
+
+
+def sq_meters_to_terai_mixed(values, precision: int = 4, as_strings: bool = False):
+    """
+    Converts an array of areas in square meters to Terai mixed units (bigha, kattha, dhur).
+
+    By default the per-unit components are returned as arrays. Strings identical to those of
+    :func:`rupantaran.land.mixed_units.sq_meters_to_terai_mixed` are built only when
+    `as_strings` is true.
+
+    :param values: The areas in square meters (all must be non-negative).
+    :type values: array-like
+    :param precision: Number of decimal places for dhur rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param as_strings: Return formatted mixed-unit expressions instead of component arrays.
+    :type as_strings: bool, optional
+    :return: A dict with int64 arrays for 'bigha' and 'kattha' and a float64 array for 'dhur',
+        or a list of strings when `as_strings` is true.
+    :rtype: dict or list
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any area is negative, infinite or NaN.
+        - If any area has more whole units of the largest unit than an int64 holds.
+        - If `precision` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        parts = batch.sq_meters_to_terai_mixed(values = [500, 8632.08], precision = 2)
+        print(parts["bigha"], parts["kattha"], parts["dhur"])
+    """
+    arr = as_value_array(values, "area")
+    check_precision(precision)
+    components = decompose_units(arr, list(TERAI_TO_SQ_M.items()), precision)
+    if as_strings:
+        return format_mixed_units(components, precision)
+    return components
+
+
+def sq_meters_to_hilly_mixed(values, precision: int = 4, as_strings: bool = False):
+    """
+    Converts an array of areas in square meters to Hilly mixed units (ropani, aana, paisa, daam).
+
+    By default the per-unit components are returned as arrays. Strings identical to those of
+    :func:`rupantaran.land.mixed_units.sq_meters_to_hilly_mixed` are built only when
+    `as_strings` is true.
+
+    :param values: The areas in square meters (all must be non-negative).
+    :type values: array-like
+    :param precision: Number of decimal places for daam rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param as_strings: Return formatted mixed-unit expressions instead of component arrays.
+    :type as_strings: bool, optional
+    :return: A dict with int64 arrays for 'ropani', 'aana' and 'paisa' and a float64 array for
+        'daam', or a list of strings when `as_strings` is true.
+    :rtype: dict or list
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any area is negative, infinite or NaN.
+        - If any area has more whole units of the largest unit than an int64 holds.
+        - If `precision` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        lines = batch.sq_meters_to_hilly_mixed(values = [500, 1082.55], precision = 2, as_strings = True)
+        print(lines)
+    """
+    arr = as_value_array(values, "area")
+    check_precision(precision)
+    components = decompose_units(arr, list(HILLY_TO_SQ_M.items()), precision)
+    if as_strings:
+        return format_mixed_units(components, precision)
+    return components
+
+
+def _parse_dash_column(expressions, table: dict, parse_one):
+    """
+    Splits a whole column at once: the rows are joined with a '-\\n-' separator, split on every
+    dash, checked with a few C-level string operations, and converted by one NumPy string-to-float
+    pass before the values are summed position by position. A column with any malformed row is
+    parsed row by row instead, so the error of the first bad row is raised with its position.
+    """
+    expressions = list(expressions)
+    rows = len(expressions)
+    if not rows:
+        return np.empty(0, dtype=np.float64)
+    width = len(table)
+    joined = "-\n-".join(expressions)
+    if not joined.isascii():
+        joined = joined.translate(NEPALI_DIGITS)
+    fields = joined.split("-")
+    if (
+        joined.isascii()
+        and not joined.translate(_DASH_CHARACTERS)
+        and joined.count("\n") == rows - 1
+        and len(fields) == rows * (width + 1) - 1
+        and fields[width::width + 1].count("\n") == rows - 1
+    ):
+        del fields[width::width + 1]
+        try:
+            # Every field now holds only digits, dots and blanks, so this fails only for an
+            # empty field or a malformed number such as '1.2.3'.
+            values = np.array(fields, dtype=np.float64).reshape(rows, width)
+        except ValueError:
+            values = None
+        if values is not None:
+            factors = list(table.values())
+            total = values[:, 0] * factors[0]
+            for i in range(1, width):
+                total += values[:, i] * factors[i]
+            return total
+    return np.fromiter(map(parse_one, expressions), dtype=np.float64, count=rows)
+
+
+def _format_dash_column(values, table: dict, precision: int) -> list:
+    arr = as_value_array(values, "area")
+    check_precision(precision)
+    components = decompose_units(arr, list(table.items()), precision)
+    columns = [part.tolist() for part in components.values()]
+    return [
+        "-".join([*map(str, row[:-1]), _format_dash_value(row[-1], precision)])
+        for row in zip(*columns)
+    ]
+
+
+def parse_terai_dash(expressions):
+    """
+    Parses a sequence of Terai dash-notation strings (bigha-kattha-dhur) into square meters.
+
+    Each element is identical to what
+    :func:`rupantaran.land.mixed_units.parse_terai_dash` returns for that string.
+
+    :param expressions: The expressions to parse (e.g., ['1-5-10', '0-3-2.5']).
+    :type expressions: iterable of str
+    :return: The equivalent areas in square meters.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If any expression cannot be parsed (see `MixedUnitParseError`).
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.parse_terai_dash(expressions = ["1-5-10", "0-3-2.5"])
+        print(result)
+    """
+    return _parse_dash_column(expressions, TERAI_TO_SQ_M, _parse_terai_dash)
+
+
+def parse_hilly_dash(expressions):
+    """
+    Parses a sequence of Hilly dash-notation strings (ropani-aana-paisa-daam) into square meters.
+
+    Each element is identical to what
+    :func:`rupantaran.land.mixed_units.parse_hilly_dash` returns for that string.
+
+    :param expressions: The expressions to parse (e.g., ['2-3-1-0', '0-8-0-2.5']).
+    :type expressions: iterable of str
+    :return: The equivalent areas in square meters.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If any expression cannot be parsed (see `MixedUnitParseError`).
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        result = batch.parse_hilly_dash(expressions = ["2-3-1-0", "0-8-0-2.5"])
+        print(result)
+    """
+    return _parse_dash_column(expressions, HILLY_TO_SQ_M, _parse_hilly_dash)
+
+
+def sq_meters_to_terai_dash(values, precision: int = 4) -> list:
+    """
+    Formats an array of areas in square meters as Terai dash notation (bigha-kattha-dhur).
+
+    Each string is identical to what
+    :func:`rupantaran.land.mixed_units.sq_meters_to_terai_dash` returns for that value.
+
+    :param values: The areas in square meters (all must be non-negative).
+    :type values: array-like
+    :param precision: Number of decimal places for dhur rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: The dash-notation strings.
+    :rtype: list
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any area is negative, infinite or NaN.
+        - If any area has more whole units of the largest unit than an int64 holds.
+        - If `precision` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        print(batch.sq_meters_to_terai_dash(values = [500, 8632.08], precision = 2))
+    """
+    return _format_dash_column(values, TERAI_TO_SQ_M, precision)
+
+
+def sq_meters_to_hilly_dash(values, precision: int = 4) -> list:
+    """
+    Formats an array of areas in square meters as Hilly dash notation (ropani-aana-paisa-daam).
+
+    Each string is identical to what
+    :func:`rupantaran.land.mixed_units.sq_meters_to_hilly_dash` returns for that value.
+
+    :param values: The areas in square meters (all must be non-negative).
+    :type values: array-like
+    :param precision: Number of decimal places for daam rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: The dash-notation strings.
+    :rtype: list
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any area is negative, infinite or NaN.
+        - If any area has more whole units of the largest unit than an int64 holds.
+        - If `precision` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        print(batch.sq_meters_to_hilly_dash(values = [500, 1082.55], precision = 2))
+    """
+    return _format_dash_column(values, HILLY_TO_SQ_M, precision)
@@ -7,6 +7,8 @@ by using square meters as an intermediary conversion step.
 Functions:
 - `terai_to_hilly`: Converts a value from a Terai land unit to a Hilly land unit.
 - `hilly_to_terai`: Converts a value from a Hilly land unit to a Terai land unit.
+- `terai_to_hilly_fused`: Converts Terai to Hilly with one precomputed ratio and a single rounding.
+- `hilly_to_terai_fused`: Converts Hilly to Terai with one precomputed ratio and a single rounding.
 
 Dependencies:
 - `terai_to_sq_meters`: Converts Terai land units to square meters.
@@ -16,6 +18,9 @@ Dependencies:
 """
 from .terai import terai_to_sq_meters, sq_meters_to_terai
 from .hilly import hilly_to_sq_meters, sq_meters_to_hilly
+from .aliases import canonical_unit
+from .constants import TERAI_TO_SQ_M, HILLY_TO_SQ_M
+from .registry import FACTOR_MATRIX, UNIT_INDEX
 
 
 def terai_to_hilly(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
@@ -103,3 +108,105 @@ def hilly_to_terai(value: float, from_unit: str, to_unit: str, precision: int =
     area_m2 = hilly_to_sq_meters(value, from_unit)
     # Convert square meters to the Terai unit
     return round(sq_meters_to_terai(area_m2, to_unit), precision)
+
+
+def _fused_factor(
+    from_unit: str, to_unit: str, from_table: dict, to_table: dict, from_system: str, to_system: str
+) -> float:
+    """
+    Returns the precomputed ratio converting `from_unit` straight to `to_unit`, checking that
+    each unit belongs to its system.
+    """
+    from_lower = canonical_unit(from_unit)
+    to_lower = canonical_unit(to_unit)
+    if from_lower not in from_table:
+        raise ValueError(f"Unsupported {from_system} unit: {from_unit}")
+    if to_lower not in to_table:
+        raise ValueError(f"Unsupported {to_system} unit: {to_unit}")
+    return FACTOR_MATRIX[UNIT_INDEX[from_lower]][UNIT_INDEX[to_lower]]
+
+
+def terai_to_hilly_fused(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
+    """
+    Converts a value from a Terai land unit to a Hilly land unit in a single step.
+
+    Unlike `terai_to_hilly`, the intermediate square meter value is never rounded: the value is
+    multiplied by one precomputed ratio (e.g., aana per bigha) and rounded once.
+
+    :param value: The numeric amount in the `from_unit` (must be non-negative).
+    :type value: float
+    :param from_unit: The source Terai land unit (e.g., 'bigha', 'kattha', 'dhur').
+    :type from_unit: str
+    :param to_unit: The target Hilly land unit (e.g., 'ropani', 'aana', 'paisa', 'daam').
+    :type to_unit: str
+    :param precision: Number of decimal places for rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: The equivalent value in the target Hilly land unit, rounded to the specified precision.
+    :rtype: float
+
+    :raises ValueError:
+        - If `value` is negative or not a number.
+        - If `precision` is negative.
+        - If `from_unit` is not a recognized Terai land unit.
+        - If `to_unit` is not a recognized Hilly land unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import cross_system
+        result = cross_system.terai_to_hilly_fused(value = 1, from_unit = "bigha", to_unit = "aana", precision = 2)
+        print(result)
+    """
+    if not isinstance(value, (int, float)):
+        raise ValueError("Input value must be a number.")
+    if value < 0:
+        raise ValueError("Input value must be non-negative.")
+    if precision < 0:
+        raise ValueError("Precision must be non-negative.")
+
+    factor = _fused_factor(from_unit, to_unit, TERAI_TO_SQ_M, HILLY_TO_SQ_M, "Terai", "Hilly")
+    return round(value * factor, precision)
+
+
+def hilly_to_terai_fused(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
+    """
+    Converts a value from a Hilly land unit to a Terai land unit in a single step.
+
+    Unlike `hilly_to_terai`, the intermediate square meter value is never rounded: the value is
+    multiplied by one precomputed ratio (e.g., kattha per ropani) and rounded once.
+
+    :param value: The numeric amount in the `from_unit` (must be non-negative).
+    :type value: float
+    :param from_unit: The source Hilly land unit (e.g., 'ropani', 'aana', 'paisa', 'daam').
+    :type from_unit: str
+    :param to_unit: The target Terai land unit (e.g., 'bigha', 'kattha', 'dhur').
+    :type to_unit: str
+    :param precision: Number of decimal places for rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: The equivalent value in the target Terai land unit, rounded to the specified precision.
+    :rtype: float
+
+    :raises ValueError:
+        - If `value` is negative or not a number.
+        - If `precision` is negative.
+        - If `from_unit` is not a recognized Hilly land unit.
+        - If `to_unit` is not a recognized Terai land unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import cross_system
+        result = cross_system.hilly_to_terai_fused(value = 1, from_unit = "ropani", to_unit = "kattha", precision = 2)
+        print(result)
+    """
+    if not isinstance(value, (int, float)):
+        raise ValueError("Input value must be a number.")
+    if value < 0:
+        raise ValueError("Input value must be non-negative.")
+    if precision < 0:
+        raise ValueError("Precision must be non-negative.")
+
+    factor = _fused_factor(from_unit, to_unit, HILLY_TO_SQ_M, TERAI_TO_SQ_M, "Hilly", "Terai")
+    return round(value * factor, precision)
@@ -0,0 +1,441 @@
+"""
+fixed_point.py
+
+This module provides an exact integer representation of land areas. An area is stored as a whole
+number of base sub-units: thousandths of a daam for Hilly areas and thousandths of a dhur for
+Terai areas. Sums and comparisons of such counts are exact, and splitting a count into mixed units
+is plain integer ``divmod``. Every function accepts either a Python number or a NumPy array
+(counts are then int64 arrays, half the memory of an object array of floats).
+
+The base sub-units follow the ratios of `HILLY_CONVERSION_FACTORS` and `TERAI_CONVERSION_FACTORS`
+(1 ropani = 256 daam, 1 bigha = 400 dhur). Square meters are tied to the largest unit of each
+system, so 1 ropani is exactly 508.74 m² and 1 bigha exactly 6772.63 m². Note that
+`HILLY_TO_SQ_M` and `TERAI_TO_SQ_M` list rounded areas for the smaller units, so decompositions
+here can differ slightly from `mixed_units.sq_meters_to_hilly_mixed`.
+
+Functions:
+- `hilly_to_fixed`: Converts a value in a Hilly land unit to thousandths of a daam.
+- `terai_to_fixed`: Converts a value in a Terai land unit to thousandths of a dhur.
+- `sq_meters_to_hilly_fixed`: Converts square meters to thousandths of a daam.
+- `sq_meters_to_terai_fixed`: Converts square meters to thousandths of a dhur.
+- `hilly_fixed_to_sq_meters`: Converts thousandths of a daam to square meters.
+- `terai_fixed_to_sq_meters`: Converts thousandths of a dhur to square meters.
+- `hilly_fixed_components`: Splits thousandths of a daam into ropani, aana, paisa and daam.
+- `terai_fixed_components`: Splits thousandths of a dhur into bigha, kattha and dhur.
+- `format_hilly_fixed`: Formats thousandths of a daam as a Hilly mixed-unit expression.
+- `format_terai_fixed`: Formats thousandths of a dhur as a Terai mixed-unit expression.
+- `parse_hilly_fixed`: Parses a Hilly mixed-unit expression into thousandths of a daam.
+- `parse_terai_fixed`: Parses a Terai mixed-unit expression into thousandths of a dhur.
+
+Constants:
+- `SUBDIVISION`: Number of base sub-units in the smallest unit of each system (1000).
+- `HILLY_BASE_PER_UNIT`: Dictionary mapping Hilly land units to their size in thousandths of a daam.
+- `TERAI_BASE_PER_UNIT`: Dictionary mapping Terai land units to their size in thousandths of a dhur.
+"""
+
+import math
+from numbers import Integral
+
+from .._parsing import sum_pairs
+from .aliases import alias_factors, canonical_unit
+from .constants import (
+    TERAI_TO_SQ_M,
+    HILLY_TO_SQ_M,
+    TERAI_CONVERSION_FACTORS,
+    HILLY_CONVERSION_FACTORS,
+)
+
+SUBDIVISION = 1000
+
+HILLY_BASE_PER_UNIT = {
+    unit: int(factors["daam"] * SUBDIVISION) for unit, factors in HILLY_CONVERSION_FACTORS.items()
+}
+
+TERAI_BASE_PER_UNIT = {
+    unit: int(factors["dhur"] * SUBDIVISION) for unit, factors in TERAI_CONVERSION_FACTORS.items()
+}
+
+# Square meters in one base sub-unit, tied to the largest unit of each system
+_HILLY_SQ_M_PER_BASE = HILLY_TO_SQ_M["ropani"] / HILLY_BASE_PER_UNIT["ropani"]
+_TERAI_SQ_M_PER_BASE = TERAI_TO_SQ_M["bigha"] / TERAI_BASE_PER_UNIT["bigha"]
+
+# Unit sizes keyed on every alias, for the expression parsers
+_HILLY_PARSE_FACTORS = alias_factors(HILLY_BASE_PER_UNIT)
+_TERAI_PARSE_FACTORS = alias_factors(TERAI_BASE_PER_UNIT)
+
+
+def _is_scalar(value) -> bool:
+    return isinstance(value, (int, float))
+
+
+# Counts of arrays are int64; floats at or above 2**63 do not fit
+_INT64_BOUND = 2.0**63
+
+
+def _to_count(value, name: str):
+    """Rounds a number or an array to the nearest whole count (half to even)."""
+    if _is_scalar(value):
+        if not math.isfinite(value):
+            raise ValueError(f"Input {name} must be finite.")
+        return int(round(value))
+    from .._arrays import np
+
+    rounded = np.rint(value)
+    if not np.isfinite(rounded).all():
+        raise ValueError(f"Input {name} must be finite.")
+    if rounded.size and rounded.max() >= _INT64_BOUND:
+        raise ValueError(f"Input {name} is too large for an int64 count.")
+    return rounded.astype(np.int64)
+
+
+def _check_values(value, name: str):
+    if isinstance(value, str):
+        raise ValueError(f"Input {name} must be a number.")
+    if _is_scalar(value):
+        if value < 0:
+            raise ValueError(f"Input {name} must be non-negative.")
+        return value
+    from .._arrays import as_value_array
+
+    return as_value_array(value, name)
+
+
+def _check_counts(count):
+    if isinstance(count, Integral):
+        if count < 0:
+            raise ValueError("Input count must be non-negative.")
+        return int(count)
+    if isinstance(count, float):
+        raise ValueError("Input count must be an integer.")
+    from .._arrays import np
+
+    arr = np.asarray(count)
+    if arr.dtype.kind not in "iu":
+        raise ValueError("Input count must be an integer.")
+    arr = arr.astype(np.int64, copy=False)
+    if arr.size and arr.min() < 0:
+        raise ValueError("Input count must be non-negative.")
+    return arr
+
+
+def _unit_size(table: dict, unit: str, system: str) -> int:
+    unit_lower = canonical_unit(unit)
+    if unit_lower not in table:
+        raise ValueError(f"Unsupported {system} unit: {unit}")
+    return table[unit_lower]
+
+
+def _components(count, table: dict) -> tuple:
+    count = _check_counts(count)
+    parts = []
+    for size in list(table.values())[:-1]:
+        whole, count = divmod(count, size)
+        parts.append(whole)
+    parts.append(count / SUBDIVISION)
+    return tuple(parts)
+
+
+def _format(count, table: dict) -> str:
+    if not isinstance(count, Integral):
+        raise ValueError("Input count must be an integer.")
+    count = _check_counts(count)
+    units = list(table)
+    pieces = []
+    for unit in units[:-1]:
+        whole, count = divmod(count, table[unit])
+        pieces.append(f"{whole} {unit}")
+    whole, fraction = divmod(count, SUBDIVISION)
+    pieces.append(f"{whole}.{fraction:03d} {units[-1]}")
+    return " ".join(pieces)
+
+
+def hilly_to_fixed(value, from_unit: str):
+    """
+    Converts a value in a Hilly land unit to a whole number of thousandths of a daam.
+
+    :param value: The amount to convert (must be non-negative); a number or an array.
+    :type value: float or array-like
+    :param from_unit: The Hilly land unit (e.g., 'ropani', 'aana', 'paisa', 'daam').
+    :type from_unit: str
+    :return: The area in thousandths of a daam, rounded to the nearest whole count.
+    :rtype: int or numpy.ndarray
+
+    :raises ValueError:
+        - If `value` is negative, infinite, NaN or not a number.
+        - If an array count does not fit in int64.
+        - If `from_unit` is not a recognized Hilly land unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        result = fixed_point.hilly_to_fixed(value = 2.5, from_unit = "ropani")
+        print(result)
+    """
+    value = _check_values(value, "value")
+    return _to_count(value * _unit_size(HILLY_BASE_PER_UNIT, from_unit, "Hilly"), "value")
+
+
+def terai_to_fixed(value, from_unit: str):
+    """
+    Converts a value in a Terai land unit to a whole number of thousandths of a dhur.
+
+    :param value: The amount to convert (must be non-negative); a number or an array.
+    :type value: float or array-like
+    :param from_unit: The Terai land unit ('bigha', 'kattha', or 'dhur').
+    :type from_unit: str
+    :return: The area in thousandths of a dhur, rounded to the nearest whole count.
+    :rtype: int or numpy.ndarray
+
+    :raises ValueError:
+        - If `value` is negative, infinite, NaN or not a number.
+        - If an array count does not fit in int64.
+        - If `from_unit` is not a recognized Terai land unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        result = fixed_point.terai_to_fixed(value = 3, from_unit = "kattha")
+        print(result)
+    """
+    value = _check_values(value, "value")
+    return _to_count(value * _unit_size(TERAI_BASE_PER_UNIT, from_unit, "Terai"), "value")
+
+
+def sq_meters_to_hilly_fixed(area_m2):
+    """
+    Converts an area in square meters to a whole number of thousandths of a daam.
+
+    :param area_m2: The area in square meters (must be non-negative); a number or an array.
+    :type area_m2: float or array-like
+    :return: The area in thousandths of a daam, rounded to the nearest whole count.
+    :rtype: int or numpy.ndarray
+
+    :raises ValueError:
+        - If `area_m2` is negative, infinite, NaN or not a number.
+        - If an array count does not fit in int64.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        result = fixed_point.sq_meters_to_hilly_fixed(area_m2 = 1082.55)
+        print(result)
+    """
+    area_m2 = _check_values(area_m2, "area")
+    return _to_count(area_m2 / _HILLY_SQ_M_PER_BASE, "area")
+
+
+def sq_meters_to_terai_fixed(area_m2):
+    """
+    Converts an area in square meters to a whole number of thousandths of a dhur.
+
+    :param area_m2: The area in square meters (must be non-negative); a number or an array.
+    :type area_m2: float or array-like
+    :return: The area in thousandths of a dhur, rounded to the nearest whole count.
+    :rtype: int or numpy.ndarray
+
+    :raises ValueError:
+        - If `area_m2` is negative, infinite, NaN or not a number.
+        - If an array count does not fit in int64.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        result = fixed_point.sq_meters_to_terai_fixed(area_m2 = 8632.08)
+        print(result)
+    """
+    area_m2 = _check_values(area_m2, "area")
+    return _to_count(area_m2 / _TERAI_SQ_M_PER_BASE, "area")
+
+
+def hilly_fixed_to_sq_meters(count):
+    """
+    Converts thousandths of a daam to square meters.
+
+    :param count: The area in thousandths of a daam (a non-negative integer or integer array).
+    :type count: int or array-like
+    :return: The area in square meters.
+    :rtype: float or numpy.ndarray
+
+    :raises ValueError:
+        - If `count` is negative or not an integer.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        result = fixed_point.hilly_fixed_to_sq_meters(count = 512000)
+        print(result)
+    """
+    return _check_counts(count) * _HILLY_SQ_M_PER_BASE
+
+
+def terai_fixed_to_sq_meters(count):
+    """
+    Converts thousandths of a dhur to square meters.
+
+    :param count: The area in thousandths of a dhur (a non-negative integer or integer array).
+    :type count: int or array-like
+    :return: The area in square meters.
+    :rtype: float or numpy.ndarray
+
+    :raises ValueError:
+        - If `count` is negative or not an integer.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        result = fixed_point.terai_fixed_to_sq_meters(count = 400000)
+        print(result)
+    """
+    return _check_counts(count) * _TERAI_SQ_M_PER_BASE
+
+
+def hilly_fixed_components(count) -> tuple:
+    """
+    Splits thousandths of a daam into ropani, aana, paisa and daam with exact integer division.
+
+    :param count: The area in thousandths of a daam (a non-negative integer or integer array).
+    :type count: int or array-like
+    :return: A tuple (ropani, aana, paisa, daam); the first three are whole counts and daam is
+        the remaining thousandths divided by 1000.
+    :rtype: tuple
+
+    :raises ValueError:
+        - If `count` is negative or not an integer.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        ropani, aana, paisa, daam = fixed_point.hilly_fixed_components(count = 548500)
+        print(ropani, aana, paisa, daam)
+    """
+    return _components(count, HILLY_BASE_PER_UNIT)
+
+
+def terai_fixed_components(count) -> tuple:
+    """
+    Splits thousandths of a dhur into bigha, kattha and dhur with exact integer division.
+
+    :param count: The area in thousandths of a dhur (a non-negative integer or integer array).
+    :type count: int or array-like
+    :return: A tuple (bigha, kattha, dhur); the first two are whole counts and dhur is the
+        remaining thousandths divided by 1000.
+    :rtype: tuple
+
+    :raises ValueError:
+        - If `count` is negative or not an integer.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        bigha, kattha, dhur = fixed_point.terai_fixed_components(count = 510500)
+        print(bigha, kattha, dhur)
+    """
+    return _components(count, TERAI_BASE_PER_UNIT)
+
+
+def format_hilly_fixed(count: int) -> str:
+    """
+    Formats thousandths of a daam as a Hilly mixed-unit expression, using integer arithmetic only.
+
+    :param count: The area in thousandths of a daam (a non-negative integer).
+    :type count: int
+    :return: The expression, with daam to three decimal places.
+    :rtype: str
+
+    :raises ValueError:
+        - If `count` is negative or not an integer.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        print(fixed_point.format_hilly_fixed(count = 548500))  # 2 ropani 2 aana 1 paisa 0.500 daam
+    """
+    return _format(count, HILLY_BASE_PER_UNIT)
+
+
+def format_terai_fixed(count: int) -> str:
+    """
+    Formats thousandths of a dhur as a Terai mixed-unit expression, using integer arithmetic only.
+
+    :param count: The area in thousandths of a dhur (a non-negative integer).
+    :type count: int
+    :return: The expression, with dhur to three decimal places.
+    :rtype: str
+
+    :raises ValueError:
+        - If `count` is negative or not an integer.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        print(fixed_point.format_terai_fixed(count = 510500))  # 1 bigha 5 kattha 10.500 dhur
+    """
+    return _format(count, TERAI_BASE_PER_UNIT)
+
+
+def parse_hilly_fixed(expression: str) -> int:
+    """
+    Parses a Hilly mixed-unit expression into a whole number of thousandths of a daam.
+
+    :param expression: A Hilly mixed-unit expression (e.g., '2 ropani 3 aana 2 paisa').
+    :type expression: str
+    :return: The area in thousandths of a daam, rounded to the nearest whole count.
+    :rtype: int
+
+    :raises ValueError:
+        - If the input string format is incorrect.
+        - If an unsupported unit is encountered.
+        - If any value in the expression is negative or too large to be finite.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        print(fixed_point.parse_hilly_fixed(expression = "2 ropani 3 aana 2 paisa"))
+    """
+    return _to_count(sum_pairs(expression, _HILLY_PARSE_FACTORS, "Hilly"), "value")
+
+
+def parse_terai_fixed(expression: str) -> int:
+    """
+    Parses a Terai mixed-unit expression into a whole number of thousandths of a dhur.
+
+    :param expression: A Terai mixed-unit expression (e.g., '1 bigha 5 kattha 10 dhur').
+    :type expression: str
+    :return: The area in thousandths of a dhur, rounded to the nearest whole count.
+    :rtype: int
+
+    :raises ValueError:
+        - If the input string format is incorrect.
+        - If an unsupported unit is encountered.
+        - If any value in the expression is negative or too large to be finite.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import fixed_point
+        print(fixed_point.parse_terai_fixed(expression = "1 bigha 5 kattha 10 dhur"))
+    """
+    return _to_count(sum_pairs(expression, _TERAI_PARSE_FACTORS, "Terai"), "value")
@@ -14,6 +14,7 @@ Constants:
 - `HILLY_CONVERSION_FACTORS`: Nested dictionary containing direct conversion ratios between Hilly land units.
 """
 
+from .aliases import canonical_unit
 from .constants import HILLY_TO_SQ_M, HILLY_CONVERSION_FACTORS
 
 
@@ -52,7 +53,7 @@ def hilly_to_sq_meters(value: float, from_unit: str, precision: int = 4) -> floa
     if precision < 0:
         raise ValueError("Precision must be non-negative.")
 
-    unit_lower = from_unit.lower()
+    unit_lower = canonical_unit(from_unit)
     if unit_lower not in HILLY_TO_SQ_M:
         raise ValueError(f"Unsupported Hilly unit: {from_unit}")
 
@@ -93,7 +94,7 @@ def sq_meters_to_hilly(area_m2: float, to_unit: str, precision: int = 4) -> floa
     if precision < 0:
         raise ValueError("Precision must be non-negative.")
 
-    unit_lower = to_unit.lower()
+    unit_lower = canonical_unit(to_unit)
     if unit_lower not in HILLY_TO_SQ_M:
         raise ValueError(f"Unsupported Hilly unit: {to_unit}")
 
@@ -137,8 +138,8 @@ def hilly_to_hilly(
         raise ValueError("Input value must be non-negative.")
     if precision < 0:
         raise ValueError("Precision must be non-negative.")
-    from_unit = from_unit.lower()
-    to_unit = to_unit.lower()
+    from_unit = canonical_unit(from_unit)
+    to_unit = canonical_unit(to_unit)
     if (
         from_unit not in HILLY_CONVERSION_FACTORS
         or to_unit not in HILLY_CONVERSION_FACTORS[from_unit]
@@ -12,27 +12,116 @@ Functions:
 - `sq_meters_to_hilly_mixed`: Converts square meters to a Hilly mixed-unit expression.
 - `hilly_mixed_to_terai_mixed`: Converts a Hilly mixed-unit expression to a Terai mixed-unit expression.
 - `terai_mixed_to_hilly_mixed`: Converts a Terai mixed-unit expression to a Hilly mixed-unit expression.
+- `parse_terai_dash`: Parses Terai dash notation ('B-K-D', e.g. '1-5-10') into square meters.
+- `parse_hilly_dash`: Parses Hilly dash notation ('R-A-P-D', e.g. '2-3-1-0') into square meters.
+- `sq_meters_to_terai_dash`: Converts square meters to Terai dash notation.
+- `sq_meters_to_hilly_dash`: Converts square meters to Hilly dash notation.
+- `parse_cache_info`: Returns the hit/miss/eviction counters of the parse cache.
+- `clear_parse_cache`: Empties the parse cache.
+- `set_parse_cache_size`: Sets the size bound of the parse cache (0 disables it).
+
+Classes:
+- `MixedUnitParseError`: Raised (as a ``ValueError``) when an expression cannot be parsed.
 
 Constants:
 - `TERAI_TO_SQ_M`: Dictionary mapping Terai land units to their square meter equivalents.
 - `HILLY_TO_SQ_M`: Dictionary mapping Hilly land units to their square meter equivalents.
 """
 
-from .terai import terai_to_sq_meters
-from .hilly import hilly_to_sq_meters
+from .._cache import LRUCache
+from .._parsing import MixedUnitParseError, sum_pairs, sum_positional
+from .aliases import alias_factors
 from .constants import TERAI_TO_SQ_M, HILLY_TO_SQ_M
 
+# Unit factors keyed on every alias of each unit ('रोपनी', 'ropanis', 'dam', ...), so a token is
+# resolved with a single dictionary lookup.
+_FACTORS = {"Terai": alias_factors(TERAI_TO_SQ_M), "Hilly": alias_factors(HILLY_TO_SQ_M)}
+
+# Units and square meter factors of each position in dash notation, largest unit first
+_TERAI_DASH_UNITS = tuple(TERAI_TO_SQ_M)
+_TERAI_DASH_FACTORS = tuple(TERAI_TO_SQ_M.values())
+_HILLY_DASH_UNITS = tuple(HILLY_TO_SQ_M)
+_HILLY_DASH_FACTORS = tuple(HILLY_TO_SQ_M.values())
+
+
+def _parse(expression: str, system: str) -> float:
+    return sum_pairs(expression, _FACTORS[system], system)
+
+
+# Parsed expressions keyed on (lowercased expression, system). Land records repeat the same
+# strings heavily, so most parses are served from here.
+_PARSE_CACHE = LRUCache(_parse, maxsize=4096)
+
+
+def _cached_parse(expression: str, system: str) -> float:
+    try:
+        return _PARSE_CACHE.call(expression.lower(), system)
+    except MixedUnitParseError:
+        # Errors are not cached. Parse the caller's text again so that the error shows it, not
+        # the lowercased key.
+        _parse(expression, system)
+        raise
+
+
+def parse_cache_info():
+    """
+    Returns the hit, miss and eviction counters of the mixed-unit parse cache.
+
+    :return: A named tuple with fields `hits`, `misses`, `evictions`, `maxsize` and `currsize`.
+    :rtype: CacheInfo
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import mixed_units
+        mixed_units.parse_hilly_mixed_unit("1 ropani")
+        print(mixed_units.parse_cache_info())
+    """
+    return _PARSE_CACHE.info()
+
+
+def clear_parse_cache() -> None:
+    """
+    Empties the mixed-unit parse cache and resets its counters.
+    """
+    _PARSE_CACHE.clear()
+
+
+def set_parse_cache_size(maxsize: int) -> None:
+    """
+    Sets how many parsed expressions are kept. The default is 4096; 0 disables the cache.
+    Changing the size empties the cache.
+
+    :param maxsize: Maximum number of cached expressions (must be a non-negative integer).
+    :type maxsize: int
+
+    :raises ValueError:
+        - If `maxsize` is negative or not an integer.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import mixed_units
+        mixed_units.set_parse_cache_size(maxsize = 100_000)
+    """
+    _PARSE_CACHE.resize(maxsize)
+
 
 def parse_terai_mixed_unit(expression: str) -> float:
     """
     Parses a mixed Terai land measurement expression into total square meters.
 
+    Pairs may be separated by spaces or commas, and a value may be glued to its unit
+    (e.g., '1bigha, 5kattha').
+
     :param expression: A string representing a Terai mixed-unit value (e.g., '1 bigha 5 kattha 10 dhur').
     :type expression: str
     :return: The equivalent area in square meters.
     :rtype: float
 
-    :raises ValueError:
+    :raises MixedUnitParseError: A ``ValueError`` whose `position` attribute points at the problem:
         - If the input string format is incorrect.
         - If an unsupported unit is encountered.
         - If any value in the expression is negative.
@@ -45,37 +134,22 @@ def parse_terai_mixed_unit(expression: str) -> float:
         result = mixed_units.parse_terai_mixed_unit(expression = "1 bigha 5 kattha 10 dhur")
         print(result) 
     """
-    parts = expression.lower().split()
-    if len(parts) % 2 != 0:
-        raise ValueError("Terai mixed-unit string must have pairs of (value, unit).")
-
-    total_m2 = 0.0
-    for i in range(0, len(parts), 2):
-        val_str = parts[i]
-        unit_str = parts[i + 1]
-        try:
-            val = float(val_str)
-            if val < 0:
-                raise ValueError("Input value must be non-negative.")
-        except ValueError as e:
-            if "non-negative" in str(e):
-                raise
-            raise ValueError(f"Invalid numeric value '{val_str}' in '{expression}'")
-
-        total_m2 += terai_to_sq_meters(val, unit_str)
-    return total_m2
+    return _cached_parse(expression, "Terai")
 
 
 def parse_hilly_mixed_unit(expression: str) -> float:
     """
     Parses a mixed Hilly land measurement expression into total square meters.
 
+    Pairs may be separated by spaces or commas, and a value may be glued to its unit
+    (e.g., '2ropani, 3aana').
+
     :param expression: A string representing a Hilly mixed-unit value (e.g., '2 ropani 3 aana 2 paisa').
     :type expression: str
     :return: The equivalent area in square meters.
     :rtype: float
 
-    :raises ValueError:
+    :raises MixedUnitParseError: A ``ValueError`` whose `position` attribute points at the problem:
         - If the input string format is incorrect.
         - If an unsupported unit is encountered.
         - If any value in the expression is negative.
@@ -89,25 +163,7 @@ def parse_hilly_mixed_unit(expression: str) -> float:
         print(result) 
     """
 
-    parts = expression.lower().split()
-    if len(parts) % 2 != 0:
-        raise ValueError("Hilly mixed-unit string must have pairs of (value, unit).")
-
-    total_m2 = 0.0
-    for i in range(0, len(parts), 2):
-        val_str = parts[i]
-        unit_str = parts[i + 1]
-        try:
-            val = float(val_str)
-            if val < 0:
-                raise ValueError("Input value must be non-negative.")
-        except ValueError as e:
-            if "non-negative" in str(e):
-                raise
-            raise ValueError(f"Invalid numeric value '{val_str}' in '{expression}'")
-
-        total_m2 += hilly_to_sq_meters(val, unit_str)
-    return total_m2
+    return _cached_parse(expression, "Hilly")
 
 
 def sq_meters_to_terai_mixed(area_m2: float, precision: int = 4) -> str:
@@ -264,3 +320,135 @@ def terai_mixed_to_hilly_mixed(expression: str, precision: int = 4) -> str:
         raise ValueError("Precision must be non-negative.")
     area_m2 = parse_terai_mixed_unit(expression)
     return sq_meters_to_hilly_mixed(area_m2, precision)
+
+
+def parse_terai_dash(expression: str) -> float:
+    """
+    Parses a Terai area in positional dash notation, bigha-kattha-dhur, into square meters.
+
+    :param expression: Three non-negative numbers separated by dashes (e.g., '1-5-10').
+    :type expression: str
+    :return: The equivalent area in square meters.
+    :rtype: float
+
+    :raises MixedUnitParseError: A ``ValueError`` whose `position` attribute points at the problem:
+        - If the expression does not have exactly three values.
+        - If any value is not a non-negative number.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import mixed_units
+        result = mixed_units.parse_terai_dash(expression = "1-5-10")
+        print(result)
+    """
+    return sum_positional(expression, _TERAI_DASH_FACTORS, _TERAI_DASH_UNITS, "Terai")
+
+
+def parse_hilly_dash(expression: str) -> float:
+    """
+    Parses a Hilly area in positional dash notation, ropani-aana-paisa-daam, into square meters.
+
+    :param expression: Four non-negative numbers separated by dashes (e.g., '2-3-1-0').
+    :type expression: str
+    :return: The equivalent area in square meters.
+    :rtype: float
+
+    :raises MixedUnitParseError: A ``ValueError`` whose `position` attribute points at the problem:
+        - If the expression does not have exactly four values.
+        - If any value is not a non-negative number.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import mixed_units
+        result = mixed_units.parse_hilly_dash(expression = "2-3-1-0")
+        print(result)
+    """
+    return sum_positional(expression, _HILLY_DASH_FACTORS, _HILLY_DASH_UNITS, "Hilly")
+
+
+def _format_dash_value(value: float, precision: int) -> str:
+    # At most `precision` decimals, without trailing zeros ('0', '2.5')
+    text = f"{value:.{precision}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return text
+
+
+def _format_dash(area_m2: float, table: dict, precision: int) -> str:
+    if not isinstance(area_m2, (int, float)):
+        raise ValueError("Input area must be a number.")
+    if area_m2 < 0:
+        raise ValueError("Input area must be non-negative.")
+    if precision < 0:
+        raise ValueError("Precision must be non-negative.")
+
+    sizes = list(table.values())
+    parts = []
+    remainder = area_m2
+    for size in sizes[:-1]:
+        parts.append(str(int(remainder // size)))
+        remainder = remainder % size
+    parts.append(_format_dash_value(round(remainder / sizes[-1], precision), precision))
+    return "-".join(parts)
+
+
+def sq_meters_to_terai_dash(area_m2: float, precision: int = 4) -> str:
+    """
+    Converts a given area in square meters to Terai dash notation, bigha-kattha-dhur.
+
+    Bigha and kattha are whole numbers; dhur is rounded to `precision` decimal places and written
+    without trailing zeros.
+
+    :param area_m2: The area in square meters (must be non-negative).
+    :type area_m2: float
+    :param precision: Number of decimal places for dhur rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: The equivalent area in dash notation (e.g., '1-5-10').
+    :rtype: str
+
+    :raises ValueError:
+        - If `area_m2` is negative or not a number.
+        - If `precision` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import mixed_units
+        result = mixed_units.sq_meters_to_terai_dash(area_m2 = 8632.08, precision = 2)
+        print(result)
+    """
+    return _format_dash(area_m2, TERAI_TO_SQ_M, precision)
+
+
+def sq_meters_to_hilly_dash(area_m2: float, precision: int = 4) -> str:
+    """
+    Converts a given area in square meters to Hilly dash notation, ropani-aana-paisa-daam.
+
+    Ropani, aana and paisa are whole numbers; daam is rounded to `precision` decimal places and
+    written without trailing zeros.
+
+    :param area_m2: The area in square meters (must be non-negative).
+    :type area_m2: float
+    :param precision: Number of decimal places for daam rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: The equivalent area in dash notation (e.g., '2-3-1-0').
+    :rtype: str
+
+    :raises ValueError:
+        - If `area_m2` is negative or not a number.
+        - If `precision` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import mixed_units
+        result = mixed_units.sq_meters_to_hilly_dash(area_m2 = 1082.55, precision = 2)
+        print(result)
+    """
+    return _format_dash(area_m2, HILLY_TO_SQ_M, precision)
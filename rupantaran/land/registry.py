@@ -0,0 +1,136 @@
+"""
+registry.py
+
+This module provides a registry of every land unit (Terai, Hilly and square meters) with a dense
+matrix of conversion factors between all pairs, computed once at import. Converters returned by
+`get_converter` are bound to a single factor, so a hot loop can fetch one once and apply it to
+millions of values without any per-call string handling.
+
+Factors between two units of the same system come from `TERAI_CONVERSION_FACTORS` and
+`HILLY_CONVERSION_FACTORS` (as in `terai_to_terai` and `hilly_to_hilly`). Every other pair goes
+through the square meter areas in `TERAI_TO_SQ_M` and `HILLY_TO_SQ_M`.
+
+Functions:
+- `get_factor`: Returns the factor that converts a value in one land unit to another.
+- `get_converter`: Returns a callable converting values from one land unit to another.
+
+Constants:
+- `LAND_UNITS`: Tuple of all land unit names, Terai first, then Hilly, then 'sq_m'.
+- `UNIT_INDEX`: Dictionary mapping each land unit name to its row/column in `FACTOR_MATRIX`.
+- `FACTOR_MATRIX`: Tuple of rows; ``FACTOR_MATRIX[i][j]`` converts unit ``i`` to unit ``j``.
+"""
+
+from .aliases import canonical_unit
+from .constants import (
+    TERAI_TO_SQ_M,
+    HILLY_TO_SQ_M,
+    TERAI_CONVERSION_FACTORS,
+    HILLY_CONVERSION_FACTORS,
+)
+
+SQ_M = "sq_m"
+
+LAND_UNITS = tuple(TERAI_TO_SQ_M) + tuple(HILLY_TO_SQ_M) + (SQ_M,)
+
+UNIT_INDEX = {unit: i for i, unit in enumerate(LAND_UNITS)}
+
+
+def _build_factor_matrix() -> tuple:
+    sq_m_per_unit = {**TERAI_TO_SQ_M, **HILLY_TO_SQ_M, SQ_M: 1.0}
+    rows = []
+    for from_unit in LAND_UNITS:
+        row = []
+        for to_unit in LAND_UNITS:
+            if from_unit in TERAI_CONVERSION_FACTORS and to_unit in TERAI_CONVERSION_FACTORS:
+                factor = TERAI_CONVERSION_FACTORS[from_unit][to_unit]
+            elif from_unit in HILLY_CONVERSION_FACTORS and to_unit in HILLY_CONVERSION_FACTORS:
+                factor = HILLY_CONVERSION_FACTORS[from_unit][to_unit]
+            elif to_unit == SQ_M:
+                factor = sq_m_per_unit[from_unit]
+            else:
+                factor = sq_m_per_unit[from_unit] / sq_m_per_unit[to_unit]
+            row.append(float(factor))
+        rows.append(tuple(row))
+    return tuple(rows)
+
+
+FACTOR_MATRIX = _build_factor_matrix()
+
+
+def _index(unit: str) -> int:
+    index = UNIT_INDEX.get(canonical_unit(unit))
+    if index is None:
+        raise ValueError(f"Unsupported land unit: {unit}")
+    return index
+
+
+def get_factor(from_unit: str, to_unit: str) -> float:
+    """
+    Returns the factor that converts a value in `from_unit` to `to_unit`.
+
+    :param from_unit: The source land unit (e.g., 'bigha', 'ropani', 'sq_m').
+    :type from_unit: str
+    :param to_unit: The target land unit (e.g., 'kattha', 'aana', 'sq_m').
+    :type to_unit: str
+    :return: The multiplication factor.
+    :rtype: float
+
+    :raises ValueError:
+        - If either `from_unit` or `to_unit` is not a recognized land unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import registry
+        print(registry.get_factor(from_unit = "bigha", to_unit = "aana"))
+    """
+    return FACTOR_MATRIX[_index(from_unit)][_index(to_unit)]
+
+
+def get_converter(from_unit: str, to_unit: str, precision: int = None):
+    """
+    Returns a callable that converts a value from `from_unit` to `to_unit`.
+
+    The units are resolved once here. The returned callable only multiplies by the precomputed
+    factor (and rounds, if `precision` is given); it does not validate its input, so it accepts
+    anything that can be multiplied by a float, including NumPy arrays. The factor is available
+    as its `factor` attribute.
+
+    :param from_unit: The source land unit (e.g., 'bigha', 'ropani', 'sq_m').
+    :type from_unit: str
+    :param to_unit: The target land unit (e.g., 'kattha', 'aana', 'sq_m').
+    :type to_unit: str
+    :param precision: Number of decimal places to round results to. Default is no rounding.
+    :type precision: int, optional
+    :return: A function of one argument returning the converted value.
+    :rtype: Callable
+
+    :raises ValueError:
+        - If either `from_unit` or `to_unit` is not a recognized land unit.
+        - If `precision` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import registry
+        bigha_to_ropani = registry.get_converter(from_unit = "bigha", to_unit = "ropani", precision = 2)
+        print([bigha_to_ropani(v) for v in (1, 2.5, 10)])
+    """
+    factor = get_factor(from_unit, to_unit)
+    if precision is None:
+
+        def convert(value):
+            return value * factor
+
+    else:
+        if precision < 0:
+            raise ValueError("Precision must be non-negative.")
+
+        def convert(value):
+            return round(value * factor, precision)
+
+    convert.factor = factor
+    convert.__name__ = f"{canonical_unit(from_unit)}_to_{canonical_unit(to_unit)}"
+    return convert
@@ -0,0 +1,237 @@
+"""
+stream.py
+
+This module converts land-area columns of CSV/TSV files of any size. Rows are read in chunks of a
+fixed number of rows, each chunk is converted with the array functions of `batch`, and the rows
+are written out with the converted value appended before the next chunk is read. Memory use
+therefore depends on the chunk size only, not on the size of the file.
+
+The source column holds either numbers in a land unit, mixed-unit expressions ('hilly' or
+'terai'), or numbers whose unit is given per row in a second column. The output is a land unit
+(including 'sq_m') or a mixed-unit expression of either system.
+
+Functions:
+- `iter_convert_csv`: Converts a file chunk by chunk, yielding a `StreamReport` per chunk.
+- `convert_csv`: Converts a whole file and returns a `StreamReport` for the run.
+
+Constants:
+- `MIXED_FORMATS`: Names accepted for mixed-unit expression columns ('terai', 'hilly').
+"""
+
+import csv
+import time
+from collections import namedtuple
+from itertools import islice
+
+from .._arrays import np, as_value_array, check_precision, round_like_python
+from . import batch
+from .aliases import canonical_unit
+from .registry import LAND_UNITS, SQ_M, get_factor
+
+MIXED_FORMATS = ("terai", "hilly")
+
+StreamReport = namedtuple("StreamReport", ["rows", "total_rows", "seconds", "rows_per_second"])
+StreamReport.__doc__ = """
+Progress of a streaming conversion: `rows` converted in `seconds` (for one chunk, or for the whole
+run), `total_rows` converted so far, and the resulting `rows_per_second`.
+"""
+
+_PARSERS = {"terai": batch.parse_terai_mixed_unit, "hilly": batch.parse_hilly_mixed_unit}
+_FORMATTERS = {"terai": batch.sq_meters_to_terai_mixed, "hilly": batch.sq_meters_to_hilly_mixed}
+
+
+def _check_unit(unit: str, name: str) -> str:
+    unit_lower = canonical_unit(unit)
+    if unit_lower not in LAND_UNITS and unit_lower not in MIXED_FORMATS:
+        raise ValueError(f"Unsupported {name}: {unit}")
+    return unit_lower
+
+
+def _numbers(strings: list):
+    try:
+        values = np.array(strings, dtype=np.float64)
+    except ValueError:
+        raise ValueError("Input value must be a number.") from None
+    return as_value_array(values, "value")
+
+
+def _make_converter(from_unit, to_unit: str, precision: int):
+    """
+    Returns a function converting one chunk (a list of value strings, and a list of unit strings
+    or None) to a list of output values.
+    """
+
+    def to_sq_meters(values: list, units):
+        if from_unit in MIXED_FORMATS:
+            return _PARSERS[from_unit](values)
+        numbers = _numbers(values)
+        if units is None:
+            return numbers * get_factor(from_unit, SQ_M)
+        names, inverse = np.unique(np.char.lower(np.array(units, dtype=str)), return_inverse=True)
+        factors = np.array([get_factor(name, SQ_M) for name in names.tolist()])
+        return numbers * factors[inverse.reshape(-1)]
+
+    def convert(values: list, units) -> list:
+        if to_unit in MIXED_FORMATS:
+            return _FORMATTERS[to_unit](to_sq_meters(values, units), precision, as_strings=True)
+        if units is None and from_unit not in MIXED_FORMATS:
+            # One unit to another: a single precomputed factor, no square meter step.
+            result = _numbers(values) * get_factor(from_unit, to_unit)
+        else:
+            result = to_sq_meters(values, units) * get_factor(SQ_M, to_unit)
+        return round_like_python(result, precision).tolist()
+
+    return convert
+
+
+def _open(file, mode: str):
+    if hasattr(file, "read") or hasattr(file, "write"):
+        return file, False
+    return open(file, mode, newline="", encoding="utf-8"), True
+
+
+def _column_index(header: list, column: str) -> int:
+    if column not in header:
+        raise ValueError(f"Column '{column}' not found in header.")
+    return header.index(column)
+
+
+def iter_convert_csv(
+    source,
+    destination,
+    column: str,
+    from_unit: str = None,
+    to_unit: str = "sq_m",
+    unit_column: str = None,
+    output_column: str = None,
+    precision: int = 4,
+    chunk_size: int = 10_000,
+    delimiter: str = ",",
+):
+    """
+    Converts a land-area column of a delimited file, one chunk of rows at a time.
+
+    The output file has every input column plus one column with the converted value. Nothing is
+    read or written until the generator is iterated, and each iteration converts one chunk.
+
+    :param source: Path or open text file of the input. It must start with a header row.
+    :param destination: Path or open text file for the output.
+    :param column: Name of the column to convert.
+    :type column: str
+    :param from_unit: Unit of `column`: a land unit (e.g., 'bigha', 'sq_m') for numbers, or
+        'hilly'/'terai' for mixed-unit expressions. Leave as None when `unit_column` is given.
+    :type from_unit: str, optional
+    :param to_unit: Target land unit (e.g., 'ropani', 'sq_m'), or 'hilly'/'terai' for mixed-unit
+        expressions. Default is 'sq_m'.
+    :type to_unit: str, optional
+    :param unit_column: Name of a column holding the land unit of each row's value.
+    :type unit_column: str, optional
+    :param output_column: Name of the added column. Default is '<column>_<to_unit>'.
+    :type output_column: str, optional
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param chunk_size: Number of rows converted at a time. Default is 10,000.
+    :type chunk_size: int, optional
+    :param delimiter: Field delimiter, e.g. '\\t' for TSV. Default is ','.
+    :type delimiter: str, optional
+    :return: A generator yielding a `StreamReport` after each chunk is written.
+    :rtype: Iterator[StreamReport]
+
+    :raises ValueError:
+        - If a unit, a column name, `precision` or `chunk_size` is invalid.
+        - If a row cannot be converted; the message gives the row range of the chunk.
+        - If a row is too short to hold the value or unit column; the message gives its number.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import stream
+        for report in stream.iter_convert_csv("parcels.csv", "out.csv", column = "area",
+                                              from_unit = "hilly", to_unit = "terai"):
+            print(f"{report.total_rows} rows, {report.rows_per_second:,.0f} rows/s")
+    """
+    check_precision(precision)
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+    if (from_unit is None) == (unit_column is None):
+        raise ValueError("Give exactly one of from_unit and unit_column.")
+    if from_unit is not None:
+        from_unit = _check_unit(from_unit, "source unit")
+    to_unit = _check_unit(to_unit, "target unit")
+    convert = _make_converter(from_unit, to_unit, precision)
+
+    src, close_src = _open(source, "r")
+    try:
+        dst, close_dst = _open(destination, "w")
+        try:
+            reader = csv.reader(src, delimiter=delimiter)
+            writer = csv.writer(dst, delimiter=delimiter, lineterminator="\n")
+            header = next(reader, None)
+            if header is None:
+                return
+            value_index = _column_index(header, column)
+            unit_index = None if unit_column is None else _column_index(header, unit_column)
+            writer.writerow(header + [output_column or f"{column}_{to_unit}"])
+
+            total_rows = 0
+            while True:
+                started = time.perf_counter()
+                rows = list(islice(reader, chunk_size))
+                if not rows:
+                    break
+                try:
+                    values = [row[value_index] for row in rows]
+                    units = None if unit_index is None else [row[unit_index] for row in rows]
+                except IndexError:
+                    raise _short_row(rows, total_rows, max(value_index, unit_index or 0)) from None
+                try:
+                    results = convert(values, units)
+                except ValueError as exc:
+                    first = total_rows + 1
+                    raise ValueError(f"Rows {first}-{first + len(rows) - 1}: {exc}") from exc
+                writer.writerows(row + [result] for row, result in zip(rows, results))
+                total_rows += len(rows)
+                seconds = time.perf_counter() - started
+                yield StreamReport(len(rows), total_rows, seconds, len(rows) / seconds)
+        finally:
+            if close_dst:
+                dst.close()
+    finally:
+        if close_src:
+            src.close()
+
+
+def _short_row(rows: list, rows_before: int, last_index: int) -> ValueError:
+    """Returns the error for the first row of a chunk that lacks a converted column."""
+    for number, row in enumerate(rows, rows_before + 1):
+        if len(row) <= last_index:
+            return ValueError(
+                f"Row {number}: expected at least {last_index + 1} columns, got {len(row)}."
+            )
+
+
+def convert_csv(source, destination, column: str, **kwargs) -> StreamReport:
+    """
+    Converts a land-area column of a delimited file in one call.
+
+    Takes the same arguments as `iter_convert_csv` and runs it to completion.
+
+    :return: A `StreamReport` for the whole run.
+    :rtype: StreamReport
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import stream
+        report = stream.convert_csv("parcels.tsv", "out.tsv", column = "area", from_unit = "bigha",
+                                    to_unit = "ropani", delimiter = "\\t")
+        print(f"{report.rows} rows at {report.rows_per_second:,.0f} rows/s")
+    """
+    started = time.perf_counter()
+    total_rows = 0
+    for report in iter_convert_csv(source, destination, column, **kwargs):
+        total_rows = report.total_rows
+    seconds = time.perf_counter() - started
+    return StreamReport(total_rows, total_rows, seconds, total_rows / seconds if seconds else 0.0)
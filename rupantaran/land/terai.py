@@ -15,6 +15,7 @@ Constants:
 - `TERAI_CONVERSION_FACTORS`: Nested dictionary containing direct conversion ratios between Terai land units.
 """
 
+from .aliases import canonical_unit
 from .constants import TERAI_TO_SQ_M, TERAI_CONVERSION_FACTORS
 
 
@@ -52,7 +53,7 @@ def terai_to_sq_meters(value: float, from_unit: str, precision: int = 4) -> floa
     if precision < 0:
         raise ValueError("Precision must be non-negative.")
 
-    unit_lower = from_unit.lower()
+    unit_lower = canonical_unit(from_unit)
     if unit_lower not in TERAI_TO_SQ_M:
         raise ValueError(f"Unsupported Terai unit: {from_unit}")
 
@@ -92,7 +93,7 @@ def sq_meters_to_terai(area_m2: float, to_unit: str, precision: int = 4) -> floa
     if precision < 0:
         raise ValueError("Precision must be non-negative.")
 
-    unit_lower = to_unit.lower()
+    unit_lower = canonical_unit(to_unit)
     if unit_lower not in TERAI_TO_SQ_M:
         raise ValueError(f"Unsupported Terai unit: {to_unit}")
 
@@ -133,8 +134,8 @@ def terai_to_terai(value: float, from_unit: str, to_unit: str, precision: int =
         raise ValueError("Input value must be non-negative.")
     if precision < 0:
         raise ValueError("Precision must be non-negative.")
-    from_unit = from_unit.lower()
-    to_unit = to_unit.lower()
+    from_unit = canonical_unit(from_unit)
+    to_unit = canonical_unit(to_unit)
     if (from_unit not in TERAI_CONVERSION_FACTORS 
         or to_unit not in TERAI_CONVERSION_FACTORS[from_unit]):
         raise ValueError("Invalid Terai land unit provided.")
@@ -0,0 +1,340 @@
+"""
+masked.py
+
+This module converts whole columns without stopping at the first bad row. Each function returns
+a `MaskedResult`: a float64 array of results, with NaN in every row that could not be converted,
+and a uint8 array holding one error code per row (`OK` for good rows). Bad rows never raise, so a
+batch job neither wraps each row in ``try``/``except`` nor aborts on the first bad value.
+
+Numeric input is validated with whole-array comparisons; infinite values, and results too large
+to be finite, are masked like any other bad row. Units may be given once for the whole column or
+per row, in which case each distinct unit name is resolved once. Expressions are parsed once per
+distinct string. A bad argument that applies to every row (an unknown unit given for the whole
+column, a negative precision, a column with more than one dimension) still raises ``ValueError``.
+
+Requires NumPy (``pip install rupantaran[numpy]``).
+
+Classes:
+- `MaskedResult`: Converted values with a per-row error code array and a report of bad rows.
+
+Functions:
+- `check_values`: Validates a column of numbers, returning it as float64 with error codes.
+- `convert_land`: Converts a column between land units of either system.
+- `convert_weight`: Converts a column between weight units.
+- `parse_hilly`: Parses a column of Hilly mixed-unit expressions into square meters.
+- `parse_terai`: Parses a column of Terai mixed-unit expressions into square meters.
+- `parse_weight`: Parses a column of mixed weight expressions into grams.
+
+Constants:
+- `OK`, `MISSING`, `NOT_A_NUMBER`, `NEGATIVE`, `UNSUPPORTED_UNIT`, `UNPARSEABLE`, `NOT_FINITE`,
+  `OVERFLOW`: Error codes.
+- `ERROR_REASONS`: Dictionary mapping each error code to a description.
+"""
+
+from collections import namedtuple
+
+from ._arrays import np, check_precision, round_like_python
+from .land import mixed_units as land_mixed_units
+from .land import registry as land_registry
+from .land.aliases import canonical_unit
+from .weight import mixed_units as weight_mixed_units
+from .weight import registry as weight_registry
+
+OK = 0
+MISSING = 1
+NOT_A_NUMBER = 2
+NEGATIVE = 3
+UNSUPPORTED_UNIT = 4
+UNPARSEABLE = 5
+NOT_FINITE = 6
+OVERFLOW = 7
+
+ERROR_REASONS = {
+    OK: "ok",
+    MISSING: "value is missing",
+    NOT_A_NUMBER: "value is not a number",
+    NEGATIVE: "value is negative",
+    UNSUPPORTED_UNIT: "unit is not supported",
+    UNPARSEABLE: "expression cannot be parsed",
+    NOT_FINITE: "value is not finite",
+    OVERFLOW: "value is too large",
+}
+
+_NUMBER_TYPES = (int, float, np.integer, np.floating)
+
+_INF = float("inf")
+
+_LAND_MATRIX = np.array(land_registry.FACTOR_MATRIX)
+_WEIGHT_MATRIX = np.array(weight_registry.FACTOR_MATRIX)
+
+
+class MaskedResult(namedtuple("MaskedResult", ["values", "errors"])):
+    """
+    Result of a masked conversion: `values` is a float64 array with NaN in bad rows, `errors` a
+    uint8 array with the error code of every row (`OK` for good rows).
+    """
+
+    __slots__ = ()
+
+    @property
+    def valid(self):
+        """Boolean array, true for the rows converted without error."""
+        return self.errors == OK
+
+    def report(self, limit: int = None) -> list:
+        """
+        Lists the bad rows with the reason each one failed.
+
+        :param limit: Report at most this many rows. Default is all.
+        :type limit: int, optional
+        :return: (row index, error code, reason) for each bad row, in row order.
+        :rtype: list[tuple[int, int, str]]
+        """
+        rows = np.flatnonzero(self.errors)
+        if limit is not None:
+            rows = rows[:limit]
+        codes = self.errors[rows].tolist()
+        return [(row, code, ERROR_REASONS[code]) for row, code in zip(rows.tolist(), codes)]
+
+
+def _code(x) -> int:
+    if isinstance(x, _NUMBER_TYPES) and not isinstance(x, bool):
+        return OK
+    return MISSING if x is None else NOT_A_NUMBER
+
+
+def _check_numbers(values) -> tuple:
+    arr = np.asarray(values)
+    if arr.dtype.kind not in "biufO" and not isinstance(values, np.ndarray):
+        # A list mixing numbers and strings would otherwise become an array of strings
+        arr = np.array(values, dtype=object)
+    if arr.ndim > 1:
+        raise ValueError("Input values must be one-dimensional.")
+    if not arr.ndim:
+        arr = arr.reshape(1)
+    kind = arr.dtype.kind
+    if kind in "iuf":
+        numbers = arr.astype(np.float64)
+        errors = np.zeros(len(numbers), dtype=np.uint8)
+    elif kind == "O":
+        items = arr.tolist()
+        errors = np.fromiter(map(_code, items), dtype=np.uint8, count=len(items))
+        numbers = np.full(len(items), np.nan)
+        for i in np.flatnonzero(errors == OK).tolist():
+            try:
+                numbers[i] = float(items[i])
+            except OverflowError:
+                # A Python integer beyond the float range, e.g. from a JSON document
+                errors[i] = OVERFLOW
+    else:
+        # Booleans (rejected, as by the scalar checks), strings, dates and other non-numeric arrays
+        numbers = np.full(len(arr), np.nan)
+        errors = np.full(len(arr), NOT_A_NUMBER, dtype=np.uint8)
+    errors[np.isnan(numbers) & (errors == OK)] = MISSING
+    errors[np.isinf(numbers)] = NOT_FINITE
+    errors[numbers < 0] = NEGATIVE
+    return numbers, errors
+
+
+def _mask(values, errors):
+    values[errors != OK] = np.nan
+    return MaskedResult(values, errors)
+
+
+def check_values(values) -> MaskedResult:
+    """
+    Validates a column of numbers without raising on bad rows.
+
+    Rows that are None or NaN are `MISSING`; rows that are not numbers (strings and booleans
+    included) are `NOT_A_NUMBER`; negative rows are `NEGATIVE`; infinite rows are `NOT_FINITE`;
+    integers too large for a float are `OVERFLOW`.
+
+    :param values: A one-dimensional NumPy array, list, tuple or buffer-protocol object.
+    :return: The values as float64, NaN in bad rows, and their error codes.
+    :rtype: MaskedResult
+
+    :raises ValueError:
+        - If `values` has more than one dimension.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran import masked
+        result = masked.check_values([2.5, -1, "x", None])
+        print(result.values, result.report())
+    """
+    return _mask(*_check_numbers(values))
+
+
+def _unit_indices(units, index: dict, resolve, length: int, system: str) -> tuple:
+    """
+    Resolves a unit name, or one unit name per row, to rows of a factor matrix. Returns the
+    indices and a boolean array of rows whose unit is not supported (None for a single unit).
+    """
+    if isinstance(units, str):
+        position = index.get(resolve(units))
+        if position is None:
+            raise ValueError(f"Unsupported {system} unit: {units}")
+        return position, None
+    names = np.asarray(units, dtype=object).reshape(-1)
+    if len(names) != length:
+        raise ValueError(f"Expected {length} units, got {len(names)}.")
+    distinct, inverse = np.unique(names.astype(str), return_inverse=True)
+    positions = np.array(
+        [index.get(resolve(name), -1) for name in distinct.tolist()], dtype=np.intp
+    )[inverse.reshape(-1)]
+    unsupported = positions < 0
+    positions[unsupported] = 0
+    return positions, unsupported
+
+
+def _convert(values, from_unit, to_unit, precision, matrix, index, resolve, system) -> MaskedResult:
+    if precision is not None:
+        check_precision(precision)
+    numbers, errors = _check_numbers(values)
+    length = len(numbers)
+    rows, bad_rows = _unit_indices(from_unit, index, resolve, length, system)
+    columns, bad_columns = _unit_indices(to_unit, index, resolve, length, system)
+    for bad in (bad_rows, bad_columns):
+        if bad is not None:
+            errors[bad & (errors == OK)] = UNSUPPORTED_UNIT
+    # Bad rows are masked at the end; zero them so NaNs do not take the slow rounding path
+    numbers[errors != OK] = 0.0
+    with np.errstate(over="ignore"):
+        numbers *= matrix[rows, columns]
+    overflow = ~np.isfinite(numbers)
+    if overflow.any():
+        errors[overflow] = OVERFLOW
+        numbers[overflow] = 0.0
+    if precision is not None:
+        round_like_python(numbers, precision, out=numbers)
+    return _mask(numbers, errors)
+
+
+def convert_land(values, from_unit, to_unit, precision: int = 4) -> MaskedResult:
+    """
+    Converts a column between any two land units ('bigha', 'ropani', 'sq_m', ...), with one
+    multiply by the factor from `land.registry` and a single rounding. Bad rows are masked.
+
+    :param values: The values to convert.
+    :param from_unit: The source land unit, or a sequence with one unit name per row.
+    :type from_unit: str or sequence
+    :param to_unit: The target land unit, or a sequence with one unit name per row.
+    :type to_unit: str or sequence
+    :param precision: Number of decimal places to round to (must be non-negative), or None. Default is 4.
+    :type precision: int, optional
+    :return: The converted values and their error codes.
+    :rtype: MaskedResult
+
+    :raises ValueError:
+        - If a unit given for the whole column is not a recognized land unit.
+        - If a per-row unit sequence does not have one unit per value.
+        - If `values` has more than one dimension.
+        - If `precision` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran import masked
+        result = masked.convert_land([1, 2, -3], ["bigha", "ropani", "bigha"], "sq_m", precision = 2)
+        print(result.values, result.report())
+    """
+    return _convert(
+        values, from_unit, to_unit, precision, _LAND_MATRIX, land_registry.UNIT_INDEX, canonical_unit, "land"
+    )
+
+
+def convert_weight(values, from_unit, to_unit, precision: int = 4) -> MaskedResult:
+    """
+    Converts a column between any two weight units ('tola', 'sher', 'kg', ...), as
+    `weight.convert` does for one value. Bad rows are masked.
+
+    :param values: The values to convert.
+    :param from_unit: The source weight unit, or a sequence with one unit name per row.
+    :type from_unit: str or sequence
+    :param to_unit: The target weight unit, or a sequence with one unit name per row.
+    :type to_unit: str or sequence
+    :param precision: Number of decimal places to round to (must be non-negative), or None. Default is 4.
+    :type precision: int, optional
+    :return: The converted values and their error codes.
+    :rtype: MaskedResult
+
+    :raises ValueError:
+        - If a unit given for the whole column is not a recognized weight unit.
+        - If a per-row unit sequence does not have one unit per value.
+        - If `values` has more than one dimension.
+        - If `precision` is negative.
+    """
+    return _convert(
+        values, from_unit, to_unit, precision, _WEIGHT_MATRIX, weight_registry.UNIT_INDEX, str.lower, "weight"
+    )
+
+
+def _parse(expressions, parse) -> MaskedResult:
+    items = list(expressions)
+    parsed = {}
+    values = np.empty(len(items))
+    errors = np.zeros(len(items), dtype=np.uint8)
+    for i, expression in enumerate(items):
+        if isinstance(expression, str):
+            result = parsed.get(expression)
+            if result is None:
+                try:
+                    area = parse(expression)
+                    result = (area, OK) if area < _INF else (np.nan, OVERFLOW)
+                except ValueError:
+                    result = (np.nan, UNPARSEABLE)
+                parsed[expression] = result
+        elif expression is None or expression != expression:
+            # None, or a NaN marking a missing row
+            result = (np.nan, MISSING)
+        else:
+            result = (np.nan, UNPARSEABLE)
+        values[i], errors[i] = result
+    return MaskedResult(values, errors)
+
+
+def parse_hilly(expressions) -> MaskedResult:
+    """
+    Parses a column of Hilly mixed-unit expressions ('2 ropani 3 aana') into square meters. Each
+    distinct string is parsed once; rows that cannot be parsed are masked.
+
+    :param expressions: An iterable of expressions.
+    :return: The areas in square meters and their error codes.
+    :rtype: MaskedResult
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran import masked
+        result = masked.parse_hilly(["2 ropani 3 aana", "2 bigha", None])
+        print(result.values, result.report())
+    """
+    return _parse(expressions, land_mixed_units.parse_hilly_mixed_unit)
+
+
+def parse_terai(expressions) -> MaskedResult:
+    """
+    Parses a column of Terai mixed-unit expressions ('1 bigha 5 kattha') into square meters. Each
+    distinct string is parsed once; rows that cannot be parsed are masked.
+
+    :param expressions: An iterable of expressions.
+    :return: The areas in square meters and their error codes.
+    :rtype: MaskedResult
+    """
+    return _parse(expressions, land_mixed_units.parse_terai_mixed_unit)
+
+
+def parse_weight(expressions) -> MaskedResult:
+    """
+    Parses a column of mixed weight expressions ('2 sher 3 pau') into grams. Each distinct string
+    is parsed once; rows that cannot be parsed are masked.
+
+    :param expressions: An iterable of expressions.
+    :return: The weights in grams and their error codes.
+    :rtype: MaskedResult
+    """
+    return _parse(expressions, weight_mixed_units.parse_weight_mixed_unit)
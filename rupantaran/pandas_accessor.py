@@ -0,0 +1,417 @@
+"""
+pandas_accessor.py
+
+This module registers a ``.rupantaran`` accessor on pandas Series and DataFrames, so whole columns
+are converted with the vectorized kernels instead of ``Series.apply``. Importing the module
+registers the accessor:
+
+.. code-block:: python
+
+    import rupantaran.pandas_accessor  # noqa: F401
+    df["area_m2"] = df["holding"].rupantaran.parse_hilly()
+
+Every method converts through `rupantaran.masked`, so a row is bad under exactly the same rules:
+missing, not a number (numeric strings and booleans included), negative, infinite, not parseable,
+or a result too large to be finite. With the default ``errors="coerce"`` bad rows become NaN (None
+for string results) and every other row is converted; with ``errors="raise"`` the first bad row,
+missing rows included, is reported in a ``ValueError`` naming its index label. An unknown unit or
+a negative precision is an argument error and always raises.
+
+Mixed-unit strings are parsed once per distinct string (``pandas.factorize``), so columns that
+repeat the same few holdings cost little more than their distinct values.
+
+Requires pandas and NumPy (``pip install rupantaran[pandas]``).
+
+Classes:
+- `RupantaranSeriesAccessor`: The ``Series.rupantaran`` accessor.
+- `RupantaranFrameAccessor`: The ``DataFrame.rupantaran`` accessor; applies the Series methods to
+  several columns.
+"""
+
+try:
+    import pandas as pd
+except ImportError as exc:  # pragma: no cover - exercised only without pandas
+    raise ImportError(
+        "The pandas accessor requires pandas. Install it with `pip install rupantaran[pandas]`."
+    ) from exc
+
+from . import masked
+from ._arrays import np, check_precision, decompose_units, format_mixed_units, max_decomposable
+from .land import mixed_units as land_mixed_units
+from .land import registry as land_registry
+from .land.constants import HILLY_TO_SQ_M, TERAI_TO_SQ_M
+from .weight import mixed_units as weight_mixed_units
+
+ERRORS = ("coerce", "raise")
+
+_REASONS = {
+    masked.MISSING: "Input {} is missing.",
+    masked.NOT_A_NUMBER: "Input {} must be a number.",
+    masked.NEGATIVE: "Input {} must be non-negative.",
+    masked.NOT_FINITE: "Input {} must be finite.",
+    masked.OVERFLOW: "Input {} is too large.",
+}
+
+
+def _check_errors(errors: str) -> None:
+    if errors not in ERRORS:
+        raise ValueError(f"errors must be 'coerce' or 'raise', got {errors!r}.")
+
+
+def _column(series):
+    """
+    Returns the column as an array for `masked`: float64 for numeric columns, otherwise objects
+    with None for missing rows.
+    """
+    dtype = series.dtype
+    if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return series.to_numpy(dtype=object, na_value=None)
+
+
+def _first_error(series, result, errors: str):
+    """Returns the position of the first bad row when `errors` is 'raise', otherwise None."""
+    if errors == "raise":
+        bad = np.flatnonzero(result.errors)
+        if len(bad):
+            return int(bad[0])
+    return None
+
+
+def _values(series, result, errors: str, name: str = "value"):
+    """
+    Returns the values of a masked result, raising for the first bad row when `errors` is 'raise'.
+    """
+    position = _first_error(series, result, errors)
+    if position is not None:
+        reason = _REASONS[int(result.errors[position])].format(name)
+        raise ValueError(f"Row {series.index[position]!r}: {reason}")
+    return result.values
+
+
+def _parse(series, parse_column, parse, errors: str):
+    """
+    Parses each distinct value of the column once with the masked parser `parse_column`, and
+    reports the first bad row with the error raised by `parse` when `errors` is 'raise'.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    parsed = parse_column(np.asarray(uniques, dtype=object))
+    # Append a missing row for the code -1 of missing values to select
+    result = masked.MaskedResult(
+        np.append(parsed.values, np.nan)[codes],
+        np.append(parsed.errors, np.uint8(masked.MISSING))[codes],
+    )
+    position = _first_error(series, result, errors)
+    if position is not None:
+        label = series.index[position]
+        code = result.errors[position]
+        expression = series.iloc[position]
+        if code == masked.MISSING:
+            raise ValueError(f"Row {label!r}: Input expression is missing.")
+        if code == masked.OVERFLOW:
+            raise ValueError(f"Row {label!r}: Input expression is too large.")
+        if not isinstance(expression, str):
+            raise ValueError(f"Row {label!r}: Input expression must be a string.")
+        try:
+            parse(expression)
+        except ValueError as exc:
+            raise ValueError(f"Row {label!r}: {exc}") from exc
+    return result.values
+
+
+def _mixed_strings(series, unit_sizes: list, precision: int, errors: str, name: str, tolerance: float = 0.0):
+    """
+    Formats the valid rows of the column as mixed-unit strings; bad rows, and amounts with more
+    whole units than an int64 holds, become None.
+    """
+    check_precision(precision)
+    result = masked.check_values(_column(series))
+    result.errors[result.values >= max_decomposable(unit_sizes)] = masked.OVERFLOW
+    _values(series, result, errors, name)
+    valid = result.valid
+    strings = np.full(len(valid), None, dtype=object)
+    components = decompose_units(result.values[valid], unit_sizes, precision, tolerance)
+    strings[valid] = format_mixed_units(components, precision)
+    return strings
+
+
+class RupantaranSeriesAccessor:
+    """
+    Conversions of a whole pandas Series, available as ``series.rupantaran``. Every method returns
+    a new Series with the index and name of the original.
+    """
+
+    def __init__(self, series):
+        self._series = series
+
+    def _wrap(self, values, dtype=None):
+        series = self._series
+        return pd.Series(values, index=series.index, name=series.name, dtype=dtype)
+
+    def to_sq_meters(self, unit: str, precision: int = 4, errors: str = "coerce"):
+        """
+        Converts values in a Terai or Hilly land unit to square meters.
+
+        :param unit: The land unit of the values (e.g., 'bigha', 'ropani', 'रोपनी').
+        :type unit: str
+        :param precision: Number of decimal places to round to (must be non-negative), or None. Default is 4.
+        :type precision: int, optional
+        :param errors: 'coerce' turns bad rows into NaN; 'raise' raises on the first one. Default is 'coerce'.
+        :type errors: str, optional
+        :return: The areas in square meters.
+        :rtype: pandas.Series
+
+        :raises ValueError:
+            - If `unit` is not a recognized land unit.
+            - If `precision` is negative.
+            - If `errors` is 'raise' and a row is not a finite non-negative number.
+
+        .. code-block:: python
+            :caption: Example
+            :class: copy-button
+
+            import pandas as pd
+            import rupantaran.pandas_accessor
+            print(pd.Series([1, 2.5, "x"]).rupantaran.to_sq_meters("bigha", precision = 2))
+        """
+        return self.convert(unit, land_registry.SQ_M, precision, errors)
+
+    def from_sq_meters(self, unit: str, precision: int = 4, errors: str = "coerce"):
+        """
+        Converts areas in square meters to a Terai or Hilly land unit.
+
+        :param unit: The target land unit (e.g., 'kattha', 'aana').
+        :type unit: str
+        :param precision: Number of decimal places to round to (must be non-negative), or None. Default is 4.
+        :type precision: int, optional
+        :param errors: 'coerce' turns bad rows into NaN; 'raise' raises on the first one. Default is 'coerce'.
+        :type errors: str, optional
+        :return: The areas in `unit`.
+        :rtype: pandas.Series
+
+        :raises ValueError:
+            - If `unit` is not a recognized land unit.
+            - If `precision` is negative.
+            - If `errors` is 'raise' and a row is not a finite non-negative number.
+        """
+        _check_errors(errors)
+        result = masked.convert_land(_column(self._series), land_registry.SQ_M, unit, precision)
+        return self._wrap(_values(self._series, result, errors, "area"))
+
+    def convert(self, from_unit: str, to_unit: str, precision: int = 4, errors: str = "coerce"):
+        """
+        Converts values between any two land units, within or across the Terai and Hilly systems,
+        with one multiply by the factor from `land.registry` and a single rounding.
+
+        :param from_unit: The source land unit (e.g., 'bigha', 'ropani', 'sq_m').
+        :type from_unit: str
+        :param to_unit: The target land unit (e.g., 'kattha', 'aana', 'sq_m').
+        :type to_unit: str
+        :param precision: Number of decimal places to round to (must be non-negative), or None. Default is 4.
+        :type precision: int, optional
+        :param errors: 'coerce' turns bad rows into NaN; 'raise' raises on the first one. Default is 'coerce'.
+        :type errors: str, optional
+        :return: The converted values.
+        :rtype: pandas.Series
+
+        :raises ValueError:
+            - If either unit is not a recognized land unit.
+            - If `precision` is negative.
+            - If `errors` is 'raise' and a row is not a finite non-negative number.
+        """
+        _check_errors(errors)
+        result = masked.convert_land(_column(self._series), from_unit, to_unit, precision)
+        return self._wrap(_values(self._series, result, errors))
+
+    def parse_hilly(self, errors: str = "coerce"):
+        """
+        Parses Hilly mixed-unit expressions ('2 ropani 3 aana') into square meters.
+
+        :param errors: 'coerce' turns bad rows into NaN; 'raise' raises on the first one. Default is 'coerce'.
+        :type errors: str, optional
+        :return: The areas in square meters.
+        :rtype: pandas.Series
+
+        :raises ValueError:
+            - If `errors` is 'raise' and a row is missing or cannot be parsed.
+        """
+        _check_errors(errors)
+        return self._wrap(_parse(self._series, masked.parse_hilly, land_mixed_units.parse_hilly_mixed_unit, errors))
+
+    def parse_terai(self, errors: str = "coerce"):
+        """
+        Parses Terai mixed-unit expressions ('1 bigha 5 kattha') into square meters.
+
+        :param errors: 'coerce' turns bad rows into NaN; 'raise' raises on the first one. Default is 'coerce'.
+        :type errors: str, optional
+        :return: The areas in square meters.
+        :rtype: pandas.Series
+
+        :raises ValueError:
+            - If `errors` is 'raise' and a row is missing or cannot be parsed.
+        """
+        _check_errors(errors)
+        return self._wrap(_parse(self._series, masked.parse_terai, land_mixed_units.parse_terai_mixed_unit, errors))
+
+    def to_hilly_mixed(self, precision: int = 4, errors: str = "coerce"):
+        """
+        Formats areas in square meters as Hilly mixed-unit expressions, identical to those of
+        `land.mixed_units.sq_meters_to_hilly_mixed`.
+
+        :param precision: Number of decimal places for daam rounding (must be non-negative). Default is 4.
+        :type precision: int, optional
+        :param errors: 'coerce' turns bad rows into None; 'raise' raises on the first one. Default is 'coerce'.
+        :type errors: str, optional
+        :return: The expressions.
+        :rtype: pandas.Series
+
+        :raises ValueError:
+            - If `precision` is negative.
+            - If `errors` is 'raise' and a row is not a finite non-negative number.
+        """
+        _check_errors(errors)
+        strings = _mixed_strings(self._series, list(HILLY_TO_SQ_M.items()), precision, errors, "area")
+        return self._wrap(strings, object)
+
+    def to_terai_mixed(self, precision: int = 4, errors: str = "coerce"):
+        """
+        Formats areas in square meters as Terai mixed-unit expressions, identical to those of
+        `land.mixed_units.sq_meters_to_terai_mixed`.
+
+        :param precision: Number of decimal places for dhur rounding (must be non-negative). Default is 4.
+        :type precision: int, optional
+        :param errors: 'coerce' turns bad rows into None; 'raise' raises on the first one. Default is 'coerce'.
+        :type errors: str, optional
+        :return: The expressions.
+        :rtype: pandas.Series
+
+        :raises ValueError:
+            - If `precision` is negative.
+            - If `errors` is 'raise' and a row is not a finite non-negative number.
+        """
+        _check_errors(errors)
+        strings = _mixed_strings(self._series, list(TERAI_TO_SQ_M.items()), precision, errors, "area")
+        return self._wrap(strings, object)
+
+    def convert_weight(self, from_unit: str, to_unit: str, precision: int = 4, errors: str = "coerce"):
+        """
+        Converts weights between any two weight units, as `weight.convert` does for one value.
+
+        :param from_unit: The source weight unit (e.g., 'tola', 'sher', 'kg').
+        :type from_unit: str
+        :param to_unit: The target weight unit (e.g., 'g', 'pau', 'lb').
+        :type to_unit: str
+        :param precision: Number of decimal places to round to (must be non-negative), or None. Default is 4.
+        :type precision: int, optional
+        :param errors: 'coerce' turns bad rows into NaN; 'raise' raises on the first one. Default is 'coerce'.
+        :type errors: str, optional
+        :return: The converted weights.
+        :rtype: pandas.Series
+
+        :raises ValueError:
+            - If either unit is not a recognized weight unit.
+            - If `precision` is negative.
+            - If `errors` is 'raise' and a row is not a finite non-negative number.
+        """
+        _check_errors(errors)
+        result = masked.convert_weight(_column(self._series), from_unit, to_unit, precision)
+        return self._wrap(_values(self._series, result, errors))
+
+    def parse_weight(self, errors: str = "coerce"):
+        """
+        Parses mixed weight expressions ('2 sher 3 pau') into grams.
+
+        :param errors: 'coerce' turns bad rows into NaN; 'raise' raises on the first one. Default is 'coerce'.
+        :type errors: str, optional
+        :return: The weights in grams.
+        :rtype: pandas.Series
+
+        :raises ValueError:
+            - If `errors` is 'raise' and a row is missing or cannot be parsed.
+        """
+        _check_errors(errors)
+        return self._wrap(_parse(self._series, masked.parse_weight, weight_mixed_units.parse_weight_mixed_unit, errors))
+
+    def to_weight_mixed(self, precision: int = 4, errors: str = "coerce"):
+        """
+        Formats weights in grams as dharni/sher/pau/chatak/tola/lal expressions, identical to those
+        of `weight.mixed_units.grams_to_weight_mixed`.
+
+        :param precision: Number of decimal places for lal rounding (must be non-negative). Default is 4.
+        :type precision: int, optional
+        :param errors: 'coerce' turns bad rows into None; 'raise' raises on the first one. Default is 'coerce'.
+        :type errors: str, optional
+        :return: The expressions.
+        :rtype: pandas.Series
+
+        :raises ValueError:
+            - If `precision` is negative.
+            - If `errors` is 'raise' and a row is not a finite non-negative number.
+        """
+        _check_errors(errors)
+        strings = _mixed_strings(
+            self._series, weight_mixed_units._UNIT_GRAMS, precision, errors, "value",
+            weight_mixed_units._TOLERANCE,
+        )
+        return self._wrap(strings, object)
+
+
+class RupantaranFrameAccessor:
+    """
+    Conversions of several DataFrame columns at once, available as ``df.rupantaran``. Each method
+    takes the `columns` to convert (one name or a list; default all) followed by the arguments of
+    the `RupantaranSeriesAccessor` method of the same name, and returns a DataFrame of the
+    converted columns with the original index.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        import pandas as pd
+        import rupantaran.pandas_accessor
+        df = pd.DataFrame({"north": ["2 ropani 3 aana"], "south": ["1 ropani"]})
+        print(df.rupantaran.parse_hilly(["north", "south"]))
+    """
+
+    def __init__(self, frame):
+        self._frame = frame
+
+    def _apply(self, method: str, columns, args: tuple, kwargs: dict):
+        frame = self._frame
+        if columns is None:
+            columns = list(frame.columns)
+        elif isinstance(columns, str):
+            columns = [columns]
+        converted = {
+            column: getattr(RupantaranSeriesAccessor(frame[column]), method)(*args, **kwargs)
+            for column in columns
+        }
+        return pd.DataFrame(converted, index=frame.index)
+
+
+def _frame_method(name: str):
+    def method(self, columns=None, *args, **kwargs):
+        return self._apply(name, columns, args, kwargs)
+
+    method.__name__ = name
+    method.__doc__ = f"Applies ``Series.rupantaran.{name}`` to each of `columns`; see `RupantaranSeriesAccessor.{name}`."
+    return method
+
+
+for _name in (
+    "to_sq_meters",
+    "from_sq_meters",
+    "convert",
+    "parse_hilly",
+    "parse_terai",
+    "to_hilly_mixed",
+    "to_terai_mixed",
+    "convert_weight",
+    "parse_weight",
+    "to_weight_mixed",
+):
+    setattr(RupantaranFrameAccessor, _name, _frame_method(_name))
+del _name
+
+pd.api.extensions.register_series_accessor("rupantaran")(RupantaranSeriesAccessor)
+pd.api.extensions.register_dataframe_accessor("rupantaran")(RupantaranFrameAccessor)
@@ -0,0 +1,177 @@
+"""
+parallel.py
+
+This module spreads bulk conversions over several processes with
+``concurrent.futures.ProcessPoolExecutor``. The input is cut into chunks and one task is submitted
+per chunk, never per row, so each worker receives a whole list or array in one pickle and sends
+back one result. Results come back in input order.
+
+Any conversion function can be used. Array functions (such as those in `rupantaran.land.batch`)
+receive a whole chunk; scalar functions (such as `rupantaran.weight.from_tola`) are applied to each
+element of a chunk inside the worker when `elementwise` is true. The function must be importable
+by name (defined at module level) so that it can be sent to the workers.
+
+Functions:
+- `iter_bulk_convert`: Yields converted chunks in order, keeping a bounded number in flight.
+- `bulk_convert`: Converts a whole input and joins the chunk results.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+def _apply(func, chunk, args: tuple, kwargs: dict, elementwise: bool):
+    if elementwise:
+        return [func(value, *args, **kwargs) for value in chunk]
+    return func(chunk, *args, **kwargs)
+
+
+def _is_sliceable(values) -> bool:
+    return hasattr(values, "__getitem__") and hasattr(values, "__len__") and not isinstance(values, str)
+
+
+def _chunks(values, chunk_size: int):
+    if _is_sliceable(values):
+        for start in range(0, len(values), chunk_size):
+            yield values[start:start + chunk_size]
+        return
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _join(results: list):
+    first = results[0]
+    if isinstance(first, dict):
+        return {key: _join([result[key] for result in results]) for key in first}
+    if isinstance(first, list):
+        return [item for result in results for item in result]
+    if isinstance(first, tuple):
+        return tuple(item for result in results for item in result)
+    from ._arrays import np
+
+    return np.concatenate(results)
+
+
+def _check_options(chunk_size: int, workers) -> int:
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Number of workers must be positive.")
+    return workers
+
+
+def iter_bulk_convert(
+    func, values, *args, chunk_size: int = 100_000, workers: int = None, elementwise: bool = False,
+    **kwargs
+):
+    """
+    Converts `values` chunk by chunk in a pool of worker processes, yielding each chunk's result
+    in input order.
+
+    At most two chunks per worker are in flight at any time, so `values` can be a generator over
+    a file of any size. With one worker, chunks are converted in the calling process.
+
+    :param func: The conversion function, called as ``func(chunk, *args, **kwargs)``, or as
+        ``func(value, *args, **kwargs)`` for every element when `elementwise` is true.
+    :type func: Callable
+    :param values: A list, tuple, NumPy array or any iterable of input values.
+    :param args: Further positional arguments for `func` (e.g., the unit).
+    :param chunk_size: Number of values per task. Default is 100,000.
+    :type chunk_size: int, optional
+    :param workers: Number of worker processes. Default is the number of CPUs.
+    :type workers: int, optional
+    :param elementwise: Apply `func` to each value instead of to the whole chunk.
+    :type elementwise: bool, optional
+    :param kwargs: Further keyword arguments for `func` (e.g., precision).
+    :return: A generator over the chunk results.
+    :rtype: Iterator
+
+    :raises ValueError:
+        - If `chunk_size` or `workers` is not positive.
+        - Any error raised by `func`, re-raised in the calling process.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        from rupantaran.parallel import iter_bulk_convert
+        for result in iter_bulk_convert(batch.parse_hilly_mixed_unit, open("areas.txt"), workers = 8):
+            print(result.sum())
+    """
+    workers = _check_options(chunk_size, workers)
+    chunks = _chunks(values, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield _apply(func, chunk, args, kwargs, elementwise)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_apply, func, chunk, args, kwargs, elementwise))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def bulk_convert(
+    func, values, *args, chunk_size: int = 100_000, workers: int = None, elementwise: bool = False,
+    **kwargs
+):
+    """
+    Converts all of `values` in a pool of worker processes and joins the results in input order.
+
+    Chunk results are joined by type: NumPy arrays are concatenated, lists and tuples are
+    flattened, and dicts of arrays (such as mixed-unit components) are joined key by key. Empty
+    input gives what `func` returns for an empty chunk.
+
+    :param func: The conversion function; see `iter_bulk_convert`.
+    :type func: Callable
+    :param values: A list, tuple, NumPy array or any iterable of input values.
+    :param args: Further positional arguments for `func` (e.g., the unit).
+    :param chunk_size: Number of values per task. Default is 100,000.
+    :type chunk_size: int, optional
+    :param workers: Number of worker processes. Default is the number of CPUs.
+    :type workers: int, optional
+    :param elementwise: Apply `func` to each value instead of to the whole chunk.
+    :type elementwise: bool, optional
+    :param kwargs: Further keyword arguments for `func` (e.g., precision).
+    :return: The joined result.
+    :rtype: numpy.ndarray, list, tuple or dict
+
+    :raises ValueError:
+        - If `chunk_size` or `workers` is not positive.
+        - Any error raised by `func`, re-raised in the calling process.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.land import batch
+        from rupantaran.parallel import bulk_convert
+        result = bulk_convert(batch.terai_to_sq_meters, values, "bigha", precision = 2, workers = 8)
+
+        from rupantaran.weight import from_tola
+        grams = bulk_convert(from_tola, tolas, "g", workers = 8, elementwise = True)
+    """
+    results = list(
+        iter_bulk_convert(
+            func, values, *args, chunk_size=chunk_size, workers=workers,
+            elementwise=elementwise, **kwargs
+        )
+    )
+    if not results:
+        # Convert an empty chunk so that empty input gives the function's own type of result
+        empty = values[:0] if _is_sliceable(values) else []
+        return _apply(func, empty, args, kwargs, elementwise)
+    return _join(results)
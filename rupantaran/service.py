@@ -0,0 +1,362 @@
+"""
+service.py
+
+A small HTTP/JSON conversion service built on ``asyncio`` and the standard library only. It lets
+several applications share one process of vectorized kernels instead of each converting one value
+per request in its own copy of the library.
+
+Single-value requests that arrive together are collected into micro-batches: the first request
+for an operation starts a short timer (`max_delay`, 2 ms by default) and every request for the same
+operation and parameters that arrives before it fires, up to `max_batch`, is converted with one
+call of a `masked` kernel. A bad value fails only its own request. Bulk requests (a ``values``
+list) are converted with one kernel call directly.
+
+Endpoints (all POST with a JSON object, except the GET ones):
+
+- ``/convert/land``: ``{"value" | "values", "from", "to", "precision"?}``, any two land units,
+  within or across the Terai and Hilly systems.
+- ``/convert/weight``: ``{"value" | "values", "from", "to", "precision"?}``.
+- ``/parse/hilly``, ``/parse/terai``, ``/parse/weight``: ``{"value" | "values"}`` mixed-unit
+  expressions, to square meters or grams.
+- ``/format/hilly``, ``/format/terai``, ``/format/weight``: ``{"value" | "values", "precision"?}``
+  square meters or grams, to mixed-unit expressions.
+- ``GET /health``, ``GET /stats``: liveness, and request/batch counters.
+
+A single value answers ``{"result": ...}`` (status 200) or ``{"error": ...}`` (status 400). Bulk
+requests answer ``{"results": [...], "errors": [...]}`` with ``null`` for the rows without a
+result or without an error.
+
+Run it with ``python -m rupantaran.service --port 8080``. Requires NumPy.
+
+Classes:
+- `ConversionService`: Routes requests to micro-batched kernels and serves them over HTTP.
+
+Functions:
+- `main`: Command-line entry point.
+"""
+
+import argparse
+import asyncio
+import json
+
+from . import masked
+from ._arrays import max_decomposable
+from .land import batch as land_batch
+from .land.constants import HILLY_TO_SQ_M, TERAI_TO_SQ_M
+from .weight import batch as weight_batch
+from .weight import mixed_units as weight_mixed_units
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+_MAX_BODY = 64 * 1024 * 1024
+
+
+def _rows(result: masked.MaskedResult, values: list) -> tuple:
+    """Splits a masked result into a list of results and a list of error reasons."""
+    errors = [None if code == masked.OK else masked.ERROR_REASONS[code] for code in result.errors.tolist()]
+    results = [None if error else value for value, error in zip(values, errors)]
+    return results, errors
+
+
+def _converter(kernel):
+    def convert(values: list, from_unit: str, to_unit: str, precision) -> tuple:
+        result = kernel(values, from_unit, to_unit, precision)
+        return _rows(result, result.values.tolist())
+
+    return convert
+
+
+def _parser(kernel):
+    def parse(values: list) -> tuple:
+        result = kernel(values)
+        return _rows(result, result.values.tolist())
+
+    return parse
+
+
+def _formatter(kernel, unit_sizes: list):
+    def format_values(values: list, precision) -> tuple:
+        checked = masked.check_values(values)
+        checked.errors[checked.values >= max_decomposable(unit_sizes)] = masked.OVERFLOW
+        strings = iter(kernel(checked.values[checked.valid], precision, as_strings=True))
+        return _rows(checked, [next(strings) if ok else None for ok in checked.valid.tolist()])
+
+    return format_values
+
+
+# Path -> (kernel, payload fields passed to it after the values, default of each field)
+_OPERATIONS = {
+    "/convert/land": (_converter(masked.convert_land), ("from", "to", "precision"), (None, None, 4)),
+    "/convert/weight": (_converter(masked.convert_weight), ("from", "to", "precision"), (None, None, 4)),
+    "/parse/hilly": (_parser(masked.parse_hilly), (), ()),
+    "/parse/terai": (_parser(masked.parse_terai), (), ()),
+    "/parse/weight": (_parser(masked.parse_weight), (), ()),
+    "/format/hilly": (
+        _formatter(land_batch.sq_meters_to_hilly_mixed, list(HILLY_TO_SQ_M.items())), ("precision",), (4,)
+    ),
+    "/format/terai": (
+        _formatter(land_batch.sq_meters_to_terai_mixed, list(TERAI_TO_SQ_M.items())), ("precision",), (4,)
+    ),
+    "/format/weight": (
+        _formatter(weight_batch.grams_to_weight_mixed, weight_mixed_units._UNIT_GRAMS), ("precision",), (4,)
+    ),
+}
+
+
+class _Batcher:
+    """Collects single values for one kernel and one set of arguments, and converts them together."""
+
+    def __init__(self, key: tuple, kernel, args: tuple, service):
+        self._key = key
+        self._kernel = kernel
+        self._args = args
+        self._service = service
+        self._values = []
+        self._futures = []
+        self._timer = None
+
+    def submit(self, value) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._values.append(value)
+        self._futures.append(future)
+        if len(self._values) >= self._service.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._service.max_delay, self.flush)
+        return future
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # Later requests start a new batcher, so the table only holds batches being collected
+        self._service._batchers.pop(self._key, None)
+        values, futures = self._values, self._futures
+        self._service._record_batch(len(values))
+        try:
+            results, errors = self._kernel(values, *self._args)
+        except Exception:  # a failing batch must still answer every waiting request
+            for future, value in zip(futures, values):
+                self._convert_alone(future, value)
+            return
+        for future, result, error in zip(futures, results, errors):
+            if not future.done():
+                future.set_result((result, error))
+
+    def _convert_alone(self, future: asyncio.Future, value) -> None:
+        """Converts one value of a failed batch by itself, so that only a bad value fails."""
+        if future.done():
+            return
+        try:
+            results, errors = self._kernel([value], *self._args)
+        except Exception as exc:
+            future.set_exception(ValueError(str(exc)))
+        else:
+            future.set_result((results[0], errors[0]))
+
+
+class ConversionService:
+    """
+    Converts JSON requests with micro-batched vectorized kernels.
+
+    :param max_batch: Largest number of single values converted in one kernel call. Default is 1024.
+    :type max_batch: int, optional
+    :param max_delay: Longest time, in seconds, a single value waits for others to join its batch.
+        Default is 0.002.
+    :type max_delay: float, optional
+
+    :raises ValueError:
+        - If `max_batch` is less than 1 or `max_delay` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        import asyncio
+        from rupantaran.service import ConversionService
+
+        async def run():
+            service = ConversionService()
+            print(await service.handle("/convert/land", {"value": 2, "from": "bigha", "to": "ropani"}))
+
+        asyncio.run(run())
+    """
+
+    def __init__(self, max_batch: int = 1024, max_delay: float = 0.002):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1.")
+        if max_delay < 0:
+            raise ValueError("max_delay must be non-negative.")
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._batchers = {}
+        self.requests = 0
+        self.batches = 0
+        self.batched_values = 0
+
+    def _record_batch(self, size: int) -> None:
+        self.batches += 1
+        self.batched_values += size
+
+    def stats(self) -> dict:
+        """Returns the request and batch counters."""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "batched_values": self.batched_values,
+            "mean_batch_size": self.batched_values / self.batches if self.batches else 0.0,
+        }
+
+    async def handle(self, path: str, payload) -> tuple:
+        """
+        Answers one request.
+
+        :param path: The endpoint (e.g., '/convert/land').
+        :type path: str
+        :param payload: The decoded JSON body.
+        :type payload: dict
+        :return: The HTTP status and the JSON-serializable response body.
+        :rtype: tuple[int, dict]
+        """
+        self.requests += 1
+        operation = _OPERATIONS.get(path)
+        if operation is None:
+            return 404, {"error": f"Unknown endpoint: {path}"}
+        if not isinstance(payload, dict):
+            return 400, {"error": "Request body must be a JSON object."}
+        kernel, fields, defaults = operation
+        args = []
+        for field, default in zip(fields, defaults):
+            value = payload.get(field, default)
+            if value is None:
+                return 400, {"error": f"Missing field: {field}"}
+            if field in ("from", "to") and not isinstance(value, str):
+                return 400, {"error": f"{field} must be a string."}
+            if field == "precision" and (not isinstance(value, int) or isinstance(value, bool)):
+                return 400, {"error": "Precision must be an integer."}
+            args.append(value)
+        args = tuple(args)
+
+        if "values" in payload:
+            values = payload["values"]
+            if not isinstance(values, list):
+                return 400, {"error": "values must be a list."}
+            self._record_batch(len(values))
+            try:
+                results, errors = kernel(values, *args)
+            except (ValueError, ArithmeticError) as exc:
+                return 400, {"error": str(exc)}
+            return 200, {"results": results, "errors": errors}
+
+        if "value" not in payload:
+            return 400, {"error": "Missing field: value or values"}
+        value = payload["value"]
+        if isinstance(value, (list, dict)):
+            # Checked here so that one malformed request cannot fail a whole batch
+            return 400, {"error": "value must be a number or a string."}
+        key = (path, args)
+        batcher = self._batchers.get(key)
+        if batcher is None:
+            batcher = self._batchers[key] = _Batcher(key, kernel, args, self)
+        try:
+            result, error = await batcher.submit(value)
+        except ValueError as exc:
+            return 400, {"error": str(exc)}
+        if error is not None:
+            return 400, {"error": error}
+        return 200, {"result": result}
+
+    async def _respond(self, writer, status: int, body: dict, keep_alive: bool) -> None:
+        try:
+            data = json.dumps(body, allow_nan=False).encode()
+        except ValueError:
+            # Standard JSON has no NaN or Infinity, so never send them
+            status, data = 400, json.dumps({"error": "Result is not a finite number."}).encode()
+        head = (
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode() + data)
+        await writer.drain()
+
+    async def _handle_connection(self, reader, writer) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, version = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get("connection", "").lower() != "close" and version.strip() == "HTTP/1.1"
+                length = int(headers.get("content-length", 0))
+                if length > _MAX_BODY:
+                    await self._respond(writer, 413, {"error": "Request body is too large."}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                if method == "GET" and path == "/health":
+                    status, response = 200, {"status": "ok"}
+                elif method == "GET" and path == "/stats":
+                    status, response = 200, self.stats()
+                elif method != "POST":
+                    status, response = 405, {"error": f"Method not allowed: {method}"}
+                else:
+                    try:
+                        payload = json.loads(body)
+                    except ValueError:
+                        status, response = 400, {"error": "Request body must be JSON."}
+                    else:
+                        status, response = await self.handle(path, payload)
+                await self._respond(writer, status, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080):
+        """
+        Starts serving HTTP on `host`:`port`.
+
+        :return: The running server; close it with ``server.close()``.
+        :rtype: asyncio.Server
+        """
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+
+def main(argv=None) -> None:
+    """
+    Runs the service until interrupted: ``python -m rupantaran.service [--host H] [--port P]
+    [--max-batch N] [--max-delay-ms MS]``.
+    """
+    parser = argparse.ArgumentParser(prog="python -m rupantaran.service", description="Rupantaran conversion service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-batch", type=int, default=1024)
+    parser.add_argument("--max-delay-ms", type=float, default=2.0)
+    args = parser.parse_args(argv)
+
+    async def run():
+        service = ConversionService(args.max_batch, args.max_delay_ms / 1000)
+        server = await service.start(args.host, args.port)
+        print(f"Serving on http://{args.host}:{args.port}", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
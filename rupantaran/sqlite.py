@@ -0,0 +1,219 @@
+"""
+sqlite.py
+
+This module registers rupantaran conversions as SQL functions on a ``sqlite3.Connection``, so a
+land register stored in SQLite can be converted inside queries. Rows are not fetched into Python
+and written back; SQLite calls the conversion for each row as it runs the query.
+
+SQL functions registered by `register`:
+- ``rp_to_sqm(value, unit[, precision])``: Converts a value in any land unit to square meters.
+- ``rp_convert(value, from_unit, to_unit[, precision])``: Converts between any two land units.
+- ``rp_parse_hilly(expr)``, ``rp_parse_terai(expr)``: Parse a mixed-unit expression into square
+  meters.
+- ``rp_format_hilly(sqm[, precision])``, ``rp_format_terai(sqm[, precision])``: Format square
+  meters as a mixed-unit expression.
+- ``rp_sum_hilly(expr)``, ``rp_sum_terai(expr)``: Aggregates. Each returns the total of a group of
+  mixed-unit expressions in square meters. The sum is taken exactly, in the integer counts of
+  `land.aggregate`, so the total of a single row is what ``rp_parse_hilly`` (or
+  ``rp_parse_terai``) gives, to four decimal places.
+
+Precision defaults to 4, as in the Python functions. A NULL argument gives NULL, and the
+aggregates skip NULL rows, like SQLite's own functions. With ``errors="raise"`` an invalid value
+makes the query fail. SQLite reports this as "user-defined function raised exception", and
+``sqlite3.enable_callback_tracebacks(True)`` shows the reason. With ``errors="coerce"`` an
+invalid value gives NULL, and the aggregates skip it.
+
+Functions:
+- `register`: Registers the functions and aggregates on a connection.
+
+Constants:
+- `FUNCTIONS`: Names of the scalar SQL functions.
+- `AGGREGATES`: Names of the aggregate SQL functions.
+- `ERRORS`: Accepted values of the `errors` argument ('raise', 'coerce').
+"""
+
+import math
+import sqlite3
+
+from ._cache import LRUCache
+from .land import mixed_units
+from .land.aggregate import _COUNTS_PER_SQ_M, _parse as _parse_count
+from .land.registry import SQ_M, get_factor
+
+ERRORS = ("raise", "coerce")
+
+
+def _check_value(value, name: str = "value"):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Input {name} must be a number.")
+    if not math.isfinite(value):
+        raise ValueError(f"Input {name} must be finite.")
+    if value < 0:
+        raise ValueError(f"Input {name} must be non-negative.")
+    return value
+
+
+def _check_result(result: float) -> float:
+    if not math.isfinite(result):
+        raise ValueError("Result must be finite.")
+    return result
+
+
+def _check_precision(precision) -> int:
+    if not isinstance(precision, int):
+        raise ValueError("Precision must be an integer.")
+    if precision < 0:
+        raise ValueError("Precision must be non-negative.")
+    return precision
+
+
+def _check_expression(expression) -> str:
+    if not isinstance(expression, str):
+        raise ValueError("Input expression must be a string.")
+    return expression
+
+
+def _factor(from_unit, to_unit) -> float:
+    for unit in (from_unit, to_unit):
+        if not isinstance(unit, str):
+            raise ValueError(f"Unsupported land unit: {unit}")
+    return get_factor(from_unit, to_unit)
+
+
+# Factors keyed on the unit names as written in the table, so alias resolution runs once per pair
+_FACTOR_CACHE = LRUCache(_factor, maxsize=1024)
+
+
+def _convert(value, from_unit, to_unit, precision=4) -> float:
+    factor = _FACTOR_CACHE.call(from_unit, to_unit)
+    return round(_check_result(_check_value(value) * factor), _check_precision(precision))
+
+
+def _to_sqm(value, unit, precision=4) -> float:
+    return _convert(value, unit, SQ_M, precision)
+
+
+def _parse_hilly(expression) -> float:
+    return _check_result(mixed_units.parse_hilly_mixed_unit(_check_expression(expression)))
+
+
+def _parse_terai(expression) -> float:
+    return _check_result(mixed_units.parse_terai_mixed_unit(_check_expression(expression)))
+
+
+def _format_hilly(area_m2, precision=4) -> str:
+    return mixed_units.sq_meters_to_hilly_mixed(_check_value(area_m2, "area"), _check_precision(precision))
+
+
+def _format_terai(area_m2, precision=4) -> str:
+    return mixed_units.sq_meters_to_terai_mixed(_check_value(area_m2, "area"), _check_precision(precision))
+
+
+# SQL name -> (Python function, accepted numbers of arguments)
+_FUNCTIONS = {
+    "rp_to_sqm": (_to_sqm, (2, 3)),
+    "rp_convert": (_convert, (3, 4)),
+    "rp_parse_hilly": (_parse_hilly, (1,)),
+    "rp_parse_terai": (_parse_terai, (1,)),
+    "rp_format_hilly": (_format_hilly, (1, 2)),
+    "rp_format_terai": (_format_terai, (1, 2)),
+}
+
+FUNCTIONS = tuple(_FUNCTIONS)
+
+AGGREGATES = ("rp_sum_hilly", "rp_sum_terai")
+
+
+def _sql_function(func, coerce: bool):
+    """Wraps `func` so that NULL arguments give NULL and, if `coerce` is true, errors give NULL."""
+    if coerce:
+
+        def call(*args):
+            if None in args:
+                return None
+            try:
+                return func(*args)
+            except ValueError:
+                return None
+
+    else:
+
+        def call(*args):
+            if None in args:
+                return None
+            return func(*args)
+
+    return call
+
+
+def _exact_sum(system: str, coerce: bool):
+    """Returns an SQLite aggregate class that sums expressions of `system` in exact integer counts."""
+
+    class ExactSum:
+        def __init__(self):
+            # None until a row is added, so that a group without rows totals NULL
+            self.count = None
+
+        def step(self, expression):
+            if expression is None:
+                return
+            try:
+                count = _parse_count(_check_expression(expression), system)
+            except ValueError:
+                if coerce:
+                    return
+                raise
+            self.count = count if self.count is None else self.count + count
+
+        def finalize(self):
+            return None if self.count is None else round(self.count / _COUNTS_PER_SQ_M, 4)
+
+    return ExactSum
+
+
+def _create_function(connection, name: str, narg: int, func) -> None:
+    try:
+        # Deterministic functions can be used in indexes and are optimized by the query planner
+        connection.create_function(name, narg, func, deterministic=True)
+    except (TypeError, sqlite3.NotSupportedError):  # Python 3.7, or SQLite before 3.8.3
+        connection.create_function(name, narg, func)
+
+
+def register(connection: sqlite3.Connection, errors: str = "raise") -> None:
+    """
+    Registers the rupantaran SQL functions and aggregates on an SQLite connection.
+
+    :param connection: The connection to register the functions on. Functions are registered per
+        connection, so call this for every connection that uses them.
+    :type connection: sqlite3.Connection
+    :param errors: 'raise' to make a query fail on an invalid value, or 'coerce' to give NULL
+        instead (aggregates skip such rows). Default is 'raise'.
+    :type errors: str, optional
+
+    :raises ValueError:
+        - If `errors` is not 'raise' or 'coerce'.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        import sqlite3
+        from rupantaran import sqlite
+
+        connection = sqlite3.connect("register.db")
+        sqlite.register(connection)
+        connection.execute("UPDATE parcels SET area_m2 = rp_parse_hilly(area)")
+        for ward, total in connection.execute(
+            "SELECT ward, rp_format_hilly(rp_sum_hilly(area), 2) FROM parcels GROUP BY ward"
+        ):
+            print(ward, total)
+    """
+    if errors not in ERRORS:
+        raise ValueError(f"errors must be 'raise' or 'coerce', got {errors!r}.")
+    coerce = errors == "coerce"
+    for name, (func, nargs) in _FUNCTIONS.items():
+        wrapped = _sql_function(func, coerce)
+        for narg in nargs:
+            _create_function(connection, name, narg, wrapped)
+    for name, system in zip(AGGREGATES, ("hilly", "terai")):
+        connection.create_aggregate(name, 1, _exact_sum(system, coerce))
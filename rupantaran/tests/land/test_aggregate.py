@@ -0,0 +1,140 @@
+import pytest
+
+from rupantaran.land import aggregate, mixed_units
+from rupantaran.land.aggregate import GroupTotal, LandTotals
+
+PAIRS = [
+    ("ram", "2 ropani 3 aana"),
+    ("sita", "1 ropani"),
+    ("ram", "8 aana 2 paisa"),
+    ("hari", "3 daam"),
+    ("sita", "0.5 ropani"),
+]
+
+
+def _expected(pairs, key):
+    count = sum(round(mixed_units.parse_hilly_mixed_unit(expression) * 10_000) for k, expression in pairs if k == key)
+    area_m2 = count / 10_000
+    return GroupTotal(
+        sum(1 for k, _ in pairs if k == key),
+        round(area_m2, 4),
+        mixed_units.sq_meters_to_hilly_mixed(area_m2, 3),
+        mixed_units.sq_meters_to_terai_mixed(area_m2, 3),
+    )
+
+
+def test_aggregate():
+    totals = aggregate.aggregate(PAIRS)
+    assert list(totals) == ["ram", "sita", "hari"]
+    for key in totals:
+        assert totals[key] == _expected(PAIRS, key)
+    assert totals["ram"].sq_meters == round(2 * 508.74 + 11 * 31.79 + 2 * 7.95, 4)
+
+
+@pytest.mark.parametrize("expression", ["2 ropani 3 aana", "8 aana 2 paisa", "0.1 daam", "1.25 ropani 3.5 daam"])
+def test_single_row_matches_parse(expression):
+    area_m2 = mixed_units.parse_hilly_mixed_unit(expression)
+    total = aggregate.aggregate([("k", expression)])["k"]
+    assert total.sq_meters == round(area_m2, 4)
+    # Formatted from the exact count, not from the float sum (270.21999... for '8 aana 2 paisa')
+    assert total.hilly == mixed_units.sq_meters_to_hilly_mixed(round(area_m2, 4), 3)
+    terai = aggregate.aggregate([("k", "1 bigha 5 kattha")], system="terai")["k"]
+    assert terai.sq_meters == round(mixed_units.parse_terai_mixed_unit("1 bigha 5 kattha"), 4)
+
+
+def test_totals_are_exact():
+    # 0.1 daam is not exact in binary floating point, so a float sum drifts
+    totals = aggregate.aggregate(("k", "0.1 daam") for _ in range(100_000))
+    assert totals["k"].rows == 100_000
+    assert totals["k"].sq_meters == 19_900.0
+    assert totals["k"].hilly == mixed_units.sq_meters_to_hilly_mixed(19_900, 3)
+    assert sum(mixed_units.parse_hilly_mixed_unit("0.1 daam") for _ in range(100_000)) != 19_900
+
+
+def test_order_does_not_change_totals():
+    assert aggregate.aggregate(PAIRS) == aggregate.aggregate(reversed(PAIRS))
+
+
+def test_terai_and_mixed_systems():
+    totals = LandTotals()
+    totals.update([("a", "1 bigha 5 kattha"), ("a", "10 dhur")], system="terai")
+    totals.add("a", "2 ropani")
+    totals.add("b", "1 kattha", system="Terai")
+    assert totals.counts("a") == (6772.63 + 5 * 338.63 + 10 * 16.93 + 2 * 508.74) * 10_000
+    area_m2 = totals.counts("a") / 10_000
+    total = totals.total("a", precision=2)
+    assert total.rows == 3
+    assert total.sq_meters == round(area_m2, 2)
+    assert total.hilly == mixed_units.sq_meters_to_hilly_mixed(area_m2, 3)
+    assert total.terai == mixed_units.sq_meters_to_terai_mixed(area_m2, 3)
+    assert totals.total("b").terai == "0 bigha 1 kattha 0.000 dhur"
+    assert len(totals) == 2 and "a" in totals and list(totals) == ["a", "b"]
+
+
+def test_nan_keys_are_one_group():
+    np = pytest.importorskip("numpy")
+    keys = np.array([np.nan, 1.0, np.nan])
+    totals = aggregate.aggregate_arrays(keys, ["1 ropani", "1 aana", "2 ropani"])
+    assert len(totals) == 2
+    nan_total = next(total for key, total in totals.items() if key != key)
+    assert nan_total.rows == 2
+    stream = aggregate.aggregate([(float("nan"), "1 ropani"), (float("nan"), "2 ropani")])
+    assert len(stream) == 1 and list(stream.values())[0] == nan_total
+
+
+def test_merge():
+    first, second = LandTotals(), LandTotals()
+    first.update(PAIRS[:2])
+    second.update(PAIRS[2:])
+    first.merge(second)
+    assert first.totals() == aggregate.aggregate(PAIRS)
+
+
+def test_arrays_match_stream():
+    pytest.importorskip("numpy")
+    keys = [pair[0] for pair in PAIRS] * 50
+    expressions = [pair[1] for pair in PAIRS] * 50
+    assert aggregate.aggregate_arrays(keys, expressions) == aggregate.aggregate(zip(keys, expressions))
+
+
+def test_arrays_from_numpy():
+    np = pytest.importorskip("numpy")
+    keys = np.array([3, 1, 3])
+    expressions = np.array(["1 bigha", "1 kattha", "1 dhur"])
+    totals = aggregate.aggregate_arrays(keys, expressions, system="terai", precision=2)
+    assert list(totals) == [3, 1]
+    assert totals[3].terai == "1 bigha 0 kattha 1.000 dhur"
+    assert totals[1].rows == 1
+
+
+@pytest.mark.parametrize(
+    "pairs, message",
+    [
+        ([("a", "1 ropani"), ("b", None)], "Row 1: Input expression must be a string."),
+        ([("a", "1 ropani"), ("b", "2 acre")], "Row 1: Unsupported Hilly unit: acre"),
+    ],
+)
+def test_invalid_rows(pairs, message):
+    with pytest.raises(ValueError, match=message):
+        aggregate.aggregate(pairs)
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match=message):
+        aggregate.aggregate_arrays([key for key, _ in pairs], [expression for _, expression in pairs])
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="Unsupported land system: acre"):
+        aggregate.aggregate(PAIRS, system="acre")
+    with pytest.raises(ValueError, match="Precision must be non-negative."):
+        aggregate.aggregate(PAIRS, precision=-1)
+    with pytest.raises(ValueError, match="Precision must be an integer."):
+        aggregate.aggregate(PAIRS, precision=1.5)
+    with pytest.raises(ValueError, match="Input expression is too large."):
+        LandTotals().add("a", "1e308 ropani")
+    with pytest.raises(ValueError, match="Input expression must be a string."):
+        LandTotals().add("a", 5)
+    with pytest.raises(KeyError):
+        LandTotals().total("missing")
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="Expected 2 expressions, got 1."):
+        aggregate.aggregate_arrays(["a", "b"], ["1 ropani"])
@@ -0,0 +1,62 @@
+import pytest
+import rupantaran.land.aliases as aliases
+import rupantaran.land.mixed_units as mixed_units
+import rupantaran.land.terai as terai
+import rupantaran.land.hilly as hilly
+import rupantaran.land.registry as registry
+from rupantaran.land.constants import TERAI_TO_SQ_M, HILLY_TO_SQ_M
+
+
+def test_canonical_unit():
+    assert aliases.canonical_unit("रोपनी") == "ropani"
+    assert aliases.canonical_unit("Ropanis") == "ropani"
+    assert aliases.canonical_unit("dam") == "daam"
+    assert aliases.canonical_unit("DAMS") == "daam"
+    assert aliases.canonical_unit("बिघा") == "bigha"
+    assert aliases.canonical_unit("katha") == "kattha"
+    assert aliases.canonical_unit("m2") == "sq_m"
+    assert aliases.canonical_unit("Furlong") == "furlong"
+    for unit in (*TERAI_TO_SQ_M, *HILLY_TO_SQ_M, "sq_m"):
+        assert aliases.ALIAS_INDEX[unit] == unit
+
+
+def test_translate_digits():
+    assert aliases.translate_digits("२०८१-०३-१५") == "2081-03-15"
+    assert aliases.translate_digits("2 ropani") == "2 ropani"
+
+
+def test_single_unit_functions_accept_aliases():
+    assert terai.terai_to_sq_meters(2, "बिघा") == terai.terai_to_sq_meters(2, "bigha")
+    assert terai.terai_to_terai(1, "Bighas", "कट्ठा") == 20
+    assert hilly.hilly_to_sq_meters(3, "dam") == hilly.hilly_to_sq_meters(3, "daam")
+    assert hilly.sq_meters_to_hilly(508.72, "रोपनी") == hilly.sq_meters_to_hilly(508.72, "ropani")
+    assert registry.get_factor("आना", "sqm") == HILLY_TO_SQ_M["aana"]
+    with pytest.raises(ValueError, match="Unsupported Terai unit: रोपनी"):
+        terai.terai_to_sq_meters(1, "रोपनी")
+
+
+def test_mixed_unit_parsers_accept_aliases_and_nepali_digits():
+    expected = mixed_units.parse_hilly_mixed_unit("2 ropani 3 aana 1 paisa 2 daam")
+    for expression in [
+        "२ रोपनी ३ आना १ पैसा २ दाम",
+        "2 ropanis 3 annas 1 paisa 2 dams",
+        "२रोपनी, ३आना, १पैसा, २दाम",
+    ]:
+        assert mixed_units.parse_hilly_mixed_unit(expression) == pytest.approx(expected)
+    assert mixed_units.parse_terai_mixed_unit("१ बिघा ५ कट्ठा १०.५ धुर") == pytest.approx(
+        mixed_units.parse_terai_mixed_unit("1 bigha 5 kattha 10.5 dhur")
+    )
+    assert mixed_units.parse_hilly_dash("२-३-१-०") == mixed_units.parse_hilly_dash("2-3-1-0")
+
+    with pytest.raises(mixed_units.MixedUnitParseError, match="Unsupported Hilly unit: बिघा") as info:
+        mixed_units.parse_hilly_mixed_unit("२ रोपनी ३ बिघा")
+    assert info.value.position == 10
+
+
+def test_batch_accepts_aliases_and_nepali_digits():
+    pytest.importorskip("numpy")
+    from rupantaran.land import batch
+
+    rows = ["२-३-१-०", "2-3-1-0", "०-८-०-२.५"]
+    assert batch.parse_hilly_dash(rows).tolist() == [mixed_units.parse_hilly_dash(r) for r in rows]
+    assert batch.terai_to_sq_meters([1, 2], "बिघा").tolist() == [6772.63, 13545.26]
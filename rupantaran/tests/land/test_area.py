@@ -0,0 +1,114 @@
+import pickle
+
+import pytest
+from rupantaran.land import mixed_units
+from rupantaran.land.area import LandArea
+from rupantaran.land.constants import HILLY_TO_SQ_M, TERAI_TO_SQ_M
+
+
+def test_construction():
+    assert LandArea(500).sq_meters == 500.0
+    assert LandArea.from_unit(2, "ropani").sq_meters == 2 * HILLY_TO_SQ_M["ropani"]
+    assert LandArea.from_unit(1, "बिघा").sq_meters == TERAI_TO_SQ_M["bigha"]
+    assert LandArea.parse_hilly("2 ropani 3 aana").sq_meters == mixed_units.parse_hilly_mixed_unit("2 ropani 3 aana")
+    assert LandArea.parse_terai("1 bigha 5 kattha").sq_meters == mixed_units.parse_terai_mixed_unit("1 bigha 5 kattha")
+
+
+@pytest.mark.parametrize(
+    "value, message",
+    [
+        (-1, "Input area must be non-negative."),
+        ("500", "Input area must be a number."),
+        (True, "Input area must be a number."),
+        (float("inf"), "Input area must be finite."),
+        (float("nan"), "Input area must be finite."),
+    ],
+)
+def test_construction_errors(value, message):
+    with pytest.raises(ValueError, match=message):
+        LandArea(value)
+
+
+def test_from_unit_errors():
+    with pytest.raises(ValueError, match="Input value must be non-negative."):
+        LandArea.from_unit(-2, "ropani")
+    with pytest.raises(ValueError, match="Unsupported land unit: acre"):
+        LandArea.from_unit(2, "acre")
+    with pytest.raises(ValueError):
+        LandArea.parse_hilly("2 bigha")
+
+
+def test_arithmetic():
+    a = LandArea(300.0)
+    b = LandArea(200.0)
+    assert a + b == LandArea(500.0)
+    assert a - b == LandArea(100.0)
+    assert a * 2 == 2 * a == LandArea(600.0)
+    assert a / 3 == LandArea(100.0)
+    assert a / b == 1.5
+    assert sum([a, b, b]) == LandArea(700.0)
+    assert sum([]) == 0
+    with pytest.raises(ValueError, match="Resulting area must be non-negative."):
+        b - a
+    with pytest.raises(ValueError, match="Input area must be non-negative."):
+        a * -1
+    with pytest.raises(TypeError):
+        a + 1
+    with pytest.raises(TypeError):
+        a * b
+    big = LandArea(1e308)
+    with pytest.raises(ValueError, match="Resulting area must be finite."):
+        big + big
+    with pytest.raises(ValueError, match="Input area must be finite."):
+        big * 10
+
+
+def test_subclass_arithmetic_keeps_the_subclass():
+    class Parcel(LandArea):
+        __slots__ = ()
+
+    a, b = Parcel(300.0), Parcel(200.0)
+    for result in (a + b, a - b, a * 2, 2 * a, a / 3, sum([a, b])):
+        assert type(result) is Parcel
+    assert repr(a) == "Parcel(300.0)"
+
+
+def test_comparisons_and_hashing():
+    a = LandArea(300)
+    b = LandArea(200.0)
+    assert b < a and b <= a and a > b and a >= b and a != b
+    assert sorted([a, b]) == [b, a]
+    assert max([a, b]) is a
+    assert len({a, LandArea(300.0), b}) == 2
+    assert LandArea(0) == LandArea(0.0) and not LandArea(0)
+    assert a != 300
+    with pytest.raises(TypeError):
+        a < 300
+
+
+def test_immutable_and_picklable():
+    area = LandArea(500)
+    with pytest.raises(AttributeError):
+        area.area = 1
+    with pytest.raises(AttributeError):
+        area._sq_m = 1
+    with pytest.raises(AttributeError):
+        del area._sq_m
+    assert not hasattr(area, "__dict__")
+    assert pickle.loads(pickle.dumps(area)) == area
+
+
+def test_conversions_and_renderings():
+    area = LandArea.parse_hilly("2 ropani 3 aana 1 paisa")
+    assert area.to("aana") == area.sq_meters / HILLY_TO_SQ_M["aana"]
+    assert area.to("sq_m") == area.sq_meters == float(area)
+    assert area.to("bigha", precision=2) == round(area.sq_meters / TERAI_TO_SQ_M["bigha"], 2)
+    assert area.to_hilly_mixed() == mixed_units.sq_meters_to_hilly_mixed(area.sq_meters)
+    assert area.to_terai_mixed(2) == mixed_units.sq_meters_to_terai_mixed(area.sq_meters, 2)
+    assert area.to_hilly_dash() == mixed_units.sq_meters_to_hilly_dash(area.sq_meters)
+    assert area.to_terai_dash(1) == mixed_units.sq_meters_to_terai_dash(area.sq_meters, 1)
+    assert area.to_hilly_mixed() is area.to_hilly_mixed()
+    with pytest.raises(ValueError, match="Precision must be non-negative."):
+        area.to_hilly_mixed(-1)
+    with pytest.raises(ValueError, match="Precision must be non-negative."):
+        area.to("aana", precision=-1)
@@ -0,0 +1,144 @@
+import pickle
+import warnings
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from rupantaran.land import batch, fixed_point, mixed_units
+from rupantaran.land.area import LandArea
+from rupantaran.land.area_array import LandAreaArray
+
+EXPRESSIONS = ["2 ropani 3 aana", "0 ropani 8 aana 2 paisa", "5 ropani", "1 paisa 3 daam"]
+
+
+@pytest.fixture
+def register():
+    return LandAreaArray.parse_hilly(EXPRESSIONS)
+
+
+def test_construction(register):
+    assert register.sq_meters.tolist() == [mixed_units.parse_hilly_mixed_unit(e) for e in EXPRESSIONS]
+    assert register.sq_meters.dtype == np.float64
+    assert register.nbytes == 8 * len(EXPRESSIONS)
+    assert LandAreaArray.from_unit([1, 2], "bigha").sq_meters.tolist() == batch.terai_to_sq_meters([1, 2], "bigha", 10).tolist()
+    assert LandAreaArray.parse_terai(["1 bigha 5 kattha"])[0].sq_meters == mixed_units.parse_terai_mixed_unit("1 bigha 5 kattha")
+    counts = np.array([512000, 1000])
+    assert LandAreaArray.from_fixed(counts, "Hilly").to_fixed("hilly").tolist() == counts.tolist()
+
+
+@pytest.mark.parametrize(
+    "values, message",
+    [
+        ([1, -1], "Input area must be non-negative."),
+        (["a"], "Input area must be a number."),
+        ([[1.0]], "Input area must be one-dimensional."),
+        ([1, float("nan")], "Input area must be finite."),
+        ([float("inf")], "Input area must be finite."),
+    ],
+)
+def test_construction_errors(values, message):
+    with pytest.raises(ValueError, match=message):
+        LandAreaArray(values)
+
+
+def test_immutable(register):
+    with pytest.raises(ValueError):
+        register.sq_meters[0] = 1
+    with pytest.raises(AttributeError):
+        register._sq_m = None
+    source = np.array([1.0, 2.0])
+    LandAreaArray(source)
+    assert source.flags.writeable
+
+
+def test_conversions_match_batch(register):
+    m2 = np.asarray(register)
+    assert register.to_hilly("aana", 2).tolist() == batch.sq_meters_to_hilly(m2, "aana", 2).tolist()
+    assert register.to_terai("dhur", 3).tolist() == batch.sq_meters_to_terai(m2, "dhur", 3).tolist()
+    assert register.to_hilly().tolist() == (m2 / 508.74).tolist()
+    assert register.to("sq_m").tolist() == m2.tolist()
+    assert register.to_mixed_strings("hilly", 2) == [mixed_units.sq_meters_to_hilly_mixed(x, 2) for x in m2]
+    assert register.to_mixed_strings("terai") == [mixed_units.sq_meters_to_terai_mixed(x) for x in m2]
+    components = register.to_mixed_components("terai", 1)
+    expected = batch.sq_meters_to_terai_mixed(m2, 1)
+    assert all(components[unit].tolist() == expected[unit].tolist() for unit in expected)
+    assert register.to_fixed("terai").tolist() == fixed_point.sq_meters_to_terai_fixed(m2).tolist()
+    with pytest.raises(ValueError, match="Unsupported Hilly unit: bigha"):
+        register.to_hilly("bigha")
+    with pytest.raises(ValueError, match="Unsupported land system: plains"):
+        register.to_mixed_components("plains")
+    with pytest.raises(ValueError, match="Precision must be non-negative."):
+        register.to_terai("bigha", -1)
+
+
+def test_indexing_and_iteration(register):
+    assert register[0] == LandArea.parse_hilly(EXPRESSIONS[0])
+    assert isinstance(register[1:3], LandAreaArray) and len(register[1:3]) == 2
+    assert register[register > LandArea(1000)].sq_meters.tolist() == register.sq_meters[[0, 2]].tolist()
+    assert list(register) == [LandArea.parse_hilly(e) for e in EXPRESSIONS]
+
+
+def test_reductions(register):
+    m2 = register.sq_meters
+    assert register.sum() == LandArea(float(m2.sum()))
+    assert np.sum(register) == register.sum()
+    assert register.min() == LandArea(float(m2.min())) and np.max(register) == LandArea(float(m2.max()))
+    assert register.mean() == LandArea(float(m2.mean()))
+    assert LandAreaArray([]).sum() == LandArea(0)
+    with pytest.raises(ValueError):
+        LandAreaArray([]).mean()
+
+
+def test_arithmetic(register):
+    m2 = register.sq_meters
+    assert (register + register).sq_meters.tolist() == (m2 * 2).tolist()
+    assert (register + LandArea(1)).sq_meters.tolist() == (m2 + 1).tolist()
+    assert (LandArea(1) + register).sq_meters.tolist() == (m2 + 1).tolist()
+    assert (register * 2).sq_meters.tolist() == (2 * register).sq_meters.tolist() == (m2 * 2).tolist()
+    assert (register * np.arange(4)).sq_meters.tolist() == (m2 * np.arange(4)).tolist()
+    assert (register / 2).sq_meters.tolist() == (m2 / 2).tolist()
+    assert (register / register).tolist() == [1.0] * 4
+    assert ((register * 2) - register).sq_meters.tolist() == (m2 * 2 - m2).tolist()
+    with pytest.raises(ValueError, match="Resulting area must be non-negative."):
+        register - register * 2
+    with pytest.raises(ValueError, match="Resulting area must be non-negative."):
+        LandArea(1) - register
+    with pytest.raises(ValueError, match="Input value must be non-negative."):
+        register * -1
+    with pytest.raises(TypeError):
+        register + 1
+    with pytest.raises(TypeError):
+        register * register
+
+
+def test_sums_that_overflow_raise():
+    huge = LandAreaArray([1e308, 5])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(ValueError, match="Resulting area must be finite."):
+            huge + huge
+        with pytest.raises(ValueError, match="Resulting area must be finite."):
+            LandArea(1e308) + huge
+        with pytest.raises(ValueError, match="Resulting area must be finite."):
+            LandAreaArray([1e308, 1e308]).sum()
+        with pytest.raises(ValueError, match="Resulting area must be finite."):
+            LandAreaArray([1e308, 1e308]).mean()
+    assert LandAreaArray([1e308, 5]).sum() == LandArea(1e308)
+
+
+def test_numpy_interop(register):
+    m2 = register.sq_meters
+    assert np.asarray(register) is m2
+    assert np.asarray(register, dtype=np.float32).dtype == np.float32
+    assert isinstance(np.sqrt(register), np.ndarray)
+    assert np.sqrt(register).tolist() == np.sqrt(m2).tolist()
+    assert type(m2 + register) is np.ndarray
+    assert (register == register).all()
+    with pytest.raises(ValueError):
+        np.add(register, 1, out=register)
+
+
+def test_pickle(register):
+    restored = pickle.loads(pickle.dumps(register))
+    assert restored.sq_meters.tolist() == register.sq_meters.tolist()
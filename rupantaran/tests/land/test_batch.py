@@ -0,0 +1,197 @@
+import array
+import random
+import warnings
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import rupantaran.land.batch as batch
+import rupantaran.land.terai as terai
+import rupantaran.land.hilly as hilly
+import rupantaran.land.mixed_units as mixed_units
+import rupantaran.land.cross_system as cross_system
+
+TERAI_UNITS = ["bigha", "kattha", "dhur"]
+HILLY_UNITS = ["ropani", "aana", "paisa", "daam"]
+
+# Random values plus a few that sit right on a rounding boundary
+random.seed(7)
+VALUES = [random.uniform(0, 1e4) for _ in range(2000)] + [0, 1, 2.675, 0.125, 1e15, 3.0000005]
+
+
+@pytest.mark.parametrize(
+    "batch_func,scalar_func,units",
+    [
+        (batch.terai_to_sq_meters, terai.terai_to_sq_meters, TERAI_UNITS),
+        (batch.sq_meters_to_terai, terai.sq_meters_to_terai, TERAI_UNITS),
+        (batch.hilly_to_sq_meters, hilly.hilly_to_sq_meters, HILLY_UNITS),
+        (batch.sq_meters_to_hilly, hilly.sq_meters_to_hilly, HILLY_UNITS),
+    ],
+)
+@pytest.mark.parametrize("precision", [0, 2, 4, 7])
+def test_matches_scalar_functions(batch_func, scalar_func, units, precision):
+    for unit in units:
+        expected = [scalar_func(v, unit, precision) for v in VALUES]
+        assert batch_func(VALUES, unit, precision).tolist() == expected
+
+
+@pytest.mark.parametrize(
+    "batch_func,scalar_func,units",
+    [
+        (batch.terai_to_terai, terai.terai_to_terai, TERAI_UNITS),
+        (batch.hilly_to_hilly, hilly.hilly_to_hilly, HILLY_UNITS),
+    ],
+)
+def test_same_system_matches_scalar_functions(batch_func, scalar_func, units):
+    for from_unit in units:
+        for to_unit in units:
+            expected = [scalar_func(v, from_unit, to_unit) for v in VALUES]
+            assert batch_func(VALUES, from_unit, to_unit).tolist() == expected
+
+
+def test_accepted_input_types():
+    expected = [6772.63, 13545.26]
+    assert batch.terai_to_sq_meters([1, 2], "bigha").tolist() == expected
+    assert batch.terai_to_sq_meters((1, 2), "BIGHA").tolist() == expected
+    assert batch.terai_to_sq_meters(array.array("d", [1, 2]), "bigha").tolist() == expected
+    assert batch.terai_to_sq_meters(np.array([1, 2], dtype=np.int32), "bigha").tolist() == expected
+    assert batch.terai_to_sq_meters([], "bigha").shape == (0,)
+
+    # Shape is preserved
+    assert batch.hilly_to_sq_meters(np.ones((2, 3)), "ropani").shape == (2, 3)
+
+
+def test_invalid_inputs():
+    with pytest.raises(ValueError):
+        batch.terai_to_sq_meters([1, 2], "invalid_unit")
+    with pytest.raises(ValueError):
+        batch.hilly_to_hilly([1, 2], "ropani", "invalid_unit")
+    with pytest.raises(ValueError, match="must be a number"):
+        batch.hilly_to_sq_meters(["1", "2"], "ropani")
+
+    with pytest.raises(ValueError, match="Input value must be non-negative"):
+        batch.terai_to_sq_meters([1, -2], "kattha")
+    with pytest.raises(ValueError, match="Input area must be non-negative"):
+        batch.sq_meters_to_hilly(np.array([5.0, -0.1]), "aana")
+
+    with pytest.raises(ValueError, match="Precision must be non-negative"):
+        batch.terai_to_terai([1], "bigha", "kattha", precision=-1)
+
+
+def test_cross_system_matches_fused_functions():
+    for from_unit in TERAI_UNITS:
+        for to_unit in HILLY_UNITS:
+            expected = [cross_system.terai_to_hilly_fused(v, from_unit, to_unit) for v in VALUES]
+            assert batch.terai_to_hilly(VALUES, from_unit, to_unit).tolist() == expected
+            expected = [cross_system.hilly_to_terai_fused(v, to_unit, from_unit, 2) for v in VALUES]
+            assert batch.hilly_to_terai(VALUES, to_unit, from_unit, 2).tolist() == expected
+
+    with pytest.raises(ValueError, match="Unsupported Hilly unit"):
+        batch.terai_to_hilly([1], "bigha", "kattha")
+    with pytest.raises(ValueError, match="Input value must be non-negative"):
+        batch.hilly_to_terai([-1], "ropani", "bigha")
+
+
+def test_parse_mixed_unit():
+    expressions = ["2 ropani 3 aana", "8 aana", "2 ropani 3 aana", ""]
+    assert batch.parse_hilly_mixed_unit(expressions).tolist() == [
+        mixed_units.parse_hilly_mixed_unit(e) for e in expressions
+    ]
+    assert batch.parse_terai_mixed_unit(iter(["1 bigha", "5kattha"])).tolist() == [
+        mixed_units.parse_terai_mixed_unit("1 bigha"),
+        mixed_units.parse_terai_mixed_unit("5 kattha"),
+    ]
+    with pytest.raises(ValueError, match="Unsupported Terai unit"):
+        batch.parse_terai_mixed_unit(["1 bigha", "1 ropani"])
+
+
+@pytest.mark.parametrize("precision", [0, 2, 4])
+def test_mixed_strings_match_scalar_functions(precision):
+    assert batch.sq_meters_to_terai_mixed(VALUES, precision, as_strings=True) == [
+        mixed_units.sq_meters_to_terai_mixed(v, precision) for v in VALUES
+    ]
+    assert batch.sq_meters_to_hilly_mixed(VALUES, precision, as_strings=True) == [
+        mixed_units.sq_meters_to_hilly_mixed(v, precision) for v in VALUES
+    ]
+
+
+def test_mixed_components():
+    parts = batch.sq_meters_to_hilly_mixed([1082.55, 522.5, 0])
+    assert list(parts) == ["ropani", "aana", "paisa", "daam"]
+    assert parts["ropani"].tolist() == [2, 1, 0]
+    assert parts["aana"].tolist() == [2, 0, 0]
+    assert parts["paisa"].tolist() == [0, 1, 0]
+    assert parts["daam"].tolist() == [0.7487, 2.9196, 0.0]
+    assert parts["ropani"].dtype == np.int64
+
+    parts = batch.sq_meters_to_terai_mixed(np.array([8632.08, 13714.56]), precision=2)
+    assert list(parts) == ["bigha", "kattha", "dhur"]
+    assert parts["bigha"].tolist() == [1, 2]
+    assert parts["kattha"].tolist() == [5, 0]
+    assert parts["dhur"].tolist() == [9.82, 10.0]
+
+    with pytest.raises(ValueError, match="Input area must be non-negative"):
+        batch.sq_meters_to_hilly_mixed([1, -1])
+    with pytest.raises(ValueError, match="Precision must be non-negative"):
+        batch.sq_meters_to_terai_mixed([1], precision=-1)
+
+
+@pytest.mark.parametrize("value", [float("inf"), float("nan")])
+def test_mixed_rejects_non_finite(value):
+    with pytest.raises(ValueError, match="Input area must be finite."):
+        batch.sq_meters_to_hilly_mixed([1, value], as_strings=True)
+    with pytest.raises(ValueError, match="Input area must be finite."):
+        batch.sq_meters_to_terai_mixed([value])
+    with pytest.raises(ValueError, match="Input area must be finite."):
+        batch.sq_meters_to_hilly_dash([value])
+
+
+def test_round_like_python_is_quiet_for_non_finite_and_huge_values():
+    from rupantaran._arrays import round_like_python
+
+    values = [np.inf, np.nan, 1e308, -1e308, 2.675]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = round_like_python(np.array(values), 2)
+    assert result[[0, 2, 3, 4]].tolist() == [round(v, 2) for v in (np.inf, 1e308, -1e308, 2.675)]
+    assert np.isnan(result[1])
+
+
+def test_mixed_rejects_counts_beyond_int64():
+    with pytest.raises(ValueError, match="Input area is too large for an int64 count."):
+        batch.sq_meters_to_hilly_mixed([1, 1e308], as_strings=True)
+
+
+def test_dash_notation_matches_scalar_functions():
+    rng = random.Random(0)
+    hilly_rows = [
+        f"{rng.randint(0, 20)}-{rng.randint(0, 15)}-{rng.randint(0, 3)}-{rng.choice(['0', '1.5', ' 3 ', '.5', '2.'])}"
+        for _ in range(1000)
+    ]
+    terai_rows = [f"{rng.randint(0, 9)}-{rng.randint(0, 19)}-{rng.uniform(0, 20):.2f}" for _ in range(1000)]
+    assert batch.parse_hilly_dash(hilly_rows).tolist() == [mixed_units.parse_hilly_dash(r) for r in hilly_rows]
+    assert batch.parse_terai_dash(terai_rows).tolist() == [mixed_units.parse_terai_dash(r) for r in terai_rows]
+    assert batch.parse_hilly_dash([]).tolist() == []
+
+    for precision in (0, 2, 4):
+        assert batch.sq_meters_to_hilly_dash(VALUES, precision) == [
+            mixed_units.sq_meters_to_hilly_dash(v, precision) for v in VALUES
+        ]
+        assert batch.sq_meters_to_terai_dash(VALUES, precision) == [
+            mixed_units.sq_meters_to_terai_dash(v, precision) for v in VALUES
+        ]
+
+
+@pytest.mark.parametrize("rows", [
+    ["1-1-1-1", "2-3-1"],
+    ["1-1-1-1", "2-3-1-0-1"],
+    ["1-1-1-1", "1-1--1"],
+    ["1.2.3-1-1-1"],
+    ["1-1-1-1\n2-2-2-2"],
+    ["1-1-1-x"],
+])
+def test_dash_notation_errors(rows):
+    with pytest.raises(mixed_units.MixedUnitParseError) as info:
+        batch.parse_hilly_dash(rows)
+    assert info.value.expression == rows[-1]
@@ -1,5 +1,10 @@
+import random
+from decimal import Decimal, ROUND_HALF_EVEN
+from fractions import Fraction
+
 import pytest
 import rupantaran.land.cross_system as cross_system
+from rupantaran.land.constants import TERAI_TO_SQ_M, HILLY_TO_SQ_M
 
 
 def test_terai_to_hilly():
@@ -82,3 +87,51 @@ def test_hilly_to_terai():
     # Test negative precision raises error
     with pytest.raises(ValueError, match="Precision must be non-negative"):
         cross_system.hilly_to_terai(1, "ropani", "bigha", precision=-1)
+
+
+def _reference(value, from_m2, to_m2, precision):
+    """High-precision reference: exact rational arithmetic on the decimal constants, rounded once."""
+    exact = Fraction(value) * Fraction(str(from_m2)) / Fraction(str(to_m2))
+    quantum = Decimal(1).scaleb(-precision)
+    rounded = (Decimal(exact.numerator) / Decimal(exact.denominator)).quantize(quantum, ROUND_HALF_EVEN)
+    return float(rounded)
+
+
+def test_fused_matches_high_precision_reference():
+    rng = random.Random(11)
+    values = [rng.uniform(0, 1000) for _ in range(500)] + [0, 1, 3.75, 2.5]
+    for precision in (2, 4, 6):
+        for from_unit, from_m2 in TERAI_TO_SQ_M.items():
+            for to_unit, to_m2 in HILLY_TO_SQ_M.items():
+                for value in values:
+                    expected = _reference(value, from_m2, to_m2, precision)
+                    assert cross_system.terai_to_hilly_fused(value, from_unit, to_unit, precision) == expected
+                    expected = _reference(value, to_m2, from_m2, precision)
+                    assert cross_system.hilly_to_terai_fused(value, to_unit, from_unit, precision) == expected
+
+
+def test_fused_avoids_intermediate_rounding():
+    # 1 dhur = 16.93 m²; 16.93 / 1.99 = 8.50753..., and at 6 decimals the two-step path
+    # carries the 4-decimal rounding of the square meter value into the result.
+    value = 0.123456789
+    exact = _reference(value, 16.93, 1.99, 6)
+    assert cross_system.terai_to_hilly_fused(value, "dhur", "daam", 6) == exact
+    assert cross_system.terai_to_hilly(value, "dhur", "daam", 6) != exact
+
+
+def test_fused_invalid_inputs():
+    assert cross_system.terai_to_hilly_fused(1, "BIGHA", "Ropani") == pytest.approx(13.31, rel=1e-2)
+    assert cross_system.hilly_to_terai_fused(0, "ropani", "bigha") == 0
+
+    with pytest.raises(ValueError, match="Unsupported Terai unit"):
+        cross_system.terai_to_hilly_fused(1, "ropani", "ropani")
+    with pytest.raises(ValueError, match="Unsupported Hilly unit"):
+        cross_system.terai_to_hilly_fused(1, "bigha", "bigha")
+    with pytest.raises(ValueError, match="Unsupported Hilly unit"):
+        cross_system.hilly_to_terai_fused(1, "bigha", "bigha")
+    with pytest.raises(ValueError):
+        cross_system.hilly_to_terai_fused("1", "ropani", "bigha")
+    with pytest.raises(ValueError, match="Input value must be non-negative"):
+        cross_system.terai_to_hilly_fused(-2, "bigha", "ropani")
+    with pytest.raises(ValueError, match="Precision must be non-negative"):
+        cross_system.hilly_to_terai_fused(1, "ropani", "bigha", precision=-1)
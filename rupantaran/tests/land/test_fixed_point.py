@@ -0,0 +1,117 @@
+import random
+
+import pytest
+import rupantaran.land.fixed_point as fixed_point
+import rupantaran.land.mixed_units as mixed_units
+
+
+def test_base_unit_tables():
+    assert fixed_point.HILLY_BASE_PER_UNIT == {"ropani": 256000, "aana": 16000, "paisa": 4000, "daam": 1000}
+    assert fixed_point.TERAI_BASE_PER_UNIT == {"bigha": 400000, "kattha": 20000, "dhur": 1000}
+
+
+def test_unit_to_fixed():
+    assert fixed_point.hilly_to_fixed(2.5, "ropani") == 640000
+    assert fixed_point.hilly_to_fixed(1, "Daam") == 1000
+    assert fixed_point.hilly_to_fixed(0.0004, "daam") == 0
+    assert fixed_point.terai_to_fixed(3, "kattha") == 60000
+    assert isinstance(fixed_point.terai_to_fixed(1.5, "bigha"), int)
+
+    with pytest.raises(ValueError, match="Unsupported Hilly unit"):
+        fixed_point.hilly_to_fixed(1, "bigha")
+    with pytest.raises(ValueError, match="Input value must be non-negative"):
+        fixed_point.terai_to_fixed(-1, "bigha")
+    with pytest.raises(ValueError, match="must be a number"):
+        fixed_point.terai_to_fixed("1", "bigha")
+
+
+def test_sq_meters_round_trip():
+    assert fixed_point.sq_meters_to_hilly_fixed(508.74) == 256000
+    assert fixed_point.sq_meters_to_terai_fixed(6772.63) == 400000
+    assert fixed_point.hilly_fixed_to_sq_meters(512000) == pytest.approx(1017.48)
+    assert fixed_point.terai_fixed_to_sq_meters(400000) == pytest.approx(6772.63)
+
+    with pytest.raises(ValueError, match="Input area must be non-negative"):
+        fixed_point.sq_meters_to_hilly_fixed(-1)
+    with pytest.raises(ValueError, match="must be an integer"):
+        fixed_point.hilly_fixed_to_sq_meters(1.5)
+    with pytest.raises(ValueError, match="Input count must be non-negative"):
+        fixed_point.terai_fixed_to_sq_meters(-1)
+
+
+def test_components_and_format():
+    assert fixed_point.hilly_fixed_components(548500) == (2, 2, 1, 0.5)
+    assert fixed_point.terai_fixed_components(510500) == (1, 5, 10.5)
+    assert fixed_point.format_hilly_fixed(548500) == "2 ropani 2 aana 1 paisa 0.500 daam"
+    assert fixed_point.format_terai_fixed(510500) == "1 bigha 5 kattha 10.500 dhur"
+    assert fixed_point.format_hilly_fixed(0) == "0 ropani 0 aana 0 paisa 0.000 daam"
+
+    with pytest.raises(ValueError):
+        fixed_point.format_terai_fixed(1.0)
+    with pytest.raises(ValueError):
+        fixed_point.hilly_fixed_components(-5)
+
+
+def test_parse_and_exact_sums():
+    assert fixed_point.parse_hilly_fixed("2 ropani 3 aana 2 paisa") == 568000
+    assert fixed_point.parse_terai_fixed("1 bigha 5 kattha 10.5 dhur") == 510500
+    assert fixed_point.format_hilly_fixed(fixed_point.parse_hilly_fixed("1 ropani 15 aana 3 paisa 3.999 daam")) == \
+        "1 ropani 15 aana 3 paisa 3.999 daam"
+
+    # A long run of small parcels sums exactly; the same sum in floats drifts
+    rng = random.Random(3)
+    parcels = [f"{rng.randint(0, 3)} paisa {rng.randint(0, 3)}.{rng.randint(0, 999):03d} daam" for _ in range(10000)]
+    total = sum(fixed_point.parse_hilly_fixed(p) for p in parcels)
+    expected = sum(int(p.split()[0]) * 4000 + int(p.split()[2].replace(".", "")) for p in parcels)
+    assert total == expected
+
+    with pytest.raises(ValueError):
+        fixed_point.parse_hilly_fixed("1 bigha")
+    with pytest.raises(mixed_units.MixedUnitParseError):
+        fixed_point.parse_terai_fixed("-1 bigha")
+
+
+def test_arrays():
+    np = pytest.importorskip("numpy")
+    counts = fixed_point.hilly_to_fixed(np.array([2.5, 1, 0]), "ropani")
+    assert counts.dtype == np.int64
+    assert counts.tolist() == [640000, 256000, 0]
+
+    ropani, aana, paisa, daam = fixed_point.hilly_fixed_components(np.array([548500, 1000]))
+    assert ropani.tolist() == [2, 0]
+    assert aana.tolist() == [2, 0]
+    assert paisa.tolist() == [1, 0]
+    assert daam.tolist() == [0.5, 1.0]
+
+    counts = fixed_point.sq_meters_to_terai_fixed([6772.63, 338.63])
+    assert counts.tolist() == [400000, 20000]
+    assert fixed_point.terai_fixed_to_sq_meters(counts).tolist() == pytest.approx([6772.63, 338.6315])
+    assert fixed_point.format_terai_fixed(counts.sum()) == "1 bigha 1 kattha 0.000 dhur"
+
+    with pytest.raises(ValueError, match="must be an integer"):
+        fixed_point.hilly_fixed_components(np.array([1.5]))
+    with pytest.raises(ValueError, match="Input value must be non-negative"):
+        fixed_point.hilly_to_fixed(np.array([1, -1]), "aana")
+
+
+@pytest.mark.parametrize("value", [float("inf"), float("nan")])
+def test_non_finite_values(value):
+    with pytest.raises(ValueError, match="Input value must be finite."):
+        fixed_point.hilly_to_fixed(value, "ropani")
+    with pytest.raises(ValueError, match="Input area must be finite."):
+        fixed_point.sq_meters_to_terai_fixed(value)
+    with pytest.raises(ValueError, match="Input value must be finite."):
+        fixed_point.parse_hilly_fixed("1e400 ropani")
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="Input area must be finite."):
+        fixed_point.sq_meters_to_hilly_fixed(np.array([1.0, value]))
+    with pytest.raises(ValueError, match="Input value must be finite."):
+        fixed_point.terai_to_fixed([1.0, value], "bigha")
+
+
+def test_array_counts_must_fit_int64():
+    np = pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="Input value is too large for an int64 count."):
+        fixed_point.hilly_to_fixed(np.array([1.0, 1e17]), "ropani")
+    # Python numbers have no such bound
+    assert fixed_point.hilly_to_fixed(1e17, "ropani") == int(1e17) * 256_000
@@ -1,5 +1,6 @@
 import pytest
 import rupantaran.land.mixed_units as mixed_units
+import rupantaran._parsing as _parsing
 
 
 
@@ -68,6 +69,96 @@ def test_parse_hilly_mixed_unit():
 
 
 
+def test_parse_mixed_unit_separators():
+    # Glued values and comma separators parse like the spaced form
+    spaced = mixed_units.parse_hilly_mixed_unit("2 ropani 3 aana 2 paisa")
+    assert mixed_units.parse_hilly_mixed_unit("2ropani 3aana 2paisa") == spaced
+    assert mixed_units.parse_hilly_mixed_unit("2 ropani, 3 aana, 2 paisa") == spaced
+    assert mixed_units.parse_hilly_mixed_unit("  2ropani,3aana,2paisa  ") == spaced
+    assert mixed_units.parse_terai_mixed_unit("1bigha, 5 kattha,10dhur") == \
+        mixed_units.parse_terai_mixed_unit("1 bigha 5 kattha 10 dhur")
+    assert mixed_units.parse_terai_mixed_unit("0.5 bigha") == pytest.approx(3386.315, rel=1e-6)
+    assert mixed_units.parse_terai_mixed_unit("") == 0
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [",2 ropani", "2 ropani,, 3 aana", "2, ropani", "2 ropani 3, aana", "2 ropani , , 3 aana", ","],
+)
+def test_misplaced_commas_are_rejected_on_both_paths(expression):
+    # The split fast path and the regex scanner must accept the same strings
+    factors = {"ropani": 1.0, "aana": 1.0}
+    with pytest.raises(mixed_units.MixedUnitParseError):
+        _parsing.sum_pairs(expression, factors, "Hilly")
+    with pytest.raises(mixed_units.MixedUnitParseError):
+        _parsing._scan(expression, factors, "Hilly")
+    with pytest.raises(mixed_units.MixedUnitParseError):
+        mixed_units.parse_hilly_mixed_unit(expression)
+
+
+@pytest.mark.parametrize("expression", ["2 ropani, 3 aana", "2 ropani ,3 aana,", "2 ropani 3 aana , "])
+def test_commas_after_units_are_accepted_on_both_paths(expression):
+    factors = {"ropani": 16.0, "aana": 1.0}
+    assert _parsing.sum_pairs(expression, factors, "Hilly") == _parsing._scan(expression, factors, "Hilly") == 35.0
+
+
+def test_parse_mixed_unit_error_position():
+    with pytest.raises(mixed_units.MixedUnitParseError, match="Unsupported Hilly unit: bigha") as exc:
+        mixed_units.parse_hilly_mixed_unit("2 ropani 1 bigha")
+    assert exc.value.position == 11
+
+    with pytest.raises(mixed_units.MixedUnitParseError, match="expected a number") as exc:
+        mixed_units.parse_terai_mixed_unit("1 bigha kattha")
+    assert exc.value.position == 8
+
+    with pytest.raises(mixed_units.MixedUnitParseError, match="expected a unit") as exc:
+        mixed_units.parse_terai_mixed_unit("1 bigha 5")
+    assert exc.value.position == 8
+
+    with pytest.raises(ValueError, match="Input value must be non-negative") as exc:
+        mixed_units.parse_hilly_mixed_unit("2 ropani -3 aana")
+    assert exc.value.position == 9
+
+    # The error shows the expression as given, not the lowercased cache key
+    with pytest.raises(mixed_units.MixedUnitParseError, match=r"Unsupported Hilly unit: Bigha \(at position 11 in '2 ROPANI 1 Bigha'\)") as exc:
+        mixed_units.parse_hilly_mixed_unit("2 ROPANI 1 Bigha")
+    assert exc.value.expression == "2 ROPANI 1 Bigha"
+
+
+def test_parse_cache():
+    mixed_units.clear_parse_cache()
+    try:
+        mixed_units.set_parse_cache_size(2)
+        first = mixed_units.parse_hilly_mixed_unit("1 ropani 8 aana")
+        # Normalized key: case does not matter
+        assert mixed_units.parse_hilly_mixed_unit("1 Ropani 8 AANA") == first
+        # Same string, other system: separate entry
+        with pytest.raises(ValueError):
+            mixed_units.parse_terai_mixed_unit("1 ropani 8 aana")
+        info = mixed_units.parse_cache_info()
+        assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 2, 0, 1)
+
+        mixed_units.parse_terai_mixed_unit("1 bigha")
+        mixed_units.parse_terai_mixed_unit("2 bigha")
+        info = mixed_units.parse_cache_info()
+        assert (info.evictions, info.currsize, info.maxsize) == (1, 2, 2)
+
+        mixed_units.clear_parse_cache()
+        assert mixed_units.parse_cache_info() == (0, 0, 0, 2, 0)
+
+        mixed_units.set_parse_cache_size(0)
+        assert mixed_units.parse_hilly_mixed_unit("1 ropani 8 aana") == first
+        assert mixed_units.parse_cache_info().currsize == 0
+
+        with pytest.raises(ValueError):
+            mixed_units.set_parse_cache_size(-1)
+        with pytest.raises(ValueError):
+            mixed_units.set_parse_cache_size(True)
+    finally:
+        mixed_units.set_parse_cache_size(4096)
+        mixed_units.clear_parse_cache()
+
+
 def test_sq_meters_to_terai_mixed():
     # Basic conversions
     assert mixed_units.sq_meters_to_terai_mixed(8632.08,precision=2) == "1 bigha 5 kattha 9.82 dhur"
@@ -174,3 +265,34 @@ def test_hilly_mixed_to_terai_mixed():
     # Test negative precision
     with pytest.raises(ValueError, match="Precision must be non-negative"):
         mixed_units.hilly_mixed_to_terai_mixed("2 ropani 3 aana", precision=-1)
+
+
+def test_dash_notation():
+    assert mixed_units.parse_hilly_dash("2-3-1-0") == pytest.approx(
+        mixed_units.parse_hilly_mixed_unit("2 ropani 3 aana 1 paisa 0 daam")
+    )
+    assert mixed_units.parse_terai_dash(" 1 - 5 - 10 ") == pytest.approx(
+        mixed_units.parse_terai_mixed_unit("1 bigha 5 kattha 10 dhur")
+    )
+    assert mixed_units.parse_hilly_dash("0-8-0-2.5") == pytest.approx(8 * 31.79 + 2.5 * 1.99)
+
+    assert mixed_units.sq_meters_to_hilly_dash(1082.55, precision=2) == "2-2-0-0.75"
+    assert mixed_units.sq_meters_to_hilly_dash(0) == "0-0-0-0"
+    assert mixed_units.sq_meters_to_terai_dash(8632.08, precision=2) == "1-5-9.82"
+    area = mixed_units.parse_terai_dash("2-3-4")
+    assert mixed_units.sq_meters_to_terai_dash(area, precision=0) == "2-3-4"
+
+
+def test_dash_notation_errors():
+    with pytest.raises(mixed_units.MixedUnitParseError, match="must have 4 values") as info:
+        mixed_units.parse_hilly_dash("2-3-1")
+    assert info.value.position == 0
+    with pytest.raises(mixed_units.MixedUnitParseError, match="expected a number") as info:
+        mixed_units.parse_terai_dash("1-x-2")
+    assert info.value.position == 2
+    with pytest.raises(ValueError, match="non-negative"):
+        mixed_units.parse_terai_dash("-1-2-3")
+    with pytest.raises(ValueError, match="Input area must be non-negative"):
+        mixed_units.sq_meters_to_hilly_dash(-1)
+    with pytest.raises(ValueError, match="Precision must be non-negative"):
+        mixed_units.sq_meters_to_terai_dash(1, precision=-1)
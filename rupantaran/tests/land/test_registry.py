@@ -0,0 +1,50 @@
+import pytest
+import rupantaran.land.registry as registry
+import rupantaran.land.terai as terai
+import rupantaran.land.hilly as hilly
+from rupantaran.land.constants import TERAI_TO_SQ_M, HILLY_TO_SQ_M
+
+
+def test_factor_matrix_shape():
+    n = len(registry.LAND_UNITS)
+    assert n == 8
+    assert len(registry.FACTOR_MATRIX) == n
+    assert all(len(row) == n for row in registry.FACTOR_MATRIX)
+    for unit, i in registry.UNIT_INDEX.items():
+        assert registry.LAND_UNITS[i] == unit
+        assert registry.FACTOR_MATRIX[i][i] == 1
+
+
+def test_factors_match_existing_functions():
+    for unit in TERAI_TO_SQ_M:
+        assert registry.get_converter(unit, "sq_m")(3.5) == 3.5 * TERAI_TO_SQ_M[unit]
+        for other in TERAI_TO_SQ_M:
+            assert registry.get_converter(unit, other, precision=4)(2.5) == \
+                terai.terai_to_terai(2.5, unit, other)
+    for unit in HILLY_TO_SQ_M:
+        assert registry.get_converter(unit, "sq_m", precision=4)(7) == hilly.hilly_to_sq_meters(7, unit)
+        for other in HILLY_TO_SQ_M:
+            assert registry.get_converter(unit, other, precision=4)(2.5) == \
+                hilly.hilly_to_hilly(2.5, unit, other)
+
+    # Cross-system pairs go through square meters
+    assert registry.get_factor("bigha", "ropani") == pytest.approx(6772.63 / 508.74)
+    assert registry.get_factor("sq_m", "aana") == pytest.approx(1 / 31.79)
+    assert registry.get_factor("Aana", "KATTHA") == pytest.approx(31.79 / 338.63)
+
+
+def test_get_converter():
+    convert = registry.get_converter("bigha", "kattha")
+    assert convert.factor == 20
+    assert convert(3) == 60
+    assert convert.__name__ == "bigha_to_kattha"
+
+    convert = registry.get_converter("ropani", "bigha", precision=2)
+    assert convert(1) == 0.08
+
+    with pytest.raises(ValueError, match="Unsupported land unit"):
+        registry.get_converter("bigha", "invalid_unit")
+    with pytest.raises(ValueError, match="Unsupported land unit"):
+        registry.get_factor("invalid_unit", "sq_m")
+    with pytest.raises(ValueError, match="Precision must be non-negative"):
+        registry.get_converter("bigha", "ropani", precision=-1)
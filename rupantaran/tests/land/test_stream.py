@@ -0,0 +1,79 @@
+import csv
+import io
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import rupantaran.land.stream as stream
+import rupantaran.land.mixed_units as mixed_units
+import rupantaran.land.terai as terai
+import rupantaran.land.registry as registry
+
+
+def _rows(text):
+    return list(csv.reader(io.StringIO(text)))
+
+
+def test_mixed_expressions_to_other_system():
+    source = io.StringIO("id,area\n1,2 ropani 3 aana\n2,8 aana\n3,1 ropani\n")
+    destination = io.StringIO()
+    reports = list(stream.iter_convert_csv(source, destination, "area", from_unit="hilly",
+                                           to_unit="terai", chunk_size=2))
+
+    assert [r.rows for r in reports] == [2, 1]
+    assert reports[-1].total_rows == 3
+    assert all(r.rows_per_second > 0 for r in reports)
+
+    rows = _rows(destination.getvalue())
+    assert rows[0] == ["id", "area", "area_terai"]
+    assert rows[1] == ["1", "2 ropani 3 aana", mixed_units.hilly_mixed_to_terai_mixed("2 ropani 3 aana")]
+    assert rows[3][2] == mixed_units.hilly_mixed_to_terai_mixed("1 ropani")
+
+
+def test_single_unit_column(tmp_path):
+    source = tmp_path / "in.tsv"
+    source.write_text("parcel\tbigha\nA\t1\nB\t2.5\n", encoding="utf-8")
+    destination = tmp_path / "out.tsv"
+    report = stream.convert_csv(str(source), str(destination), "bigha", from_unit="bigha",
+                                to_unit="sq_m", output_column="m2", delimiter="\t")
+
+    assert report.rows == 2
+    rows = [line.split("\t") for line in destination.read_text(encoding="utf-8").splitlines()]
+    assert rows[0] == ["parcel", "bigha", "m2"]
+    assert float(rows[2][2]) == terai.terai_to_sq_meters(2.5, "bigha")
+
+
+def test_value_and_unit_columns():
+    source = io.StringIO("value,unit\n1,bigha\n2,Ropani\n16,aana\n")
+    destination = io.StringIO()
+    stream.convert_csv(source, destination, "value", unit_column="unit", to_unit="ropani", precision=3)
+
+    rows = _rows(destination.getvalue())
+    assert [float(r[2]) for r in rows[1:]] == [
+        round(registry.get_factor("bigha", "ropani"), 3),
+        2.0,
+        round(16 * 31.79 / 508.74, 3),
+    ]
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="Unsupported target unit"):
+        list(stream.iter_convert_csv(io.StringIO("a\n1\n"), io.StringIO(), "a", from_unit="bigha", to_unit="acre"))
+    with pytest.raises(ValueError, match="exactly one"):
+        list(stream.iter_convert_csv(io.StringIO("a\n1\n"), io.StringIO(), "a"))
+    with pytest.raises(ValueError, match="not found"):
+        stream.convert_csv(io.StringIO("a\n1\n"), io.StringIO(), "b", from_unit="bigha")
+    with pytest.raises(ValueError, match="Rows 3-4: Input value must be a number"):
+        stream.convert_csv(io.StringIO("a\n1\n2\nx\n4\n"), io.StringIO(), "a", from_unit="bigha", chunk_size=2)
+    with pytest.raises(ValueError, match="Rows 1-2: Unsupported Hilly unit"):
+        stream.convert_csv(io.StringIO("a\n1 ropani\n1 bigha\n"), io.StringIO(), "a", from_unit="hilly")
+    with pytest.raises(ValueError, match="Row 3: expected at least 2 columns, got 1."):
+        stream.convert_csv(io.StringIO("a,b\n1,2\n3,4\n5\n"), io.StringIO(), "b", from_unit="bigha", chunk_size=2)
+    with pytest.raises(ValueError, match="Row 1: expected at least 3 columns, got 2."):
+        stream.convert_csv(io.StringIO("v,x,u\n1,2\n"), io.StringIO(), "v", unit_column="u", to_unit="sq_m")
+
+    # An empty file writes nothing
+    destination = io.StringIO()
+    assert stream.convert_csv(io.StringIO(""), destination, "a", from_unit="bigha").rows == 0
+    assert destination.getvalue() == ""
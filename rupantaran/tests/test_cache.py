@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from rupantaran._cache import LRUCache
+
+
+def test_counters():
+    cache = LRUCache(lambda x: x * 2, maxsize=2)
+    assert [cache.call(x) for x in (1, 1, 2, 3)] == [2, 2, 4, 6]
+    assert cache.info() == (1, 3, 1, 2, 2)
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 2, 0)
+
+
+def test_concurrent_misses_on_one_key_are_not_evictions():
+    # Both threads are inside the function at once; lru_cache keeps one of the two results
+    barrier = threading.Barrier(2)
+
+    def slow_double(x):
+        barrier.wait(timeout=5)
+        return x * 2
+
+    cache = LRUCache(slow_double, maxsize=4)
+    threads = [threading.Thread(target=cache.call, args=(21,)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    info = cache.info()
+    assert (info.misses, info.evictions, info.currsize) == (2, 0, 1)
+
+
+def test_failed_calls_are_not_counted():
+    def parse(text):
+        return float(text)
+
+    cache = LRUCache(parse, maxsize=4)
+    with pytest.raises(ValueError):
+        cache.call("x")
+    assert cache.call("1") == 1.0
+    assert cache.info().evictions == 0
+
+
+@pytest.mark.parametrize("maxsize", [-1, 1.5, True])
+def test_invalid_size(maxsize):
+    with pytest.raises(ValueError, match="Cache size must be a non-negative integer."):
+        LRUCache(abs, maxsize)
@@ -0,0 +1,139 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from rupantaran import fast
+from rupantaran.cli import main
+from rupantaran.land import batch, mixed_units
+
+
+def _write(tmp_path, text, name="input.txt"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_lines(tmp_path, capsys):
+    path = _write(tmp_path, "1\n2.5\n 3 \n")
+    assert main(["--from", "bigha", "--to", "ropani", path]) == 0
+    expected = [fast.convert_land(value, "bigha", "ropani") for value in (1, 2.5, 3)]
+    assert capsys.readouterr().out.split() == [str(value) for value in expected]
+
+
+def test_lines_chunks_and_files_keep_order(tmp_path, capsys):
+    first = _write(tmp_path, "".join(f"{i}\n" for i in range(10)), "a.txt")
+    second = _write(tmp_path, "".join(f"{i}\n" for i in range(10, 15)), "b.txt")
+    assert main(["--from", "tola", "--to", "g", "--precision", "2", "--chunk-size", "3", first, second]) == 0
+    assert capsys.readouterr().out.split() == [str(fast.convert_weight(i, "tola", "g", 2)) for i in range(15)]
+
+
+def test_mixed_units(tmp_path, capsys):
+    path = _write(tmp_path, "2 ropani 3 aana\n1 ropani\n")
+    assert main(["--from", "hilly", "--to", "terai", "--precision", "2", path]) == 0
+    areas = [mixed_units.parse_hilly_mixed_unit(text) for text in ("2 ropani 3 aana", "1 ropani")]
+    assert capsys.readouterr().out.splitlines() == batch.sq_meters_to_terai_mixed(areas, 2, as_strings=True)
+
+
+def test_raise_reports_the_bad_line(tmp_path, capsys):
+    path = _write(tmp_path, "1\n2\n-3\n4\n")
+    assert main(["--from", "bigha", "--to", "ropani", "--chunk-size", "2", path]) == 1
+    captured = capsys.readouterr()
+    assert captured.err.strip() == f"rupantaran: {path}:3: value is negative"
+    assert len(captured.out.split()) == 2
+
+
+def test_coerce_leaves_bad_records_empty(tmp_path, capsys):
+    path = _write(tmp_path, "1\nx\n\n-1\n")
+    assert main(["--from", "kattha", "--to", "sq_m", "--errors", "coerce", path]) == 0
+    assert capsys.readouterr().out.split("\n") == [str(fast.convert_land(1, "kattha", "sq_m")), "", "", "", ""]
+
+
+def test_coerce_leaves_oversized_records_empty(tmp_path, capsys):
+    path = _write(tmp_path, "5\n1e300\n7\n")
+    assert main(["--from", "sq_m", "--to", "hilly", "--errors", "coerce", path]) == 0
+    assert capsys.readouterr().out.split("\n") == [
+        mixed_units.sq_meters_to_hilly_mixed(5), "", mixed_units.sq_meters_to_hilly_mixed(7), ""
+    ]
+    assert main(["--from", "sq_m", "--to", "hilly", path]) == 1
+    assert capsys.readouterr().err.strip() == f"rupantaran: {path}:2: value is too large"
+
+    path = _write(tmp_path, "1e308\n2\n")
+    assert main(["--from", "bigha", "--to", "sq_m", "--errors", "coerce", path]) == 0
+    assert capsys.readouterr().out.split("\n") == ["", str(fast.convert_land(2, "bigha", "sq_m")), ""]
+
+
+def test_csv(tmp_path, capsys):
+    path = _write(tmp_path, 'id,area\n1,2 ropani\n2,"3 ropani, 2 aana"\n3,nonsense\n', "input.csv")
+    assert main(["--from", "hilly", "--to", "sq_m", "--format", "csv", "--column", "area", "--errors", "coerce", path]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == "id,area,sq_m"
+    assert lines[1] == f"1,2 ropani,{mixed_units.parse_hilly_mixed_unit('2 ropani')}"
+    assert lines[2].startswith('2,"3 ropani, 2 aana",')
+    assert lines[3] == "3,nonsense,"
+
+
+def test_csv_without_header(tmp_path, capsys):
+    path = _write(tmp_path, "a,1\nb,2\n", "input.csv")
+    assert main(["--from", "sher", "--to", "kg", "--format", "csv", "--no-header", "--column", "1", path]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        f"a,1,{fast.convert_weight(1, 'sher', 'kg')}", f"b,2,{fast.convert_weight(2, 'sher', 'kg')}"
+    ]
+
+
+def test_jsonl(tmp_path, capsys):
+    path = _write(tmp_path, '{"id": 1, "g": 2250}\n{"id": 2, "g": "x"}\nnot json\n', "input.jsonl")
+    argv = ["--from", "g", "--to", "tola", "--format", "jsonl", "--column", "g", "--output-column", "tola"]
+    assert main(argv + ["--errors", "coerce", path]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert json.loads(lines[0]) == {"id": 1, "g": 2250, "tola": fast.convert_weight(2250, "g", "tola")}
+    assert json.loads(lines[1])["tola"] is None
+    assert lines[2] == "not json"
+
+    assert main(argv + [path]) == 1
+    assert capsys.readouterr().err.strip() == f"rupantaran: {path}:2: value is not a number"
+
+
+def test_jsonl_huge_integer(tmp_path, capsys):
+    path = _write(tmp_path, '{"value": 1%s}\n{"value": 1}\n' % ("0" * 400), "input.jsonl")
+    argv = ["--from", "sq_m", "--to", "ropani", "--format", "jsonl"]
+    assert main(argv + ["--errors", "coerce", path]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert json.loads(lines[0])["ropani"] is None
+    assert json.loads(lines[1])["ropani"] == fast.convert_land(1, "sq_m", "ropani")
+    assert main(argv + [path]) == 1
+    assert capsys.readouterr().err.strip() == f"rupantaran: {path}:1: value is too large"
+
+
+@pytest.mark.parametrize(
+    "argv, message",
+    [
+        (["--from", "acre", "--to", "sq_m"], "Unsupported unit: acre"),
+        (["--from", "bigha", "--to", "kg"], "measure different quantities"),
+        (["--from", "bigha", "--to", "sq_m", "--precision", "-1"], "Precision must be non-negative."),
+        (["--from", "bigha", "--to", "sq_m", "--workers", "0"], "Number of workers must be positive."),
+        (["--from", "bigha", "--to", "sq_m", "--chunk-size", "0"], "Chunk size must be positive."),
+    ],
+)
+def test_invalid_arguments(argv, message, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(argv)
+    assert excinfo.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+def test_missing_file(tmp_path, capsys):
+    assert main(["--from", "bigha", "--to", "sq_m", str(tmp_path / "missing.txt")]) == 1
+    assert "missing.txt" in capsys.readouterr().err
+
+
+def test_stdin_and_workers():
+    values = "".join(f"{i}\n" for i in range(1000))
+    result = subprocess.run(
+        [sys.executable, "-m", "rupantaran", "--from", "dhur", "--to", "sq_m", "--workers", "2", "--chunk-size", "100"],
+        input=values, capture_output=True, text=True, check=True,
+    )
+    assert result.stdout.split() == [str(fast.convert_land(i, "dhur", "sq_m")) for i in range(1000)]
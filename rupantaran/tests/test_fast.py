@@ -0,0 +1,55 @@
+import itertools
+
+import pytest
+from rupantaran import fast
+from rupantaran import weight
+from rupantaran.land import cross_system, hilly, registry, terai
+from rupantaran.land.constants import HILLY_TO_SQ_M, TERAI_TO_SQ_M
+from rupantaran.weight.registry import WEIGHT_UNITS
+
+VALUES = [0, 1, 2.5, 0.123456, 17, 1234.5678]
+PRECISIONS = [0, 2, 4]
+
+
+@pytest.mark.parametrize("value, precision", list(itertools.product(VALUES, PRECISIONS)))
+def test_single_system_functions_match(value, precision):
+    for unit in TERAI_TO_SQ_M:
+        assert fast.terai_to_sq_meters(value, unit, precision) == terai.terai_to_sq_meters(value, unit, precision)
+        assert fast.sq_meters_to_terai(value, unit, precision) == terai.sq_meters_to_terai(value, unit, precision)
+        for other in TERAI_TO_SQ_M:
+            assert fast.terai_to_terai(value, unit, other, precision) == terai.terai_to_terai(value, unit, other, precision)
+    for unit in HILLY_TO_SQ_M:
+        assert fast.hilly_to_sq_meters(value, unit, precision) == hilly.hilly_to_sq_meters(value, unit, precision)
+        assert fast.sq_meters_to_hilly(value, unit, precision) == hilly.sq_meters_to_hilly(value, unit, precision)
+        for other in HILLY_TO_SQ_M:
+            assert fast.hilly_to_hilly(value, unit, other, precision) == hilly.hilly_to_hilly(value, unit, other, precision)
+
+
+@pytest.mark.parametrize("value, precision", list(itertools.product(VALUES, PRECISIONS)))
+def test_cross_system_functions_match(value, precision):
+    for t, h in itertools.product(TERAI_TO_SQ_M, HILLY_TO_SQ_M):
+        assert fast.terai_to_hilly(value, t, h, precision) == cross_system.terai_to_hilly(value, t, h, precision)
+        assert fast.hilly_to_terai(value, h, t, precision) == cross_system.hilly_to_terai(value, h, t, precision)
+        assert fast.terai_to_hilly_fused(value, t, h, precision) == cross_system.terai_to_hilly_fused(value, t, h, precision)
+        assert fast.hilly_to_terai_fused(value, h, t, precision) == cross_system.hilly_to_terai_fused(value, h, t, precision)
+
+
+def test_convert_land_matches_registry():
+    for a, b in itertools.product(registry.LAND_UNITS, repeat=2):
+        assert fast.convert_land(2.5, a, b) == round(2.5 * registry.get_factor(a, b), 4)
+
+
+@pytest.mark.parametrize("value, precision", list(itertools.product(VALUES, PRECISIONS)))
+def test_convert_weight_matches(value, precision):
+    for a, b in itertools.product(WEIGHT_UNITS, repeat=2):
+        expected = weight.convert(value, a, b, precision)
+        assert fast.convert_weight(value, a, b, precision) == expected
+        if a != b:
+            assert getattr(weight, f"from_{a}")(value, b, precision) == expected
+
+
+def test_unknown_unit_raises_key_error():
+    with pytest.raises(KeyError):
+        fast.terai_to_sq_meters(1, "Bigha")
+    with pytest.raises(KeyError):
+        fast.convert_weight(1, "tola", "stone")
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+import rupantaran
+import rupantaran.land
+import rupantaran.weight
+
+
+def run(code: str) -> str:
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return completed.stdout.strip()
+
+
+def test_package_imports_load_nothing_else():
+    loaded = run(
+        "import sys, rupantaran, rupantaran.land, rupantaran.weight\n"
+        "print(sorted(m for m in sys.modules if m.startswith(('rupantaran', 'numpy', 'pandas'))))"
+    )
+    assert loaded == "['rupantaran', 'rupantaran._lazy', 'rupantaran.land', 'rupantaran.weight']"
+
+
+def test_star_imports_do_not_load_optional_dependencies():
+    loaded = run(
+        "import sys\n"
+        "from rupantaran import *\n"
+        "from rupantaran.land import *\n"
+        "from rupantaran.weight import *\n"
+        "print([m for m in ('numpy', 'pandas') if m in sys.modules])"
+    )
+    assert loaded == "[]"
+
+
+def test_lazy_attributes():
+    from rupantaran.land.area import LandArea
+    from rupantaran.weight.weight import from_tola
+
+    assert rupantaran.weight.from_tola is from_tola
+    assert rupantaran.land.LandArea is LandArea
+    assert rupantaran.land.terai.__name__ == "rupantaran.land.terai"
+    assert rupantaran.fast.__name__ == "rupantaran.fast"
+    assert "from_tola" in dir(rupantaran.weight) and "batch" in dir(rupantaran.weight)
+    assert "LandAreaArray" in dir(rupantaran.land)
+    assert rupantaran.__all__ == ["fast", "land", "weight"]
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError, match="module 'rupantaran.land' has no attribute 'acre'"):
+        rupantaran.land.acre
+    with pytest.raises(ImportError):
+        from rupantaran.weight import from_stone  # noqa: F401
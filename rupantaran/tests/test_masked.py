@@ -0,0 +1,114 @@
+import warnings
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from rupantaran import masked
+from rupantaran.land import batch, mixed_units, terai
+from rupantaran.weight import batch as weight_batch
+from rupantaran.weight import mixed_units as weight_mixed_units
+
+
+def test_check_values_codes():
+    result = masked.check_values([2.5, -1, "x", None, float("nan"), np.int64(3), True, float("inf")])
+    assert result.errors.tolist() == [
+        masked.OK, masked.NEGATIVE, masked.NOT_A_NUMBER, masked.MISSING, masked.MISSING, masked.OK,
+        masked.NOT_A_NUMBER, masked.NOT_FINITE,
+    ]
+    assert result.values[[0, 5]].tolist() == [2.5, 3.0]
+    assert np.isnan(result.values[1:5]).all() and np.isnan(result.values[6:]).all()
+    assert result.valid.tolist() == [True, False, False, False, False, True, False, False]
+
+
+def test_check_values_arrays():
+    result = masked.check_values(np.array([1.0, -2.0, np.nan]))
+    assert result.errors.tolist() == [masked.OK, masked.NEGATIVE, masked.MISSING]
+    assert masked.check_values(np.array(["1", "2"])).errors.tolist() == [masked.NOT_A_NUMBER] * 2
+    assert masked.check_values([]).values.tolist() == []
+    # Booleans are not numbers, as for the SQLite functions and LandArea
+    assert masked.check_values(np.array([True, False])).errors.tolist() == [masked.NOT_A_NUMBER] * 2
+    infinite = masked.check_values(np.array([np.inf, -np.inf, 1.0]))
+    assert infinite.errors.tolist() == [masked.NOT_FINITE, masked.NEGATIVE, masked.OK]
+    with pytest.raises(ValueError, match="Input values must be one-dimensional."):
+        masked.check_values([[1, 2], [3, 4]])
+    with pytest.raises(ValueError, match="Input values must be one-dimensional."):
+        masked.convert_land(np.ones((2, 2)), "bigha", "sq_m")
+
+
+def test_non_finite_rows_are_masked_without_warnings():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = masked.convert_land([1.0, float("inf"), 1e308, float("nan")], "bigha", "sq_m", precision=2)
+        parsed = masked.parse_hilly(["1e308 ropani", "1 ropani"])
+    assert result.errors.tolist() == [masked.OK, masked.NOT_FINITE, masked.OVERFLOW, masked.MISSING]
+    assert result.values[0] == terai.terai_to_sq_meters(1, "bigha", 2)
+    assert np.isnan(result.values[1:]).all()
+    assert result.report()[1] == (2, masked.OVERFLOW, "value is too large")
+    assert parsed.errors.tolist() == [masked.OVERFLOW, masked.OK]
+
+
+def test_huge_integers_are_masked():
+    huge = 10**400
+    assert masked.check_values([huge, 1]).errors.tolist() == [masked.OVERFLOW, masked.OK]
+    result = masked.convert_land([huge, 1], "bigha", "sq_m")
+    assert result.errors.tolist() == [masked.OVERFLOW, masked.OK]
+    assert result.values[1] == terai.terai_to_sq_meters(1, "bigha")
+    assert masked.convert_weight([1, huge], "tola", "g").errors.tolist() == [masked.OK, masked.OVERFLOW]
+
+
+def test_report():
+    result = masked.check_values([1, -1, "x", 2])
+    assert result.report() == [(1, masked.NEGATIVE, "value is negative"), (2, masked.NOT_A_NUMBER, "value is not a number")]
+    assert result.report(limit=1) == [(1, masked.NEGATIVE, "value is negative")]
+
+
+def test_convert_land_matches_batch_for_good_rows():
+    values = np.array([1.0, 2.5, -3.0, 0.0, 10.125])
+    result = masked.convert_land(values, "bigha", "sq_m", precision=2)
+    good = result.valid
+    assert good.tolist() == [True, True, False, True, True]
+    assert result.values[good].tolist() == batch.terai_to_sq_meters(values[good], "bigha", 2).tolist()
+    assert np.isnan(result.values[2])
+    assert masked.convert_land(values[good], "bigha", "kattha").values.tolist() == batch.terai_to_terai(values[good], "bigha", "kattha").tolist()
+
+
+def test_convert_land_per_row_units():
+    result = masked.convert_land([1, 2, 3, "x"], ["bigha", "रोपनी", "acre", "bigha"], "sq_m")
+    assert result.errors.tolist() == [masked.OK, masked.OK, masked.UNSUPPORTED_UNIT, masked.NOT_A_NUMBER]
+    assert result.values[:2].tolist() == [terai.terai_to_sq_meters(1, "bigha"), round(2 * 508.74, 4)]
+    to_units = masked.convert_land([1, 1], "bigha", ["kattha", "dhur"], precision=None)
+    assert to_units.values.tolist() == [20.0, 400.0]
+
+
+def test_convert_weight():
+    values = [1, -1, 2.5]
+    result = masked.convert_weight(values, "tola", "g", precision=3)
+    assert result.errors.tolist() == [masked.OK, masked.NEGATIVE, masked.OK]
+    assert result.values[[0, 2]].tolist() == weight_batch.from_tola([1, 2.5], "g", 3).tolist()
+    assert masked.convert_weight([1, 1], ["sher", "stone"], "kg").errors.tolist() == [masked.OK, masked.UNSUPPORTED_UNIT]
+
+
+def test_argument_errors_raise():
+    with pytest.raises(ValueError, match="Unsupported land unit: acre"):
+        masked.convert_land([1], "acre", "sq_m")
+    with pytest.raises(ValueError, match="Unsupported weight unit: stone"):
+        masked.convert_weight([1], "g", "stone")
+    with pytest.raises(ValueError, match="Precision must be non-negative."):
+        masked.convert_land([1], "bigha", "sq_m", precision=-1)
+    with pytest.raises(ValueError, match="Expected 2 units, got 1."):
+        masked.convert_land([1, 2], ["bigha"], "sq_m")
+
+
+def test_parse():
+    rows = ["2 ropani 3 aana", "2 bigha", None, float("nan"), 5, "2 ropani 3 aana"]
+    result = masked.parse_hilly(rows)
+    assert result.errors.tolist() == [
+        masked.OK, masked.UNPARSEABLE, masked.MISSING, masked.MISSING, masked.UNPARSEABLE, masked.OK
+    ]
+    assert result.values[[0, 5]].tolist() == [mixed_units.parse_hilly_mixed_unit(rows[0])] * 2
+    assert np.isnan(result.values[1:5]).all()
+    assert masked.parse_terai(["1 bigha 5 kattha", "x"]).errors.tolist() == [masked.OK, masked.UNPARSEABLE]
+    weights = masked.parse_weight(["2 sher 3 pau", "-1 tola"])
+    assert weights.values[0] == weight_mixed_units.parse_weight_mixed_unit("2 sher 3 pau")
+    assert weights.errors.tolist() == [masked.OK, masked.UNPARSEABLE]
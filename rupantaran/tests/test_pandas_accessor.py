@@ -0,0 +1,136 @@
+import warnings
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+import rupantaran.pandas_accessor  # noqa: F401
+from rupantaran.land import batch, cross_system, mixed_units
+from rupantaran.weight import batch as weight_batch
+from rupantaran.weight import mixed_units as weight_mixed_units
+
+
+def test_unit_conversions_match_batch():
+    values = pd.Series([1, 2.5, 0, 10.125], index=list("abcd"), name="area")
+    result = values.rupantaran.to_sq_meters("bigha", precision=2)
+    assert result.index.equals(values.index) and result.name == "area"
+    assert result.tolist() == batch.terai_to_sq_meters(values, "bigha", 2).tolist()
+    assert values.rupantaran.from_sq_meters("aana").tolist() == batch.sq_meters_to_hilly(values, "aana").tolist()
+    assert values.rupantaran.convert("bigha", "kattha").tolist() == batch.terai_to_terai(values, "bigha", "kattha").tolist()
+    assert values.rupantaran.convert("bigha", "ropani").tolist() == [
+        cross_system.terai_to_hilly_fused(v, "bigha", "ropani") for v in values
+    ]
+    assert values.rupantaran.convert_weight("tola", "g", 3).tolist() == weight_batch.from_tola(values, "g", 3).tolist()
+    assert values.rupantaran.to_sq_meters("रोपनी", precision=None).tolist() == (values * 508.74).tolist()
+
+
+def test_bad_rows_are_masked():
+    values = pd.Series([1, "x", None, -2, "3", np.nan], index=list("abcdef"))
+    result = values.rupantaran.to_sq_meters("ropani")
+    # Numeric strings are not numbers, as for `masked.check_values`
+    assert result.isna().tolist() == [False, True, True, True, True, True]
+    assert result["a"] == 508.74
+    assert pd.Series([True, 2]).rupantaran.convert("ropani", "aana").isna().tolist() == [True, False]
+
+
+def test_infinite_rows_are_masked_without_warnings():
+    values = pd.Series([1.0, np.inf, np.nan, 1e308])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = values.rupantaran.to_sq_meters("bigha", precision=2)
+        formatted = values.rupantaran.to_hilly_mixed()
+        grams = pd.Series(["1e308 dharni", "1 tola"]).rupantaran.parse_weight()
+    assert result.isna().tolist() == [False, True, True, True]
+    assert formatted[1:].isna().all() and formatted[0] is not None
+    assert grams.isna().tolist() == [True, False]
+
+
+@pytest.mark.parametrize(
+    "values, message",
+    [
+        ([1, "x"], "Row 'b': Input value must be a number."),
+        ([1, -2], "Row 'b': Input value must be non-negative."),
+        ([1, np.inf], "Row 'b': Input value must be finite."),
+        ([1, 1e308], "Row 'b': Input value is too large."),
+    ],
+)
+def test_raise_reports_first_bad_row(values, message):
+    series = pd.Series(values, index=["a", "b"])
+    with pytest.raises(ValueError, match=message):
+        series.rupantaran.to_sq_meters("ropani", errors="raise")
+
+
+@pytest.mark.parametrize(
+    "values, message",
+    [
+        ([None, -1.0], "Row 'r0': Input value is missing."),
+        ([5, np.inf, 1e308], "Row 'r1': Input value must be finite."),
+        (["x", -1, np.inf], "Row 'r0': Input value must be a number."),
+    ],
+)
+def test_raise_reports_the_earliest_of_several_bad_rows(values, message):
+    # The earlier rows have the lower error codes, so the highest code would name a later row
+    series = pd.Series(values, index=[f"r{i}" for i in range(len(values))])
+    with pytest.raises(ValueError, match=message):
+        series.rupantaran.to_sq_meters("ropani", errors="raise")
+
+
+def test_missing_rows_raise():
+    with pytest.raises(ValueError, match="Row 1: Input value is missing."):
+        pd.Series([1.0, None]).rupantaran.to_sq_meters("ropani", errors="raise")
+    with pytest.raises(ValueError, match="Row 'b': Input expression is missing."):
+        pd.Series(["1 ropani", None], index=["a", "b"]).rupantaran.parse_hilly(errors="raise")
+    with pytest.raises(ValueError, match="Row 0: Input area is missing."):
+        pd.Series([None, 1.0]).rupantaran.to_hilly_mixed(errors="raise")
+
+
+def test_argument_errors_always_raise():
+    series = pd.Series([1.0])
+    with pytest.raises(ValueError, match="Unsupported land unit: acre"):
+        series.rupantaran.to_sq_meters("acre")
+    with pytest.raises(ValueError, match="Unsupported weight unit: stone"):
+        series.rupantaran.convert_weight("stone", "g")
+    with pytest.raises(ValueError, match="Precision must be non-negative."):
+        series.rupantaran.to_hilly_mixed(-1)
+    with pytest.raises(ValueError, match="errors must be 'coerce' or 'raise'"):
+        series.rupantaran.parse_hilly(errors="ignore")
+
+
+def test_parse_and_format():
+    expressions = pd.Series(["2 ropani 3 aana", "bad", None, 5, "२ रोपनी ३ आना", "2 ropani 3 aana"])
+    parsed = expressions.rupantaran.parse_hilly()
+    expected = mixed_units.parse_hilly_mixed_unit("2 ropani 3 aana")
+    assert parsed[[0, 4, 5]].tolist() == [expected] * 3
+    assert parsed.isna().tolist() == [False, True, True, True, False, False]
+
+    formatted = parsed.rupantaran.to_hilly_mixed(2)
+    assert formatted[0] == mixed_units.sq_meters_to_hilly_mixed(expected, 2)
+    assert formatted.isna().tolist() == parsed.isna().tolist()
+    assert parsed.rupantaran.to_terai_mixed()[0] == mixed_units.sq_meters_to_terai_mixed(expected)
+
+    terai = pd.Series(["1 bigha 5 kattha"]).rupantaran.parse_terai()
+    assert terai[0] == mixed_units.parse_terai_mixed_unit("1 bigha 5 kattha")
+
+    with pytest.raises(ValueError, match=r"Row 1: .*expected a number"):
+        expressions.rupantaran.parse_hilly(errors="raise")
+
+
+def test_weight_parse_and_format():
+    expressions = pd.Series(["2 sher 3 pau 1 chatak", "1 tola 40 lal", "2 bigha"])
+    grams = expressions.rupantaran.parse_weight()
+    assert grams[:2].tolist() == [weight_mixed_units.parse_weight_mixed_unit(e) for e in expressions[:2]]
+    assert np.isnan(grams[2])
+    formatted = grams.rupantaran.to_weight_mixed(2)
+    assert formatted[:2].tolist() == weight_batch.grams_to_weight_mixed(grams[:2], 2, as_strings=True)
+    assert formatted[2] is None
+
+
+def test_frame_accessor():
+    frame = pd.DataFrame({"north": ["2 ropani 3 aana", "x"], "south": ["1 ropani", "2 aana"], "note": ["a", "b"]})
+    parsed = frame.rupantaran.parse_hilly(["north", "south"])
+    assert list(parsed.columns) == ["north", "south"]
+    assert parsed["south"].tolist() == frame["south"].rupantaran.parse_hilly().tolist()
+    assert parsed["north"].isna().tolist() == [False, True]
+    assert list(frame.rupantaran.parse_hilly("north").columns) == ["north"]
+    assert frame[["north"]].rupantaran.parse_hilly().equals(frame.rupantaran.parse_hilly("north"))
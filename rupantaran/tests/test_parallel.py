@@ -0,0 +1,51 @@
+import pytest
+
+from rupantaran.parallel import bulk_convert, iter_bulk_convert
+from rupantaran.land import mixed_units
+from rupantaran.weight import from_tola
+
+
+def test_elementwise_scalar_function_keeps_order():
+    values = [i / 10 for i in range(1000)]
+    expected = [from_tola(v, "g") for v in values]
+    assert bulk_convert(from_tola, values, "g", chunk_size=64, workers=2, elementwise=True) == expected
+    assert bulk_convert(from_tola, iter(values), "g", chunk_size=64, workers=1, elementwise=True) == expected
+
+
+def test_chunk_results_are_joined():
+    np = pytest.importorskip("numpy")
+    from rupantaran.land import batch
+
+    values = np.arange(1000, dtype=np.float64)
+    result = bulk_convert(batch.terai_to_sq_meters, values, "bigha", precision=2, chunk_size=300, workers=2)
+    assert result.tolist() == batch.terai_to_sq_meters(values, "bigha", precision=2).tolist()
+
+    parts = bulk_convert(batch.sq_meters_to_hilly_mixed, values, chunk_size=300, workers=1)
+    assert parts["ropani"].tolist() == batch.sq_meters_to_hilly_mixed(values)["ropani"].tolist()
+
+    expressions = (f"{i} ropani {i % 16} aana" for i in range(500))
+    chunks = list(iter_bulk_convert(batch.parse_hilly_mixed_unit, expressions, chunk_size=200, workers=2))
+    assert [len(chunk) for chunk in chunks] == [200, 200, 100]
+    assert chunks[2][-1] == mixed_units.parse_hilly_mixed_unit("499 ropani 3 aana")
+
+
+def test_empty_input_keeps_the_result_type():
+    np = pytest.importorskip("numpy")
+    from rupantaran.land import batch
+
+    result = bulk_convert(batch.terai_to_sq_meters, [], "bigha", workers=2)
+    assert isinstance(result, np.ndarray) and result.size == 0
+    parts = bulk_convert(batch.sq_meters_to_hilly_mixed, np.empty(0), workers=1)
+    assert list(parts) == ["ropani", "aana", "paisa", "daam"]
+    assert bulk_convert(batch.parse_hilly_mixed_unit, iter([]), workers=1).dtype == np.float64
+
+
+def test_errors():
+    assert bulk_convert(from_tola, [], "g", elementwise=True) == []
+    with pytest.raises(ValueError, match="Chunk size must be positive"):
+        bulk_convert(from_tola, [1], "g", chunk_size=0)
+    with pytest.raises(ValueError, match="workers must be positive"):
+        bulk_convert(from_tola, [1], "g", workers=0)
+    # Errors raised in a worker reach the caller
+    with pytest.raises(ValueError, match="non-negative"):
+        bulk_convert(from_tola, [1, -1], "g", workers=2, elementwise=True)
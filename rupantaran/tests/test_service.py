@@ -0,0 +1,220 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from rupantaran import fast
+from rupantaran.land import batch, mixed_units
+from rupantaran import service as service_module
+from rupantaran.service import ConversionService
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_single_values_match_scalar_functions():
+    async def run():
+        service = ConversionService()
+        return await asyncio.gather(
+            service.handle("/convert/land", {"value": 2.5, "from": "bigha", "to": "ropani"}),
+            service.handle("/convert/weight", {"value": 5, "from": "tola", "to": "g", "precision": 2}),
+            service.handle("/parse/hilly", {"value": "2 ropani 3 aana"}),
+            service.handle("/format/terai", {"value": 5000, "precision": 2}),
+        )
+
+    land, weight, parsed, formatted = _run(run())
+    assert land == (200, {"result": fast.convert_land(2.5, "bigha", "ropani")})
+    assert weight == (200, {"result": fast.convert_weight(5, "tola", "g", 2)})
+    assert parsed == (200, {"result": mixed_units.parse_hilly_mixed_unit("2 ropani 3 aana")})
+    assert formatted == (200, {"result": batch.sq_meters_to_terai_mixed([5000], 2, as_strings=True)[0]})
+
+
+def test_concurrent_requests_share_a_batch():
+    async def run():
+        service = ConversionService(max_delay=0.05)
+        responses = await asyncio.gather(
+            *(service.handle("/convert/land", {"value": i, "from": "kattha", "to": "sq_m"}) for i in range(10))
+        )
+        return service, responses
+
+    service, responses = _run(run())
+    assert [body["result"] for _, body in responses] == [fast.convert_land(i, "kattha", "sq_m") for i in range(10)]
+    assert service.stats()["batches"] == 1
+    assert service.stats()["mean_batch_size"] == 10
+
+
+def test_max_batch_flushes_early():
+    async def run():
+        service = ConversionService(max_batch=4, max_delay=10)
+        await asyncio.gather(
+            *(service.handle("/convert/weight", {"value": i, "from": "sher", "to": "kg"}) for i in range(8))
+        )
+        return service.stats()
+
+    assert _run(run())["batches"] == 2
+
+
+def test_bad_value_fails_only_its_request():
+    async def run():
+        service = ConversionService(max_delay=0.05)
+        return await asyncio.gather(
+            service.handle("/convert/land", {"value": 1, "from": "bigha", "to": "ropani"}),
+            service.handle("/convert/land", {"value": -1, "from": "bigha", "to": "ropani"}),
+            service.handle("/convert/land", {"value": "x", "from": "bigha", "to": "ropani"}),
+            service.handle("/convert/land", {"value": [1], "from": "bigha", "to": "ropani"}),
+        )
+
+    good, negative, text, nested = _run(run())
+    assert good[0] == 200
+    assert negative == (400, {"error": "value is negative"})
+    assert text == (400, {"error": "value is not a number"})
+    assert nested[0] == 400
+
+
+def test_bulk_payloads():
+    async def run():
+        service = ConversionService()
+        return await service.handle("/parse/weight", {"values": ["2 sher", "nonsense", None]})
+
+    status, body = _run(run())
+    assert status == 200
+    assert body["results"][1:] == [None, None]
+    assert body["errors"] == [None, "expression cannot be parsed", "value is missing"]
+
+
+def test_huge_integers_fail_only_their_own_request():
+    huge = 10**400
+
+    async def run():
+        service = ConversionService(max_delay=0.05)
+        return await asyncio.gather(
+            service.handle("/convert/land", {"value": huge, "from": "bigha", "to": "ropani"}),
+            service.handle("/convert/land", {"value": 1, "from": "bigha", "to": "ropani"}),
+            service.handle("/format/hilly", {"value": huge}),
+            service.handle("/format/hilly", {"value": 5000}),
+            service.handle("/convert/land", {"values": [1, huge], "from": "bigha", "to": "ropani"}),
+        )
+
+    huge_convert, good_convert, huge_format, good_format, bulk = _run(run())
+    assert huge_convert == huge_format == (400, {"error": "value is too large"})
+    assert good_convert == (200, {"result": fast.convert_land(1, "bigha", "ropani")})
+    assert good_format == (200, {"result": batch.sq_meters_to_hilly_mixed([5000], 4, as_strings=True)[0]})
+    assert bulk[0] == 200 and bulk[1]["errors"] == [None, "value is too large"]
+
+
+def test_a_failing_batch_is_retried_row_by_row(monkeypatch):
+    def kernel(values):
+        if "boom" in values:
+            raise OverflowError("boom")
+        return values, [None] * len(values)
+
+    monkeypatch.setitem(service_module._OPERATIONS, "/parse/hilly", (kernel, (), ()))
+
+    async def run():
+        service = ConversionService(max_delay=0.05)
+        return await asyncio.gather(
+            service.handle("/parse/hilly", {"value": "boom"}),
+            service.handle("/parse/hilly", {"value": "fine"}),
+            service.handle("/parse/hilly", {"values": ["boom"]}),
+        )
+
+    assert _run(run()) == [(400, {"error": "boom"}), (200, {"result": "fine"}), (400, {"error": "boom"})]
+
+
+def test_huge_values_fail_only_their_own_request():
+    async def run():
+        service = ConversionService(max_delay=0.05)
+        return await asyncio.gather(
+            service.handle("/format/hilly", {"value": 1e308}),
+            service.handle("/format/hilly", {"value": 5000}),
+        )
+
+    huge, good = _run(run())
+    assert huge == (400, {"error": "value is too large"})
+    assert good == (200, {"result": batch.sq_meters_to_hilly_mixed([5000], 4, as_strings=True)[0]})
+
+
+@pytest.mark.parametrize(
+    "path, payload, message",
+    [
+        ("/nowhere", {}, "Unknown endpoint: /nowhere"),
+        ("/convert/land", [1], "Request body must be a JSON object."),
+        ("/convert/land", {"value": 1, "from": "bigha"}, "Missing field: to"),
+        ("/convert/land", {"value": 1, "from": "acre", "to": "ropani"}, "Unsupported land unit: acre"),
+        ("/format/hilly", {"value": 1, "precision": -1}, "Precision must be non-negative."),
+        ("/format/hilly", {"value": 1, "precision": 1.5}, "Precision must be an integer."),
+        ("/parse/hilly", {}, "Missing field: value or values"),
+        ("/convert/land", {"value": 1, "from": ["bigha"], "to": "ropani"}, "from must be a string."),
+        ("/convert/weight", {"values": [1], "from": "tola", "to": {"g": 1}}, "to must be a string."),
+    ],
+)
+def test_request_errors(path, payload, message):
+    status, body = _run(ConversionService().handle(path, payload))
+    assert status in (400, 404)
+    assert body == {"error": message}
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError, match="max_batch must be at least 1."):
+        ConversionService(max_batch=0)
+    with pytest.raises(ValueError, match="max_delay must be non-negative."):
+        ConversionService(max_delay=-1)
+
+
+async def _http(port, method, path, body=b""):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+def test_http_round_trip():
+    async def run():
+        service = ConversionService()
+        server = await service.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return (
+                await _http(port, "POST", "/convert/land", b'{"value": 1, "from": "ropani", "to": "sq_m"}'),
+                await _http(port, "POST", "/convert/land", b"not json"),
+                await _http(port, "GET", "/health"),
+                await _http(port, "GET", "/convert/land"),
+            )
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    converted, bad_json, health, wrong_method = _run(run())
+    assert converted == (200, {"result": fast.convert_land(1, "ropani", "sq_m")})
+    assert bad_json == (400, {"error": "Request body must be JSON."})
+    assert health == (200, {"status": "ok"})
+    assert wrong_method[0] == 405
+
+
+def test_http_errors_keep_the_connection_answering(monkeypatch):
+    async def not_finite(self, path, payload):
+        return 200, {"result": float("nan")}
+
+    async def run():
+        service = ConversionService()
+        server = await service.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            unhashable = await _http(port, "POST", "/convert/land", b'{"value": 1, "from": [], "to": "sq_m"}')
+            monkeypatch.setattr(ConversionService, "handle", not_finite)
+            return unhashable, await _http(port, "POST", "/parse/hilly", b'{"value": "1 ropani"}')
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    unhashable, nan = _run(run())
+    assert unhashable == (400, {"error": "from must be a string."})
+    assert nan == (400, {"error": "Result is not a finite number."})
@@ -0,0 +1,127 @@
+import sqlite3
+
+import pytest
+
+from rupantaran import sqlite
+from rupantaran.land import mixed_units, registry
+from rupantaran.land.terai import terai_to_sq_meters
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    sqlite.register(connection)
+    connection.execute("CREATE TABLE parcels (ward TEXT, value REAL, unit TEXT, area TEXT)")
+    connection.executemany(
+        "INSERT INTO parcels VALUES (?, ?, ?, ?)",
+        [
+            ("a", 2.5, "bigha", "2 ropani 3 aana"),
+            ("a", 3, "Kattha", "0.1 daam"),
+            ("b", 1.25, "ropani", None),
+            ("b", 4, "dhur", "8 aana 2 paisa"),
+        ],
+    )
+    yield connection
+    connection.close()
+
+
+def _one(connection, sql, *args):
+    return connection.execute(sql, args).fetchone()[0]
+
+
+def test_to_sqm_matches_library(connection):
+    assert _one(connection, "SELECT rp_to_sqm(2.5, 'bigha')") == terai_to_sq_meters(2.5, "bigha")
+    assert _one(connection, "SELECT rp_to_sqm(2.5, 'bigha', 1)") == terai_to_sq_meters(2.5, "bigha", 1)
+    rows = connection.execute("SELECT value, unit, rp_to_sqm(value, unit) FROM parcels").fetchall()
+    for value, unit, area_m2 in rows:
+        assert area_m2 == round(value * registry.get_factor(unit, "sq_m"), 4)
+
+
+def test_convert(connection):
+    factor = registry.get_factor("ropani", "kattha")
+    assert _one(connection, "SELECT rp_convert(3, 'ropani', 'kattha')") == round(3 * factor, 4)
+    assert _one(connection, "SELECT rp_convert(3, 'ropani', 'kattha', 2)") == round(3 * factor, 2)
+
+
+def test_parse_and_format(connection):
+    assert _one(connection, "SELECT rp_parse_hilly('2 ropani 3 aana')") == mixed_units.parse_hilly_mixed_unit(
+        "2 ropani 3 aana"
+    )
+    assert _one(connection, "SELECT rp_parse_terai('1 bigha 5 kattha')") == mixed_units.parse_terai_mixed_unit(
+        "1 bigha 5 kattha"
+    )
+    assert _one(connection, "SELECT rp_format_terai(5000)") == mixed_units.sq_meters_to_terai_mixed(5000)
+    assert _one(connection, "SELECT rp_format_hilly(5000, 2)") == mixed_units.sq_meters_to_hilly_mixed(5000, 2)
+
+
+def test_sum_is_exact(connection):
+    totals = dict(connection.execute("SELECT ward, rp_sum_hilly(area) FROM parcels GROUP BY ward"))
+    parsed = dict(connection.execute("SELECT ward, SUM(rp_parse_hilly(area)) FROM parcels GROUP BY ward"))
+    assert totals["a"] == round(parsed["a"], 4) == round(1112.85 + 0.199, 4)
+    assert totals["b"] == round(parsed["b"], 4)
+
+    connection.executemany("INSERT INTO parcels (ward, area) VALUES ('c', ?)", [("0.1 daam",)] * 10_000)
+    total = _one(connection, "SELECT rp_sum_hilly(area) FROM parcels WHERE ward = 'c'")
+    assert total == 1990.0
+    assert _one(connection, "SELECT SUM(rp_parse_hilly(area)) FROM parcels WHERE ward = 'c'") != total
+
+
+@pytest.mark.parametrize("expression", ["2 ropani 3 aana", "8 aana 2 paisa", "0.1 daam", "3 aana"])
+def test_sum_of_one_row_matches_parse(connection, expression):
+    # To four decimal places: the float sum of a parse can be off in the last bit (270.21999... for
+    # '8 aana 2 paisa'), the exact count is not
+    parsed = _one(connection, "SELECT rp_parse_hilly(?)", expression)
+    assert _one(connection, "SELECT rp_sum_hilly(?)", expression) == round(parsed, 4)
+    parsed = _one(connection, "SELECT rp_parse_terai(?)", "1 bigha 5 kattha")
+    assert _one(connection, "SELECT rp_sum_terai(?)", "1 bigha 5 kattha") == round(parsed, 4)
+
+
+def test_sum_terai_and_empty_groups(connection):
+    total = _one(connection, "SELECT rp_sum_terai(area) FROM (SELECT '1 bigha' AS area UNION ALL SELECT '1 kattha')")
+    assert total == round(mixed_units.parse_terai_mixed_unit("1 bigha 1 kattha"), 4)
+    formatted = _one(connection, "SELECT rp_format_hilly(rp_sum_hilly(area), 2) FROM (SELECT '3 aana' AS area UNION ALL SELECT '1 daam')")
+    assert formatted == mixed_units.sq_meters_to_hilly_mixed(3 * 31.79 + 1.99, 2)
+    assert _one(connection, "SELECT rp_sum_hilly(area) FROM parcels WHERE ward = 'none'") is None
+    assert _one(connection, "SELECT rp_sum_hilly(NULL)") is None
+
+
+def test_null_gives_null(connection):
+    row = connection.execute(
+        "SELECT rp_to_sqm(NULL, 'bigha'), rp_convert(1, NULL, 'aana'), rp_parse_hilly(NULL), rp_format_terai(NULL)"
+    ).fetchone()
+    assert row == (None, None, None, None)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT rp_to_sqm(-1, 'bigha')",
+        "SELECT rp_to_sqm('x', 'bigha')",
+        "SELECT rp_to_sqm(1, 'acre')",
+        "SELECT rp_to_sqm(1, 'bigha', -1)",
+        "SELECT rp_parse_hilly('2 acre')",
+        "SELECT rp_parse_terai(5)",
+        "SELECT rp_format_hilly(-5)",
+        "SELECT rp_to_sqm(1e308, 'bigha')",
+        "SELECT rp_convert(9e999, 'bigha', 'ropani')",
+        "SELECT rp_format_terai(9e999)",
+        "SELECT rp_parse_hilly('1e308 ropani')",
+        "SELECT rp_sum_hilly(area) FROM (SELECT '1 ropani' AS area UNION ALL SELECT 'junk')",
+    ],
+)
+def test_errors(connection, sql):
+    with pytest.raises(sqlite3.OperationalError):
+        connection.execute(sql).fetchall()
+
+    coerced = sqlite3.connect(":memory:")
+    sqlite.register(coerced, errors="coerce")
+    result = coerced.execute(sql).fetchone()[0]
+    if "rp_sum_hilly" in sql:
+        assert result == mixed_units.parse_hilly_mixed_unit("1 ropani")
+    else:
+        assert result is None
+
+
+def test_register_rejects_unknown_errors_mode():
+    with pytest.raises(ValueError, match="errors must be 'raise' or 'coerce', got 'ignore'."):
+        sqlite.register(sqlite3.connect(":memory:"), errors="ignore")
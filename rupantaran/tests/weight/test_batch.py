@@ -0,0 +1,74 @@
+import array
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from rupantaran.weight import batch
+from rupantaran.weight import weight
+from rupantaran.weight.registry import WEIGHT_UNITS, convert
+
+VALUES = [0, 1, 2.5, 0.125, 12.345, 999.995, 1e6]
+
+
+@pytest.mark.parametrize("unit", WEIGHT_UNITS)
+def test_matches_scalar_functions(unit):
+    batch_func = getattr(batch, f"from_{unit}")
+    scalar_func = getattr(weight, f"from_{unit}")
+    for to_unit in WEIGHT_UNITS:
+        if to_unit == unit:
+            with pytest.raises(ValueError, match="Unsupported unit"):
+                batch_func(VALUES, to_unit)
+            continue
+        for precision in (0, 2, 4):
+            expected = [scalar_func(v, to_unit, precision) for v in VALUES]
+            assert batch_func(VALUES, to_unit, precision).tolist() == expected
+
+
+def test_convert_matches_registry():
+    values = np.random.default_rng(0).uniform(0, 1000, 5000)
+    result = batch.convert(values, "sher", "kg", precision=3)
+    assert result.tolist() == [convert(v, "sher", "kg", precision=3) for v in values.tolist()]
+    assert batch.convert(values, "kg", "kg").tolist() == [round(v, 4) for v in values.tolist()]
+
+
+def test_out_buffer():
+    values = np.array([[1.0, 2.5], [3.25, 40.0]])
+    out = np.full_like(values, -1)
+    result = batch.from_tola(values, "g", precision=2, out=out)
+    assert result is out
+    assert out.tolist() == [[weight.from_tola(v, "g", 2) for v in row] for row in values.tolist()]
+
+    # The input array itself can be the output
+    expected = batch.from_sher(values, "pau")
+    assert batch.from_sher(values, "pau", out=values) is values
+    assert values.tolist() == expected.tolist()
+
+    with pytest.raises(ValueError, match="shape"):
+        batch.from_tola([1, 2, 3], "g", out=np.empty(2))
+    with pytest.raises(ValueError, match="float64"):
+        batch.from_tola([1, 2], "g", out=np.empty(2, dtype=np.float32))
+    readonly = np.empty(2)
+    readonly.flags.writeable = False
+    with pytest.raises(ValueError, match="writeable"):
+        batch.from_tola([1, 2], "g", out=readonly)
+
+
+def test_buffer_protocol_inputs():
+    ticks = array.array("d", [1.0, 2.0, 3.5])
+    expected = [weight.from_dharni(v, "kg") for v in ticks]
+    assert batch.from_dharni(ticks, "kg").tolist() == expected
+    assert batch.from_dharni(memoryview(ticks), "kg").tolist() == expected
+    assert batch.from_dharni(array.array("i", [1, 2]), "sher").tolist() == [3, 6]
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="non-negative"):
+        batch.from_tola([1, -2], "g")
+    with pytest.raises(ValueError, match="must be a number"):
+        batch.from_tola(["1"], "g")
+    with pytest.raises(ValueError, match="Precision must be non-negative"):
+        batch.convert([1], "tola", "g", precision=-1)
+    with pytest.raises(ValueError, match="Unsupported weight unit"):
+        batch.convert([1], "tola", "stone")
+    with pytest.raises(ValueError, match="Input value must be finite."):
+        batch.grams_to_weight_mixed([1, float("inf")])
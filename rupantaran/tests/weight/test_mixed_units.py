@@ -0,0 +1,97 @@
+import pytest
+from rupantaran.weight import mixed_units
+from rupantaran.weight.constants import GRAMS_PER_UNIT
+from rupantaran._parsing import MixedUnitParseError
+
+
+def test_parse_weight_mixed_unit():
+    assert mixed_units.parse_weight_mixed_unit("2 sher 3 pau 1 chatak") == pytest.approx(
+        2 * 796 + 3 * 199 + 58.31
+    )
+    assert mixed_units.parse_weight_mixed_unit("1 tola 40 lal") == pytest.approx(11.66 + 40 * 0.1166)
+    assert mixed_units.parse_weight_mixed_unit("1 KG, 200g") == pytest.approx(1200)
+    assert mixed_units.parse_weight_mixed_unit("") == 0.0
+
+
+def test_parse_errors():
+    with pytest.raises(MixedUnitParseError, match="Unsupported Weight unit: seer") as info:
+        mixed_units.parse_weight_mixed_unit("2 sher 1 seer")
+    assert info.value.position == 9
+    with pytest.raises(MixedUnitParseError, match=r"in '2 SHER 1 Stone'"):
+        mixed_units.parse_weight_mixed_unit("2 SHER 1 Stone")
+    with pytest.raises(ValueError, match="non-negative"):
+        mixed_units.parse_weight_mixed_unit("-2 sher")
+    with pytest.raises(ValueError, match="pairs of"):
+        mixed_units.parse_weight_mixed_unit("2 sher 3")
+
+
+def test_grams_to_weight_mixed():
+    grams = mixed_units.parse_weight_mixed_unit("1 dharni 2 sher 3 pau 1 chatak 4 tola 40 lal")
+    assert mixed_units.grams_to_weight_mixed(grams, precision=2) == \
+        "1 dharni 2 sher 3 pau 1 chatak 4 tola 40.00 lal"
+    assert mixed_units.grams_to_weight_mixed(0) == "0 dharni 0 sher 0 pau 0 chatak 0 tola 0.0000 lal"
+    assert mixed_units.grams_to_weight_mixed(GRAMS_PER_UNIT["dharni"], 0) == \
+        "1 dharni 0 sher 0 pau 0 chatak 0 tola 0 lal"
+
+    with pytest.raises(ValueError, match="non-negative"):
+        mixed_units.grams_to_weight_mixed(-1)
+    with pytest.raises(ValueError, match="must be a number"):
+        mixed_units.grams_to_weight_mixed("1")
+    for value in (float("inf"), float("nan")):
+        with pytest.raises(ValueError, match="Input value must be finite."):
+            mixed_units.grams_to_weight_mixed(value)
+    with pytest.raises(ValueError, match="Precision must be non-negative"):
+        mixed_units.grams_to_weight_mixed(1, precision=-1)
+
+
+def test_weight_mixed_to_unit():
+    assert mixed_units.weight_mixed_to_unit("2 sher 3 pau", "kg", precision=3) == 2.189
+    assert mixed_units.weight_mixed_to_unit("1 dharni", "sher") == 3
+    with pytest.raises(ValueError, match="Unsupported weight unit"):
+        mixed_units.weight_mixed_to_unit("1 dharni", "stone")
+
+
+def test_parse_cache():
+    mixed_units.clear_parse_cache()
+    mixed_units.parse_weight_mixed_unit("5 tola")
+    mixed_units.parse_weight_mixed_unit("5 TOLA")
+    info = mixed_units.parse_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    from rupantaran.weight import batch
+
+    expressions = ["2 sher 3 pau 1 chatak", "1 tola 40 lal", "3 dharni", "0.5 pau 7 lal"]
+    grams = batch.parse_weight_mixed_unit(expressions)
+    assert grams.tolist() == [mixed_units.parse_weight_mixed_unit(e) for e in expressions]
+
+    values = np.concatenate([grams, np.random.default_rng(0).uniform(0, 10_000, 2000)])
+    strings = batch.grams_to_weight_mixed(values, precision=3, as_strings=True)
+    assert strings == [mixed_units.grams_to_weight_mixed(v, 3) for v in values.tolist()]
+
+    parts = batch.grams_to_weight_mixed(grams[:2])
+    assert parts["sher"].tolist() == [2, 0]
+    assert parts["tola"].tolist() == [0, 1]
+    assert parts["lal"].dtype == np.float64
+
+
+def test_round_trip():
+    # Decomposing parsed grams is stable: the expression it gives parses back to itself.
+    rng = __import__("random").Random(0)
+    for _ in range(2000):
+        counts = [rng.randint(0, 9) for _ in mixed_units.MIXED_UNITS[:-1]] + [rng.randint(0, 99)]
+        expression = " ".join(f"{c} {u}" for c, u in zip(counts, mixed_units.MIXED_UNITS))
+        grams = mixed_units.parse_weight_mixed_unit(expression)
+        canonical = mixed_units.grams_to_weight_mixed(grams, precision=6)
+        assert mixed_units.parse_weight_mixed_unit(canonical) == pytest.approx(grams)
+        assert mixed_units.grams_to_weight_mixed(
+            mixed_units.parse_weight_mixed_unit(canonical), precision=6
+        ) == canonical
+
+    for expression in ["2 sher 3 pau 1 chatak", "1 tola 40 lal", "4 dharni 2 sher 2 chatak 4 tola"]:
+        grams = mixed_units.parse_weight_mixed_unit(expression)
+        result = mixed_units.grams_to_weight_mixed(grams, precision=0)
+        assert mixed_units.parse_weight_mixed_unit(result) == pytest.approx(grams)
+        assert all(f"{c} {u}" in result for c, u in zip(expression.split()[::2], expression.split()[1::2]))
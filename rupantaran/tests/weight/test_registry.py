@@ -0,0 +1,62 @@
+import pytest
+import rupantaran.weight.registry as registry
+from rupantaran.weight import convert, from_dharni, from_sher, from_tola
+from rupantaran.weight.constants import GRAMS_PER_UNIT, DHARNI_TO, LAL_TO
+
+
+def test_factor_matrix_shape():
+    n = len(registry.WEIGHT_UNITS)
+    assert n == 10
+    assert len(registry.FACTOR_MATRIX) == n
+    assert all(len(row) == n for row in registry.FACTOR_MATRIX)
+    for unit, i in registry.UNIT_INDEX.items():
+        assert registry.WEIGHT_UNITS[i] == unit
+        assert registry.FACTOR_MATRIX[i][i] == 1
+
+
+def test_tables_are_consistent():
+    assert registry.check_consistency() == []
+    # DHARNI_TO used to give 2390 g but 2.388 kg
+    assert DHARNI_TO["g"] == 1000 * DHARNI_TO["kg"]
+    assert "lal" not in LAL_TO
+    for unit, grams in GRAMS_PER_UNIT.items():
+        assert registry.get_factor(unit, "g") == grams
+
+
+def test_check_consistency_reports_mismatched_ratios(monkeypatch):
+    # The table gives 58.31 g for a chatak, which is not exactly 5 tola
+    monkeypatch.setattr(registry, "UNIT_RATIOS", registry.UNIT_RATIOS + (("chatak", "tola", 5),))
+    problems = registry.check_consistency()
+    assert len(problems) == 1 and problems[0].startswith("1 chatak is 5.0008")
+    assert problems[0].endswith("tola, expected 5")
+    assert registry.check_consistency(rel_tol=1e-3) == []
+
+
+def test_convert():
+    assert convert(1, "dharni", "sher") == 3
+    assert convert(2, "Sher", "KG", precision=3) == 1.592
+    assert convert(4, "pau", "pau") == 4
+    assert convert(1, "tola", "g") == from_tola(1, "g")
+    assert convert(1, "dharni", "kg") == from_dharni(1, "kg") == 2.388
+    assert convert(7, "sher", "g") == from_sher(7, "g")
+
+    with pytest.raises(ValueError, match="Unsupported weight unit"):
+        convert(1, "tola", "invalid_unit")
+    with pytest.raises(ValueError, match="non-negative"):
+        convert(-1, "tola", "g")
+    with pytest.raises(ValueError, match="must be a number"):
+        convert("1", "tola", "g")
+    with pytest.raises(ValueError, match="Precision must be non-negative"):
+        convert(1, "tola", "g", precision=-1)
+
+
+def test_convert_array():
+    np = pytest.importorskip("numpy")
+    values = np.array([0, 1, 2.5, 12.345, 1e6])
+    result = registry.convert_array(values, "tola", "g", precision=2)
+    assert result.tolist() == [convert(float(v), "tola", "g", precision=2) for v in values]
+
+    with pytest.raises(ValueError, match="non-negative"):
+        registry.convert_array([1, -1], "tola", "g")
+    with pytest.raises(ValueError, match="Unsupported weight unit"):
+        registry.convert_array([1], "tola", "stone")
@@ -1,22 +1,30 @@
-
-
-
 # This allows us easier import. Else we have to do something like this:
 # from rupantaran.weight.weight import from_lal
 # But now  with this we can do:
 # from rupantaran.weight import from_lal
+#
+# Names are loaded on first access, so importing the package itself imports nothing.
+
+from .._lazy import attach
 
-from .weight import (
-    from_lal,
-    from_tola,
-    from_chatak,
-    from_pau,
-    from_dharni,
-    from_sher,
-    from_kg,
-    from_g,
-    from_lb,
-    from_oz
+__getattr__, __dir__ = attach(
+    __name__,
+    submodules=("batch", "constants", "mixed_units", "registry", "weight"),
+    attributes={
+        "weight": (
+            "from_lal",
+            "from_tola",
+            "from_chatak",
+            "from_pau",
+            "from_dharni",
+            "from_sher",
+            "from_kg",
+            "from_g",
+            "from_lb",
+            "from_oz",
+        ),
+        "registry": ("convert",),
+    },
 )
 
 __all__ = [
@@ -29,5 +37,6 @@ __all__ = [
     'from_kg',
     'from_g',
     'from_lb',
-    'from_oz'
-] 
\ No newline at end of file
+    'from_oz',
+    'convert'
+]
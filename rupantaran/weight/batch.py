@@ -0,0 +1,333 @@
+"""
+batch.py
+
+This module converts whole arrays of weights at once. It mirrors the scalar functions in `weight`
+but takes a NumPy array, list or any buffer-protocol object (e.g. ``array.array``, a
+``memoryview``) and does the work in vectorized form: one validation pass, one multiply by the
+precomputed factor from `registry.FACTOR_MATRIX`, and rounding exactly like the built-in `round`.
+
+The unit conversion functions accept an `out` array. When one is given, the result is written into it and no
+result array is allocated, so a feed can reuse one buffer for every batch of ticks. `out` may be
+the input array itself.
+
+Requires NumPy (``pip install rupantaran[numpy]``).
+
+Functions:
+- `convert`: Converts an array from any weight unit to any other.
+- `from_lal`, `from_tola`, `from_chatak`, `from_pau`, `from_dharni`, `from_sher`, `from_kg`,
+  `from_g`, `from_lb`, `from_oz`: Array versions of the functions in `weight`.
+- `parse_weight_mixed_unit`: Parses a sequence of mixed weight expressions into grams.
+- `grams_to_weight_mixed`: Splits an array of grams into dharni/sher/pau/chatak/tola/lal.
+"""
+
+from .._arrays import (
+    np,
+    as_value_array,
+    check_precision,
+    round_like_python,
+    decompose_units,
+    format_mixed_units,
+)
+from .mixed_units import _TOLERANCE, _UNIT_GRAMS, parse_weight_mixed_unit as _parse_weight
+from .registry import FACTOR_MATRIX, UNIT_INDEX, get_factor
+
+
+def _check_out(out, shape: tuple):
+    if not isinstance(out, np.ndarray) or out.dtype != np.float64:
+        raise ValueError("Output array must be a float64 NumPy array.")
+    if out.shape != shape:
+        raise ValueError(f"Output array has shape {out.shape}, expected {shape}.")
+    if not out.flags.writeable:
+        raise ValueError("Output array must be writeable.")
+
+
+def _apply(values, factor: float, precision: int, out):
+    check_precision(precision)
+    arr = as_value_array(values)
+    if out is None:
+        out = np.multiply(arr, factor)
+    else:
+        _check_out(out, arr.shape)
+        np.multiply(arr, factor, out=out)
+    return round_like_python(out, precision, out=out)
+
+
+def _convert_from(from_unit: str, values, to_unit: str, precision: int, out):
+    to_index = UNIT_INDEX.get(to_unit.lower())
+    if to_index is None or to_unit.lower() == from_unit:
+        raise ValueError(f"Unsupported unit: {to_unit}")
+    return _apply(values, FACTOR_MATRIX[UNIT_INDEX[from_unit]][to_index], precision, out)
+
+
+def convert(values, from_unit: str, to_unit: str, precision: int = 4, out=None):
+    """
+    Converts every value of an array from one weight unit to another.
+
+    Each element of the result is identical to what `weight.registry.convert` returns for it.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param from_unit: The source weight unit (e.g., 'lal', 'tola', 'chatak', 'pau', 'dharni', 'sher', 'kg', 'g', 'lb', 'oz').
+    :type from_unit: str
+    :param to_unit: The target weight unit, from the same list.
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param out: A float64 array of the same shape as `values` to write the result into.
+    :type out: numpy.ndarray, optional
+    :return: The converted values (`out`, when given).
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If any value is negative or not a number.
+        - If `precision` is negative.
+        - If either `from_unit` or `to_unit` is not a recognized weight unit.
+        - If `out` is not a writeable float64 array of the right shape.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        import numpy as np
+        from rupantaran.weight import batch
+        ticks = np.array([1.5, 2.0, 10.25])
+        grams = np.empty_like(ticks)
+        batch.convert(ticks, from_unit = "tola", to_unit = "g", precision = 2, out = grams)
+        print(grams)
+    """
+    return _apply(values, get_factor(from_unit, to_unit), precision, out)
+
+
+def from_lal(values, to_unit: str, precision: int = 4, out=None):
+    """
+    Converts an array of values from lal to another weight unit. See `convert`.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param to_unit: The target weight unit (e.g., 'tola', 'chatak', 'pau', 'dharni', 'sher', 'kg', 'g', 'lb', 'oz').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param out: A float64 array of the same shape as `values` to write the result into.
+    :type out: numpy.ndarray, optional
+    :return: The converted values (`out`, when given).
+    :rtype: numpy.ndarray
+    """
+    return _convert_from("lal", values, to_unit, precision, out)
+
+
+def from_tola(values, to_unit: str, precision: int = 4, out=None):
+    """
+    Converts an array of values from tola to another weight unit. See `convert`.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param to_unit: The target weight unit (e.g., 'lal', 'chatak', 'pau', 'dharni', 'sher', 'kg', 'g', 'lb', 'oz').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param out: A float64 array of the same shape as `values` to write the result into.
+    :type out: numpy.ndarray, optional
+    :return: The converted values (`out`, when given).
+    :rtype: numpy.ndarray
+    """
+    return _convert_from("tola", values, to_unit, precision, out)
+
+
+def from_chatak(values, to_unit: str, precision: int = 4, out=None):
+    """
+    Converts an array of values from chatak to another weight unit. See `convert`.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param to_unit: The target weight unit (e.g., 'lal', 'tola', 'pau', 'dharni', 'sher', 'kg', 'g', 'lb', 'oz').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param out: A float64 array of the same shape as `values` to write the result into.
+    :type out: numpy.ndarray, optional
+    :return: The converted values (`out`, when given).
+    :rtype: numpy.ndarray
+    """
+    return _convert_from("chatak", values, to_unit, precision, out)
+
+
+def from_pau(values, to_unit: str, precision: int = 4, out=None):
+    """
+    Converts an array of values from pau to another weight unit. See `convert`.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param to_unit: The target weight unit (e.g., 'lal', 'tola', 'chatak', 'dharni', 'sher', 'kg', 'g', 'lb', 'oz').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param out: A float64 array of the same shape as `values` to write the result into.
+    :type out: numpy.ndarray, optional
+    :return: The converted values (`out`, when given).
+    :rtype: numpy.ndarray
+    """
+    return _convert_from("pau", values, to_unit, precision, out)
+
+
+def from_dharni(values, to_unit: str, precision: int = 4, out=None):
+    """
+    Converts an array of values from dharni to another weight unit. See `convert`.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param to_unit: The target weight unit (e.g., 'lal', 'tola', 'chatak', 'pau', 'sher', 'kg', 'g', 'lb', 'oz').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param out: A float64 array of the same shape as `values` to write the result into.
+    :type out: numpy.ndarray, optional
+    :return: The converted values (`out`, when given).
+    :rtype: numpy.ndarray
+    """
+    return _convert_from("dharni", values, to_unit, precision, out)
+
+
+def from_sher(values, to_unit: str, precision: int = 4, out=None):
+    """
+    Converts an array of values from sher to another weight unit. See `convert`.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param to_unit: The target weight unit (e.g., 'lal', 'tola', 'chatak', 'pau', 'dharni', 'kg', 'g', 'lb', 'oz').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param out: A float64 array of the same shape as `values` to write the result into.
+    :type out: numpy.ndarray, optional
+    :return: The converted values (`out`, when given).
+    :rtype: numpy.ndarray
+    """
+    return _convert_from("sher", values, to_unit, precision, out)
+
+
+def from_kg(values, to_unit: str, precision: int = 4, out=None):
+    """
+    Converts an array of values from kilograms to another weight unit. See `convert`.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param to_unit: The target weight unit (e.g., 'lal', 'tola', 'chatak', 'pau', 'dharni', 'sher', 'g', 'lb', 'oz').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param out: A float64 array of the same shape as `values` to write the result into.
+    :type out: numpy.ndarray, optional
+    :return: The converted values (`out`, when given).
+    :rtype: numpy.ndarray
+    """
+    return _convert_from("kg", values, to_unit, precision, out)
+
+
+def from_g(values, to_unit: str, precision: int = 4, out=None):
+    """
+    Converts an array of values from grams to another weight unit. See `convert`.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param to_unit: The target weight unit (e.g., 'lal', 'tola', 'chatak', 'pau', 'dharni', 'sher', 'kg', 'lb', 'oz').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param out: A float64 array of the same shape as `values` to write the result into.
+    :type out: numpy.ndarray, optional
+    :return: The converted values (`out`, when given).
+    :rtype: numpy.ndarray
+    """
+    return _convert_from("g", values, to_unit, precision, out)
+
+
+def from_lb(values, to_unit: str, precision: int = 4, out=None):
+    """
+    Converts an array of values from pounds to another weight unit. See `convert`.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param to_unit: The target weight unit (e.g., 'lal', 'tola', 'chatak', 'pau', 'dharni', 'sher', 'kg', 'g', 'oz').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param out: A float64 array of the same shape as `values` to write the result into.
+    :type out: numpy.ndarray, optional
+    :return: The converted values (`out`, when given).
+    :rtype: numpy.ndarray
+    """
+    return _convert_from("lb", values, to_unit, precision, out)
+
+
+def from_oz(values, to_unit: str, precision: int = 4, out=None):
+    """
+    Converts an array of values from ounces to another weight unit. See `convert`.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param to_unit: The target weight unit (e.g., 'lal', 'tola', 'chatak', 'pau', 'dharni', 'sher', 'kg', 'g', 'lb').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param out: A float64 array of the same shape as `values` to write the result into.
+    :type out: numpy.ndarray, optional
+    :return: The converted values (`out`, when given).
+    :rtype: numpy.ndarray
+    """
+    return _convert_from("oz", values, to_unit, precision, out)
+
+
+def parse_weight_mixed_unit(expressions):
+    """
+    Parses a sequence of mixed weight expressions into an array of grams.
+
+    Each expression goes through the cached parser of
+    :func:`rupantaran.weight.mixed_units.parse_weight_mixed_unit`, so repeated strings are
+    parsed once.
+
+    :param expressions: The expressions to parse (e.g., ['2 sher 3 pau', '1 tola 40 lal']).
+    :type expressions: iterable of str
+    :return: The equivalent weights in grams.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If any expression cannot be parsed (see `MixedUnitParseError`).
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.weight import batch
+        result = batch.parse_weight_mixed_unit(expressions = ["2 sher 3 pau", "1 tola 40 lal"])
+        print(result)
+    """
+    return np.fromiter(map(_parse_weight, expressions), dtype=np.float64)
+
+
+def grams_to_weight_mixed(values, precision: int = 4, as_strings: bool = False):
+    """
+    Splits an array of weights in grams into dharni, sher, pau, chatak, tola and lal.
+
+    By default the per-unit components are returned as arrays. Strings identical to those of
+    :func:`rupantaran.weight.mixed_units.grams_to_weight_mixed` are built only when `as_strings`
+    is true.
+
+    :param values: The weights in grams (all must be non-negative).
+    :type values: array-like
+    :param precision: Number of decimal places for lal rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :param as_strings: Return formatted mixed-unit expressions instead of component arrays.
+    :type as_strings: bool, optional
+    :return: A dict with int64 arrays for 'dharni', 'sher', 'pau', 'chatak' and 'tola' and a
+        float64 array for 'lal', or a list of strings when `as_strings` is true.
+    :rtype: dict or list
+
+    :raises ValueError:
+        - If `values` does not hold numbers or any weight is negative, infinite or NaN.
+        - If any weight has more whole units of the largest unit than an int64 holds.
+        - If `precision` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.weight import batch
+        parts = batch.grams_to_weight_mixed(values = [2250, 16.324], precision = 2)
+        print(parts["sher"], parts["tola"], parts["lal"])
+    """
+    arr = as_value_array(values)
+    check_precision(precision)
+    components = decompose_units(arr, _UNIT_GRAMS, precision, _TOLERANCE, "value")
+    if as_strings:
+        return format_mixed_units(components, precision)
+    return components
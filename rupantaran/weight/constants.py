@@ -1,124 +1,47 @@
 
 # https://docs.google.com/spreadsheets/d/1Y_XrdH4gqVXVI-ek8ZDeLZxoGFjHQYAhC8UeeU8hT5w/edit?usp=sharing
 
-LAL_TO = {
-    "tola": 0.01 , 
-    "chatak": 0.001999657006 , 
-    "pau": 0.0005859296482 ,  
-    "dharni": 0.00004882747068 , 
-    "sher": 0.000146482412 , 
-    "kg": 0.0001166, 
-    "g": 0.1166 , 
-    "lb": 0.0002570592074 , 
-    "oz": 0.004112947318 
+# Grams in one of each weight unit. Every conversion factor is derived from this table, so all
+# pairs of units agree with each other. The chatak is listed as 58.31 g, which is about 5 tola
+# (5.0009), not exactly.
+GRAMS_PER_UNIT = {
+    "lal": 0.1166,
+    "tola": 11.66,
+    "chatak": 58.31,
+    "pau": 199.0,
+    "dharni": 2388.0,
+    "sher": 796.0,
+    "kg": 1000.0,
+    "g": 1.0,
+    "lb": 453.59237,
+    "oz": 28.349523125,
 }
 
-TOLA_TO = {
-    "lal": 100,
-    "chatak": 0.1999657006,
-    "pau": 0.05859296482,
-    "dharni": 0.004882747068,
-    "sher": 0.0146482412,
-    "kg": 0.01166,
-    "g": 11.66,
-    "lb": 0.02570592074,
-    "oz": 0.4112947318
-}
-
-
-CHATAK_TO = {
-    "lal": 450,
-    "pau": 0.2930150754,
-    "dharni": 0.02439748954,
-    "tola": 4.5,
-    "sher": 0.07325376885,
-    "kg": 0.05831,
-    "g": 58.31,
-    "lb": 0.1285516499,
-    "oz": 2.05682639905
-}
-
-PAU_TO = {
-    "lal": 1706.69,
-    "chatak": 3.412793689,
-    "dharni": 0.08333333333,
-    "tola": 17.1551724138,
-    "sher": 0.25,
-    "kg": 0.199,
-    "g": 199,
-    "lb": 0.4387202596,
-    "oz": 7.0195241540,    
-}
-
-DHARNI_TO = {
-    "lal": 20480.28,
-    "chatak": 40.95352427,
-    "pau": 12,
-    "tola": 205.862069,
-    "sher": 3,
-    "kg": 2.388,
-    "g": 2390,
-    "lb": 5.269052364,
-    "oz": 84.30483783,    
-}
-
-SHER_TO = {
-    "lal": 6826.76,
-    "chatak": 13.65117476,
-    "pau": 4,
-    "tola": 68.62068966,
-    "dharni": 0.3333333333,
-    "kg": 0.796,
-    "g": 796,
-    "lb": 1.754881039,
-    "oz": 28.07809662,    
-}   
-
-KG_TO = {
-    "lal": 8576.33,
-    "chatak": 17.14971703 ,
-    "pau": 5.025125628,
-    "dharni": 0.4184100418,
-    "tola": 85.76329331,
-    "sher": 1.256281407,
-    "g": 1000,
-    "lb": 2.20462442,
-    "oz": 35.2739907229,    
-}
-
-G_TO = {
-    "lal": 8.576329331,
-    "chatak": 0.01714971703,
-    "pau": 0.005025125628,
-    "dharni": 0.0004184100418,
-    "tola": 0.08576329331,
-    "sher": 0.001256281407,
-    "kg": 0.001,
-    "lb": 0.00220462442,
-    "oz": 0.0352739907229,    
-}   
-
-LB_TO = {
-    "lal": 3890.15,
-    "chatak": 7.778990044,
-    "pau": 2.279356784,
-    "dharni": 0.1897874477,
-    "tola": 38.90162174,
-    "sher": 0.569839196,
-    "kg": 0.453592,
-    "g": 453.592,
-    "oz": 16,    
-}   
-
-
-OZ_TO = {
-    "lal": 243.1346484,
-    "chatak": 0.4861857751,
-    "pau": 0.142459799,
-    "dharni": 0.01186171548,
-    "tola": 2.431345844,
-    "sher": 0.03561494975,
-    "kg": 0.0283495,
-    "g": 28.3495,
-    "lb": 0.0625,
-}   
+# Exact ratios between units, independent of the table above: (larger unit, smaller unit, number
+# of smaller units in one larger unit). `registry.check_consistency` checks the table against them.
+UNIT_RATIOS = (
+    ("tola", "lal", 100),
+    ("sher", "pau", 4),
+    ("dharni", "sher", 3),
+    ("dharni", "pau", 12),
+    ("kg", "g", 1000),
+    ("lb", "oz", 16),
+)
+
+
+def _factors_from(unit: str) -> dict:
+    grams = GRAMS_PER_UNIT[unit]
+    return {other: grams / other_grams for other, other_grams in GRAMS_PER_UNIT.items() if other != unit}
+
+
+# Factors from one unit to every other unit (the unit itself is not included)
+LAL_TO = _factors_from("lal")
+TOLA_TO = _factors_from("tola")
+CHATAK_TO = _factors_from("chatak")
+PAU_TO = _factors_from("pau")
+DHARNI_TO = _factors_from("dharni")
+SHER_TO = _factors_from("sher")
+KG_TO = _factors_from("kg")
+G_TO = _factors_from("g")
+LB_TO = _factors_from("lb")
+OZ_TO = _factors_from("oz")
@@ -0,0 +1,188 @@
+"""
+mixed_units.py
+
+This module provides functions for parsing mixed weight expressions (e.g., '2 sher 3 pau 1 chatak'
+or '1 tola 40 lal') into grams and for splitting grams back into traditional units. Expressions
+use the same tokenizer as the land mixed-unit parsers and look their units up in one precomputed
+grams table, so parsing costs little beyond splitting the string.
+
+Any weight unit may appear in an expression ('1 kg 200 g' works too); grams are split into the
+traditional units only.
+
+Functions:
+- `parse_weight_mixed_unit`: Parses a mixed weight expression into grams.
+- `grams_to_weight_mixed`: Converts grams to a dharni/sher/pau/chatak/tola/lal expression.
+- `weight_mixed_to_unit`: Converts a mixed weight expression to a single weight unit.
+- `parse_cache_info`: Returns the hit/miss/eviction counters of the parse cache.
+- `clear_parse_cache`: Empties the parse cache.
+- `set_parse_cache_size`: Sets the size bound of the parse cache (0 disables it).
+
+Constants:
+- `MIXED_UNITS`: The units used by `grams_to_weight_mixed`, largest first.
+"""
+
+import math
+
+from .._cache import LRUCache
+from .._parsing import MixedUnitParseError, sum_pairs
+from .constants import GRAMS_PER_UNIT
+from .registry import get_factor
+
+MIXED_UNITS = ("dharni", "sher", "pau", "chatak", "tola", "lal")
+
+# (unit, grams) pairs of the traditional units, largest first
+_UNIT_GRAMS = [(unit, GRAMS_PER_UNIT[unit]) for unit in MIXED_UNITS]
+
+# A remainder this close (as a fraction of a unit) to the next whole unit counts as that unit, so
+# grams parsed from '1 chatak' do not come back as '0 chatak 4 tola 99.99 lal' after the float
+# error of the chained subtractions.
+_TOLERANCE = 1e-9
+
+
+def _parse(expression: str) -> float:
+    return sum_pairs(expression, GRAMS_PER_UNIT, "Weight")
+
+
+# Parsed expressions keyed on the lowercased expression. Ledgers repeat the same few strings
+# heavily, so most parses are served from here.
+_PARSE_CACHE = LRUCache(_parse, maxsize=4096)
+
+
+def parse_cache_info():
+    """
+    Returns the hit, miss and eviction counters of the weight expression parse cache.
+
+    :return: A named tuple with fields `hits`, `misses`, `evictions`, `maxsize` and `currsize`.
+    :rtype: CacheInfo
+    """
+    return _PARSE_CACHE.info()
+
+
+def clear_parse_cache() -> None:
+    """
+    Empties the weight expression parse cache and resets its counters.
+    """
+    _PARSE_CACHE.clear()
+
+
+def set_parse_cache_size(maxsize: int) -> None:
+    """
+    Sets how many parsed expressions are kept. The default is 4096; 0 disables the cache.
+    Changing the size empties the cache.
+
+    :param maxsize: Maximum number of cached expressions (must be a non-negative integer).
+    :type maxsize: int
+
+    :raises ValueError:
+        - If `maxsize` is negative or not an integer.
+    """
+    _PARSE_CACHE.resize(maxsize)
+
+
+def parse_weight_mixed_unit(expression: str) -> float:
+    """
+    Parses a mixed weight expression into total grams.
+
+    Pairs may be separated by spaces or commas, and a value may be glued to its unit
+    (e.g., '2sher, 3pau').
+
+    :param expression: A string of (value, unit) pairs (e.g., '2 sher 3 pau 1 chatak', '1 tola 40 lal').
+    :type expression: str
+    :return: The equivalent weight in grams.
+    :rtype: float
+
+    :raises MixedUnitParseError: A ``ValueError`` whose `position` attribute points at the problem:
+        - If the input string format is incorrect.
+        - If an unsupported unit is encountered.
+        - If any value in the expression is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.weight import mixed_units
+        result = mixed_units.parse_weight_mixed_unit(expression = "2 sher 3 pau 1 chatak")
+        print(result)
+    """
+    try:
+        return _PARSE_CACHE.call(expression.lower())
+    except MixedUnitParseError:
+        # Errors are not cached. Parse the caller's text again so that the error shows it, not
+        # the lowercased key.
+        _parse(expression)
+        raise
+
+
+def grams_to_weight_mixed(grams: float, precision: int = 4) -> str:
+    """
+    Converts a weight in grams to a mixed expression of dharni, sher, pau, chatak, tola and lal.
+
+    :param grams: The weight in grams (must be non-negative).
+    :type grams: float
+    :param precision: Number of decimal places for lal rounding (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: The equivalent mixed-unit expression.
+    :rtype: str
+
+    :raises ValueError:
+        - If `grams` is negative, infinite, NaN or not a number.
+        - If `precision` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.weight import mixed_units
+        result = mixed_units.grams_to_weight_mixed(grams = 2250, precision = 2)
+        print(result)
+    """
+    if not isinstance(grams, (int, float)):
+        raise ValueError("Input value must be a number.")
+    if not math.isfinite(grams):
+        raise ValueError("Input value must be finite.")
+    if grams < 0:
+        raise ValueError("Input value must be non-negative.")
+    if precision < 0:
+        raise ValueError("Precision must be non-negative.")
+
+    parts = []
+    remainder = grams
+    for unit, unit_grams in _UNIT_GRAMS[:-1]:
+        count = math.floor(remainder / unit_grams + _TOLERANCE)
+        remainder = max(remainder - count * unit_grams, 0.0)
+        parts.append(f"{count} {unit}")
+    last_unit, last_grams = _UNIT_GRAMS[-1]
+    parts.append(f"{round(remainder / last_grams, precision):.{precision}f} {last_unit}")
+    return " ".join(parts)
+
+
+def weight_mixed_to_unit(expression: str, to_unit: str, precision: int = 4) -> float:
+    """
+    Converts a mixed weight expression to a single weight unit.
+
+    :param expression: A string of (value, unit) pairs (e.g., '2 sher 3 pau').
+    :type expression: str
+    :param to_unit: The target weight unit (e.g., 'kg', 'sher', 'tola').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: The equivalent weight in the target unit.
+    :rtype: float
+
+    :raises ValueError:
+        - If the input string format is incorrect.
+        - If `to_unit` is not a recognized weight unit.
+        - If `precision` is negative.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.weight import mixed_units
+        result = mixed_units.weight_mixed_to_unit(expression = "2 sher 3 pau", to_unit = "kg", precision = 3)
+        print(result)
+    """
+    if precision < 0:
+        raise ValueError("Precision must be non-negative.")
+    factor = get_factor("g", to_unit)
+    return round(parse_weight_mixed_unit(expression) * factor, precision)
@@ -0,0 +1,166 @@
+"""
+registry.py
+
+This module provides a registry of every weight unit with a dense matrix of conversion factors
+between all pairs, computed once at import from the single grams-per-unit table
+`GRAMS_PER_UNIT`. Since every factor comes from the same table, the factors of all pairs agree
+with each other, and a conversion is one indexed multiply.
+
+Functions:
+- `get_factor`: Returns the factor that converts a value in one weight unit to another.
+- `convert`: Converts a value from one weight unit to another.
+- `convert_array`: Converts a whole array of values from one weight unit to another.
+- `check_consistency`: Lists the documented unit ratios that the factors do not match.
+
+Constants:
+- `WEIGHT_UNITS`: Tuple of all weight unit names.
+- `UNIT_INDEX`: Dictionary mapping each weight unit name to its row/column in `FACTOR_MATRIX`.
+- `FACTOR_MATRIX`: Tuple of rows; ``FACTOR_MATRIX[i][j]`` converts unit ``i`` to unit ``j``.
+"""
+
+from .constants import GRAMS_PER_UNIT, UNIT_RATIOS
+
+WEIGHT_UNITS = tuple(GRAMS_PER_UNIT)
+
+UNIT_INDEX = {unit: i for i, unit in enumerate(WEIGHT_UNITS)}
+
+
+def _build_factor_matrix() -> tuple:
+    return tuple(
+        tuple(1.0 if from_unit == to_unit else GRAMS_PER_UNIT[from_unit] / GRAMS_PER_UNIT[to_unit]
+              for to_unit in WEIGHT_UNITS)
+        for from_unit in WEIGHT_UNITS
+    )
+
+
+FACTOR_MATRIX = _build_factor_matrix()
+
+
+def _index(unit: str) -> int:
+    index = UNIT_INDEX.get(unit.lower())
+    if index is None:
+        raise ValueError(f"Unsupported weight unit: {unit}")
+    return index
+
+
+def get_factor(from_unit: str, to_unit: str) -> float:
+    """
+    Returns the factor that converts a value in `from_unit` to `to_unit`.
+
+    :param from_unit: The source weight unit (e.g., 'tola', 'sher', 'kg').
+    :type from_unit: str
+    :param to_unit: The target weight unit (e.g., 'g', 'pau', 'lb').
+    :type to_unit: str
+    :return: The multiplication factor.
+    :rtype: float
+
+    :raises ValueError:
+        - If either `from_unit` or `to_unit` is not a recognized weight unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.weight import registry
+        print(registry.get_factor(from_unit = "dharni", to_unit = "kg"))
+    """
+    return FACTOR_MATRIX[_index(from_unit)][_index(to_unit)]
+
+
+def convert(value: float, from_unit: str, to_unit: str, precision: int = 4) -> float:
+    """
+    Converts a value from one weight unit to another.
+
+    :param value: The numeric amount to convert (must be non-negative).
+    :type value: float
+    :param from_unit: The source weight unit (e.g., 'lal', 'tola', 'chatak', 'pau', 'dharni', 'sher', 'kg', 'g', 'lb', 'oz').
+    :type from_unit: str
+    :param to_unit: The target weight unit, from the same list.
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: Equivalent weight in the target unit, rounded to the specified precision.
+    :rtype: float
+
+    :raises ValueError:
+        - If `value` is negative or not a number.
+        - If `precision` is negative.
+        - If either `from_unit` or `to_unit` is not a recognized weight unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.weight import convert
+        result = convert(value = 2, from_unit = "sher", to_unit = "kg", precision = 3)
+        print(result)
+    """
+    if not isinstance(value, (int, float)):
+        raise ValueError("Input value must be a number.")
+    if value < 0:
+        raise ValueError("Input value must be non-negative.")
+    if precision < 0:
+        raise ValueError("Precision must be non-negative.")
+    return round(value * FACTOR_MATRIX[_index(from_unit)][_index(to_unit)], precision)
+
+
+def convert_array(values, from_unit: str, to_unit: str, precision: int = 4):
+    """
+    Converts every value of an array from one weight unit to another.
+
+    All elements are validated at once, multiplied by one factor and rounded exactly like
+    `convert` rounds a single value. Requires NumPy. `batch.convert` does the same and can also
+    write into a preallocated array.
+
+    :param values: A NumPy array, list, tuple or buffer-protocol object of non-negative numbers.
+    :param from_unit: The source weight unit (e.g., 'tola', 'sher', 'kg').
+    :type from_unit: str
+    :param to_unit: The target weight unit (e.g., 'g', 'pau', 'lb').
+    :type to_unit: str
+    :param precision: Number of decimal places to round to (must be non-negative). Default is 4.
+    :type precision: int, optional
+    :return: A float64 array of converted values, of the same shape as `values`.
+    :rtype: numpy.ndarray
+
+    :raises ValueError:
+        - If any value is negative or not a number.
+        - If `precision` is negative.
+        - If either `from_unit` or `to_unit` is not a recognized weight unit.
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.weight import registry
+        grams = registry.convert_array([1, 2.5, 10], from_unit = "tola", to_unit = "g", precision = 2)
+        print(grams)
+    """
+    from .batch import convert as convert_batch
+
+    return convert_batch(values, from_unit, to_unit, precision)
+
+
+def check_consistency(rel_tol: float = 1e-9) -> list:
+    """
+    Checks the factors against the exact unit ratios of `UNIT_RATIOS` (e.g., 1 tola = 100 lal,
+    1 dharni = 3 sher), which are written down independently of the grams-per-unit table.
+
+    :param rel_tol: Allowed relative difference. Default is 1e-9.
+    :type rel_tol: float, optional
+    :return: A description of every ratio that the factors do not match; empty when the table
+        agrees with all of them.
+    :rtype: list[str]
+
+    .. code-block:: python
+        :caption: Example
+        :class: copy-button
+
+        from rupantaran.weight import registry
+        assert registry.check_consistency() == []
+    """
+    problems = []
+    for larger, smaller, ratio in UNIT_RATIOS:
+        factor = FACTOR_MATRIX[UNIT_INDEX[larger]][UNIT_INDEX[smaller]]
+        if abs(factor - ratio) > rel_tol * ratio:
+            problems.append(f"1 {larger} is {factor} {smaller}, expected {ratio}")
+    return problems
@@ -1,31 +1,20 @@
-from functools import wraps
-from typing import Callable
-from .constants import (LAL_TO, TOLA_TO, CHATAK_TO, PAU_TO, DHARNI_TO, 
-                       SHER_TO, KG_TO, G_TO, LB_TO, OZ_TO)
-
-def weight_converter(conversion_map: dict) -> Callable:
-    """Decorator that creates a weight conversion function using the provided conversion map."""
-    def decorator(func: Callable) -> Callable:
-        # @wraps(func) keeps the function's original name and docstring intact.
-        @wraps(func)
-        def wrapper(value: float, to_unit: str, precision: int = 4) -> float:
-            if not isinstance(value, (int, float)):
-                raise ValueError("Input value must be a number.")
-            if value < 0:
-                raise ValueError("Input value must be non-negative.")
-            if precision < 0:
-                raise ValueError("Precision must be non-negative.")
-            
-            to_unit_lower = to_unit.lower()
-            if to_unit_lower not in conversion_map:
-                raise ValueError(f"Unsupported unit: {to_unit}")
-            
-            result = value * conversion_map[to_unit_lower]
-            return round(result, precision)
-        return wrapper
-    return decorator
-
-@weight_converter(LAL_TO)
+from .registry import FACTOR_MATRIX, UNIT_INDEX
+
+
+def _convert_from(from_unit: str, value: float, to_unit: str, precision: int) -> float:
+    """Converts `value` from `from_unit` to any other weight unit with one factor lookup."""
+    if not isinstance(value, (int, float)):
+        raise ValueError("Input value must be a number.")
+    if value < 0:
+        raise ValueError("Input value must be non-negative.")
+    if precision < 0:
+        raise ValueError("Precision must be non-negative.")
+
+    to_index = UNIT_INDEX.get(to_unit.lower())
+    if to_index is None or to_unit.lower() == from_unit:
+        raise ValueError(f"Unsupported unit: {to_unit}")
+    return round(value * FACTOR_MATRIX[UNIT_INDEX[from_unit]][to_index], precision)
+
 def from_lal(value: float, to_unit: str, precision: int = 4) -> float:
     """
     Converts a value from lal to other weight units.
@@ -52,9 +41,8 @@ def from_lal(value: float, to_unit: str, precision: int = 4) -> float:
         result = from_lal(value=5, to_unit="tola", precision=2)
         print(result)
     """
-    pass
+    return _convert_from("lal", value, to_unit, precision)
 
-@weight_converter(TOLA_TO)
 def from_tola(value: float, to_unit: str, precision: int = 4) -> float:
     """
     Converts a value from tola to other weight units.
@@ -81,9 +69,8 @@ def from_tola(value: float, to_unit: str, precision: int = 4) -> float:
         result = from_tola(value=5, to_unit="kg", precision=2)
         print(result)
     """
-    pass
+    return _convert_from("tola", value, to_unit, precision)
 
-@weight_converter(CHATAK_TO)
 def from_chatak(value: float, to_unit: str, precision: int = 4) -> float:
     """
     Converts a value from chatak to other weight units.
@@ -110,9 +97,8 @@ def from_chatak(value: float, to_unit: str, precision: int = 4) -> float:
         result = from_chatak(value=5, to_unit="kg", precision=2)
         print(result)
     """
-    pass
+    return _convert_from("chatak", value, to_unit, precision)
 
-@weight_converter(PAU_TO)
 def from_pau(value: float, to_unit: str, precision: int = 4) -> float:
     """
     Converts a value from pau to other weight units.
@@ -139,9 +125,8 @@ def from_pau(value: float, to_unit: str, precision: int = 4) -> float:
         result = from_pau(value=5, to_unit="kg", precision=2)
         print(result)
     """
-    pass
+    return _convert_from("pau", value, to_unit, precision)
 
-@weight_converter(DHARNI_TO)
 def from_dharni(value: float, to_unit: str, precision: int = 4) -> float:
     """
     Converts a value from dharni to other weight units.
@@ -168,9 +153,8 @@ def from_dharni(value: float, to_unit: str, precision: int = 4) -> float:
         result = from_dharni(value=5, to_unit="kg", precision=2)
         print(result)
     """
-    pass
+    return _convert_from("dharni", value, to_unit, precision)
 
-@weight_converter(SHER_TO)
 def from_sher(value: float, to_unit: str, precision: int = 4) -> float:
     """
     Converts a value from sher to other weight units.
@@ -197,9 +181,8 @@ def from_sher(value: float, to_unit: str, precision: int = 4) -> float:
         result = from_sher(value=5, to_unit="kg", precision=2)
         print(result)
     """
-    pass
+    return _convert_from("sher", value, to_unit, precision)
 
-@weight_converter(KG_TO)
 def from_kg(value: float, to_unit: str, precision: int = 4) -> float:
     """
     Converts a value from kilograms to other weight units.
@@ -226,9 +209,8 @@ def from_kg(value: float, to_unit: str, precision: int = 4) -> float:
         result = from_kg(value=5, to_unit="lb", precision=2)
         print(result)
     """
-    pass
+    return _convert_from("kg", value, to_unit, precision)
 
-@weight_converter(G_TO)
 def from_g(value: float, to_unit: str, precision: int = 4) -> float:
     """
     Converts a value from grams to other weight units.
@@ -255,9 +237,8 @@ def from_g(value: float, to_unit: str, precision: int = 4) -> float:
         result = from_g(value=5, to_unit="lb", precision=2)
         print(result)
     """
-    pass
+    return _convert_from("g", value, to_unit, precision)
 
-@weight_converter(LB_TO)
 def from_lb(value: float, to_unit: str, precision: int = 4) -> float:
     """
     Converts a value from pounds to other weight units.
@@ -281,12 +262,11 @@ def from_lb(value: float, to_unit: str, precision: int = 4) -> float:
         :class: copy-button
 
         from rupantaran.weight import from_lb
-        result = from_lb(value=5, to_unit="lb", precision=2)
+        result = from_lb(value=5, to_unit="kg", precision=2)
         print(result)
     """
-    pass
+    return _convert_from("lb", value, to_unit, precision)
 
-@weight_converter(OZ_TO)
 def from_oz(value: float, to_unit: str, precision: int = 4) -> float:
     """
     Converts a value from ounces to other weight units.
@@ -313,4 +293,4 @@ def from_oz(value: float, to_unit: str, precision: int = 4) -> float:
         result = from_oz(value=5, to_unit="lb", precision=2)
         print(result)
     """
-    pass
+    return _convert_from("oz", value, to_unit, precision)
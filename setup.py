@@ -8,6 +8,13 @@ setup(
     name="rupantaran",
     version="0.2.7",
     packages=find_packages(),
+    extras_require={
+        "numpy": ["numpy"],
+        "pandas": ["numpy", "pandas"],
+    },
+    entry_points={
+        "console_scripts": ["rupantaran = rupantaran.cli:main"],
+    },
     license="MIT",
     description="Rupantaran converts Nepali-specific measurements into SI or metric units.",
     long_description=long_description,  # Adds README content